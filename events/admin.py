@@ -1,12 +1,22 @@
 """Admin module for events app."""
+from typing import Any
+
 from django.contrib import admin
+from django.core.exceptions import PermissionDenied, ValidationError
 from django.core.handlers.wsgi import WSGIRequest
 from django.db.models import QuerySet
+from django.http import FileResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.translation import gettext_lazy as _
 from import_export import resources
 from import_export.admin import ImportExportActionModelAdmin
 from import_export.fields import Field
+from import_export.formats.base_formats import CSV, XLSX
+from import_export.results import Result, RowResult
 from leaflet.admin import LeafletGeoAdminMixin
+from tablib import Dataset
 
+from . import exports, imports
 from .forms import AttendeeAdminForm
 from .models import Attendee, Event, Session, Tag
 
@@ -23,9 +33,87 @@ class AttendeeResource(resources.ModelResource):
             "user__email",
             "user__full_name",
             "events__title",
+            "events__slug",
             "has_attended",
         )
 
+    def import_data_inner(
+        self: "AttendeeResource",
+        dataset: Dataset,
+        dry_run: bool,
+        raise_errors: bool,
+        using_transactions: bool,
+        collect_failed_rows: bool,
+        **kwargs: Any,
+    ) -> Result:
+        """Validate the whole file at once and save the attendees in bulk.
+
+        The rows are not imported one by one, the users, the events and
+        the existing attendees are read for the whole file and the
+        attendees are only saved when every row is valid. The rows of
+        existing attendees update their ``has_attended``, the new attendees
+        can't take more seats than the events have left.
+
+        Args:
+            dataset: The imported rows.
+            dry_run: Whether the attendees are only validated.
+            raise_errors: Whether the first invalid row raises.
+            using_transactions: Whether the import runs in a transaction.
+            collect_failed_rows: Whether the failed rows are collected.
+            kwargs: The other options of the import.
+
+        Returns:
+            The result of the import.
+
+        Raises:
+            ValidationError: If a row is invalid and ``raise_errors`` is set.
+        """
+        result = self.get_result_class()()
+        result.diff_headers = self.get_diff_headers()
+        result.total_rows = len(dataset)
+
+        if collect_failed_rows:
+            result.add_dataset_headers(dataset.headers)
+
+        rows = list(dataset.dict)
+        attendees, errors = imports.validate_attendees(rows)
+        columns = [field.column_name for field in self.get_export_fields()]
+
+        for number, row in enumerate(rows, 1):
+            row_result = self.get_row_result_class()()
+
+            if number in errors:
+                row_result.import_type = RowResult.IMPORT_TYPE_INVALID
+                row_result.validation_error = errors[number]
+                result.append_invalid_row(number, row, errors[number])
+                if collect_failed_rows:
+                    result.append_failed_row(row, errors[number])
+
+            else:
+                row_result.import_type = (
+                    RowResult.IMPORT_TYPE_NEW
+                    if attendees[number].pk is None
+                    else RowResult.IMPORT_TYPE_UPDATE
+                )
+                row_result.diff = [row.get(column, "") for column in columns]
+
+            result.increment_row_result_total(row_result)
+            result.append_row_result(row_result)
+
+        if errors and raise_errors:
+            raise ValidationError(errors[min(errors)])
+
+        if attendees and not errors and not dry_run:
+            try:
+                imports.insert_attendees(list(attendees.values()))
+
+            except ValidationError as error:
+                if raise_errors:
+                    raise error
+                result.append_base_error(self.get_error_result_class()(error))
+
+        return result
+
 
 class EventResource(resources.ModelResource):
     """ModelResource is Resource subclass for handling Django models."""
@@ -82,61 +170,115 @@ class EventResource(resources.ModelResource):
 
     def dehydrate_total_attendees(self: "EventResource", event: Event) -> int:
         """Computing method to get total attendees."""
-        return event.attendees.count()
+        return event.attendees_count
 
     def dehydrate_available_place(self: "EventResource", event: Event) -> int:
         """Computing method to get total available place."""
-        return event.total_guest - event.attendees.count()
+        return event.total_guest - event.attendees_count
 
     def dehydrate_total_attended(self: "EventResource", event: Event) -> int:
         """Computing method to get total attended."""
-        return event.attendees.filter(has_attended=True).count()
+        return event.attended_count
 
     def dehydrate_total_not_attended(self: "EventResource", event: Event) -> int:
         """Computing method to get total not attended."""
-        return event.attendees.filter(has_attended=False).count()
+        return event.not_attended_count
 
     def dehydrate_total_sessions(self: "EventResource", event: Event) -> int:
         """Computing method to get total sessions."""
-        return event.sessions.count()
+        return event.sessions_count
 
     def dehydrate_total_draft_sessions(self: "EventResource", event: Event) -> int:
         """Computing method to get total draft sessions."""
-        return event.sessions.filter(status="Draft").count()
+        return event.draft_sessions_count
 
     def dehydrate_total_accepted_sessions(self: "EventResource", event: Event) -> int:
         """Computing method to get total accepted sessions."""
-        return event.sessions.filter(status="Accepted").count()
+        return event.accepted_sessions_count
 
     def dehydrate_total_denied_sessions(self: "EventResource", event: Event) -> int:
         """Computing method to get total denied sessions."""
-        return event.sessions.filter(status="Denied").count()
+        return event.denied_sessions_count
 
     def dehydrate_total_talk(self: "EventResource", event: Event) -> int:
         """Computing method to get total talk."""
-        return event.sessions.filter(session_type="Talk", status="Accepted").count()
+        return event.talk_count
 
     def dehydrate_total_lighting_talk(self: "EventResource", event: Event) -> int:
         """Computing method to get total lighting talk."""
-        return event.sessions.filter(
-            session_type="Lighting Talk", status="Accepted"
-        ).count()
+        return event.lighting_talk_count
 
     def dehydrate_total_workshop(self: "EventResource", event: Event) -> int:
         """Computing method to get total workshop."""
-        return event.sessions.filter(session_type="WorkShop", status="Accepted").count()
+        return event.workshop_count
+
+
+class StreamingExportMixin:
+    """Export csv and xlsx without building the whole file in memory.
+
+    The rows are read with ``iterator()`` and rendered one at a time, csv
+    is streamed to the client and xlsx is written to a temporary file.
+    The other formats use the default export of django-import-export.
+    """
+
+    actions = ["export_admin_action"]
+
+    def export_admin_action(
+        self: Any, request: WSGIRequest, queryset: QuerySet
+    ) -> HttpResponseBase:
+        """Exports the selected rows using file_format."""
+        export_format = request.POST.get("file_format")
+        if not export_format:
+            return super().export_admin_action(request, queryset)
+
+        file_format = self.get_export_formats()[int(export_format)]()
+        if not isinstance(file_format, (CSV, XLSX)):
+            return super().export_admin_action(request, queryset)
+
+        if not self.has_export_permission(request):
+            raise PermissionDenied
+
+        resource = self.get_export_resource_class()(
+            **self.get_export_resource_kwargs(request)
+        )
+        header = resource.get_export_headers()
+        rows = (
+            resource.export_resource(obj) for obj in resource.iter_queryset(queryset)
+        )
+        filename = self.get_export_filename(request, queryset, file_format)
+
+        if isinstance(file_format, XLSX):
+            return FileResponse(
+                exports.xlsx_file(header, rows),
+                as_attachment=True,
+                filename=filename,
+                content_type=file_format.get_content_type(),
+            )
+
+        response = StreamingHttpResponse(
+            exports.csv_lines(header, rows), content_type=exports.EXPORT_TYPES["csv"]
+        )
+        response["Content-Disposition"] = 'attachment; filename="%s"' % filename
+        return response
+
+    export_admin_action.short_description = _("Export selected %(verbose_name_plural)s")
 
 
 @admin.register(Attendee)
-class AttendeeAdmin(ImportExportActionModelAdmin):
+class AttendeeAdmin(StreamingExportMixin, ImportExportActionModelAdmin):
     """Configure the attendee model in admin page."""
 
     resource_class = AttendeeResource
 
+    # One log entry per imported row would undo the bulk import.
+    skip_admin_log = True
+
     form = AttendeeAdminForm
 
     date_hierarchy = "events__event_date"
 
+    list_select_related = ("user", "events")
+
     list_display = (
         "user",
         "get_email",
@@ -147,9 +289,9 @@ class AttendeeAdmin(ImportExportActionModelAdmin):
 
     list_filter = ("has_attended",)
 
-    search_fields = ("user__username",)
+    search_fields = ("user__username", "ticket_code")
 
-    actions = ["make_has_attended", "make_has_not_attended"]
+    actions = ["make_has_attended", "make_has_not_attended", "export_admin_action"]
 
     def get_full_name(self: "AttendeeAdmin", obj: Attendee) -> str:
         """Computing method to get full name."""
@@ -179,7 +321,9 @@ class AttendeeAdmin(ImportExportActionModelAdmin):
 
 
 @admin.register(Event)
-class EventAdmin(LeafletGeoAdminMixin, ImportExportActionModelAdmin):
+class EventAdmin(
+    StreamingExportMixin, LeafletGeoAdminMixin, ImportExportActionModelAdmin
+):
     """Configure the event model in admin page."""
 
     resource_class = EventResource
@@ -0,0 +1,320 @@
+"""Offline snapshots of the events tables for analytics."""
+import gzip
+import json
+import os
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from .exports import jsonl_lines
+
+# Every dumped table mapped to its model, its columns with the primary key
+# first, the date the rows are partitioned by and the date their changes
+# are tracked by. Rows without a tracked date are dumped in full every run.
+TABLES: Dict[str, Tuple[str, Tuple[str, ...], Optional[str], Optional[str]]] = {
+    "events": (
+        "events.Event",
+        (
+            "id",
+            "title",
+            "slug",
+            "event_date",
+            "total_guest",
+            "hosted_by_id",
+            "read_time",
+            "latitude",
+            "longitude",
+            "waiting_room",
+            "attendees_count",
+            "attended_count",
+            "sessions_count",
+            "accepted_sessions_count",
+            "created_at",
+            "updated_at",
+        ),
+        "event_date",
+        "updated_at",
+    ),
+    "attendees": (
+        "events.Attendee",
+        ("id", "user_id", "events_id", "has_attended", "created_at", "updated_at"),
+        "events__event_date",
+        "updated_at",
+    ),
+    "sessions": (
+        "events.Session",
+        (
+            "id",
+            "events_id",
+            "proposed_by_id",
+            "title",
+            "session_type",
+            "status",
+            "created_at",
+            "updated_at",
+        ),
+        "events__event_date",
+        "updated_at",
+    ),
+    # A change of the tags of an event bumps the event updated_at.
+    "event_tags": (
+        "events.Event_tags",
+        ("id", "event_id", "tag_id"),
+        "event__event_date",
+        "event__updated_at",
+    ),
+    "tags": ("events.Tag", ("id", "name"), None, None),
+    "users": (
+        settings.AUTH_USER_MODEL,
+        ("id", "username", "is_active", "date_joined", "last_login"),
+        None,
+        None,
+    ),
+}
+
+WATERMARK_FILE = "_watermark.json"
+
+RUNS_DIRECTORY = "_runs"
+
+# The ids of the rows of a table at the end of an incremental run, the
+# rows deleted since the previous run are the ones missing from them.
+KEYS_DIRECTORY = "_keys"
+
+
+def read_watermarks(output: str) -> Dict[str, datetime]:
+    """Read the end of the last successful run of every table.
+
+    Args:
+        output: The output directory.
+
+    Returns:
+        The watermark per table, without the tables never dumped.
+    """
+    path = os.path.join(output, WATERMARK_FILE)
+    if not os.path.exists(path):
+        return {}
+
+    with open(path) as watermark:
+        content = json.load(watermark)
+
+    # The watermark of all the tables written before they had their own.
+    if "until" in content:
+        return {name: datetime.fromisoformat(content["until"]) for name in TABLES}
+
+    return {
+        name: datetime.fromisoformat(until) for name, until in content["tables"].items()
+    }
+
+
+def write_run(
+    *,
+    output: str,
+    run_id: str,
+    since: Dict[str, Optional[datetime]],
+    until: datetime,
+    rows: Dict[str, int],
+) -> None:
+    """Record a successful run and move the watermarks of its tables.
+
+    Args:
+        output: The output directory.
+        run_id: The run id used in the file names.
+        since: The start of the run per table, None for a full dump.
+        until: The end of the run.
+        rows: The number of dumped rows per table.
+    """
+    manifest = {
+        "until": until.isoformat(),
+        "tables": {
+            name: {
+                "since": since[name].isoformat() if since[name] else None,
+                "columns": list(TABLES[name][1]),
+                "rows": rows[name],
+            }
+            for name in rows
+        },
+    }
+    os.makedirs(os.path.join(output, RUNS_DIRECTORY), exist_ok=True)
+
+    with open(os.path.join(output, RUNS_DIRECTORY, f"{run_id}.json"), "w") as run:
+        json.dump(manifest, run, indent=2)
+
+    watermarks = read_watermarks(output)
+    watermarks.update((name, until) for name in rows)
+
+    # Written last, a failed run is dumped again by the next one.
+    with open(os.path.join(output, WATERMARK_FILE), "w") as watermark:
+        json.dump(
+            {"tables": {name: value.isoformat() for name, value in watermarks.items()}},
+            watermark,
+        )
+
+
+def get_partition(value: Optional[datetime]) -> str:
+    """Get the month directory of a row.
+
+    Args:
+        value: The partition date of the row.
+
+    Returns:
+        The directory name.
+    """
+    if value is None:
+        return "month=none"
+
+    return f"month={timezone.localtime(value):%Y-%m}"
+
+
+def write_chunk(
+    *,
+    directory: str,
+    file_name: str,
+    columns: Sequence[str],
+    rows: List[Tuple],
+    partitioned: bool,
+) -> None:
+    """Write a chunk of rows to one compressed json lines file per month.
+
+    Args:
+        directory: The directory of the table.
+        file_name: The name of the files.
+        columns: The dumped columns.
+        rows: The rows, followed by their partition date when partitioned.
+        partitioned: Whether the rows are split by month.
+    """
+    groups: Dict[str, List[Tuple]] = defaultdict(list)
+    for row in rows:
+        groups[get_partition(row[-1]) if partitioned else ""].append(row)
+
+    for partition, group in groups.items():
+        path = os.path.join(directory, partition)
+        os.makedirs(path, exist_ok=True)
+
+        with gzip.open(os.path.join(path, file_name), "wt", encoding="utf-8") as dump:
+            dump.writelines(jsonl_lines(columns, group))
+
+
+def dump_rows(
+    *,
+    queryset: QuerySet,
+    fields: Sequence[str],
+    columns: Sequence[str],
+    directory: str,
+    run_id: str,
+    chunk_size: int,
+    partitioned: bool,
+) -> int:
+    """Write the rows of a queryset ordered by primary key, a chunk at a time.
+
+    Every chunk starts after the last key of the previous one.
+
+    Args:
+        queryset: The rows, ordered by primary key.
+        fields: The read fields, the primary key first.
+        columns: The dumped columns.
+        directory: The directory of the files.
+        run_id: The run id used in the file names.
+        chunk_size: Number of rows read and written at once.
+        partitioned: Whether the rows are split by month.
+
+    Returns:
+        The number of dumped rows.
+    """
+    total = 0
+    last = None
+
+    while True:
+        chunk = queryset if last is None else queryset.filter(pk__gt=last)
+        rows = list(chunk.values_list(*fields)[:chunk_size])
+        if not rows:
+            break
+
+        write_chunk(
+            directory=directory,
+            file_name=f"part-{run_id}-{total // chunk_size:06d}.jsonl.gz",
+            columns=columns,
+            rows=rows,
+            partitioned=partitioned,
+        )
+        total += len(rows)
+        last = rows[-1][0]
+
+    return total
+
+
+def dump_table(
+    *,
+    name: str,
+    output: str,
+    run_id: str,
+    since: Optional[datetime],
+    until: datetime,
+    snapshot: Optional[str],
+    chunk_size: int,
+) -> int:
+    """Dump the rows of a table changed between two dates.
+
+    The rows are read in primary key order with ``dump_rows``. When a
+    PostgreSQL snapshot is given, the rows are read in it so every worker
+    sees the same state of the database.
+
+    The deleted rows don't show in the changes. An incremental run of a
+    table tracking its changes also writes the ids of all its rows under
+    ``KEYS_DIRECTORY``, the rows missing from them were deleted.
+
+    Args:
+        name: The table name in ``TABLES``.
+        output: The output directory.
+        run_id: The run id used in the file names.
+        since: Only dump the rows changed after this date, all when None.
+        until: Only dump the rows changed up to this date.
+        snapshot: The id of an exported PostgreSQL snapshot.
+        chunk_size: Number of rows read and written at once.
+
+    Returns:
+        The number of dumped rows.
+    """
+    label, columns, partition, updated = TABLES[name]
+    queryset = apps.get_model(label)._default_manager.order_by("pk")
+
+    if updated:
+        queryset = queryset.filter(**{f"{updated}__lte": until})
+
+    with transaction.atomic():
+        if snapshot:
+            with connection.cursor() as cursor:
+                cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                cursor.execute("SET TRANSACTION SNAPSHOT %s", [snapshot])
+
+        total = dump_rows(
+            queryset=(
+                queryset.filter(**{f"{updated}__gt": since})
+                if updated and since
+                else queryset
+            ),
+            fields=columns + ((partition,) if partition else ()),
+            columns=columns,
+            directory=os.path.join(output, name),
+            run_id=run_id,
+            chunk_size=chunk_size,
+            partitioned=partition is not None,
+        )
+
+        if updated and since:
+            dump_rows(
+                queryset=queryset,
+                fields=columns[:1],
+                columns=columns[:1],
+                directory=os.path.join(output, name, KEYS_DIRECTORY, f"run={run_id}"),
+                run_id=run_id,
+                chunk_size=chunk_size,
+                partitioned=False,
+            )
+
+    return total
@@ -8,3 +8,7 @@ class EventsConfig(AppConfig):
 
     name = "events"
     verbose_name = _("Events")
+
+    def ready(self: "EventsConfig") -> None:
+        """Connect the signals that live outside of the models module."""
+        from . import archive, clusters, details, tags  # noqa: F401
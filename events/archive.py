@@ -0,0 +1,235 @@
+"""Pre-rendered archive of past events partitioned by month."""
+import gzip
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Count
+from django.db.models.functions import TruncMonth
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import Event
+from .serializers import EventListSerializer
+
+ARCHIVE_CACHE = getattr(settings, "EVENT_ARCHIVE_CACHE", "default")
+
+# A closed month only changes when one of its events is edited, which
+# invalidates it right away; the timeout only bounds indirect changes.
+CLOSED_MONTH_TIMEOUT = 60 * 60 * 24
+
+# The current month keeps receiving events as they move into the past.
+OPEN_MONTH_TIMEOUT = 60 * 5
+
+# The responses can be kept by the clients and the proxies, which are not
+# reached by the invalidation, so they are only kept for a short time.
+RESPONSE_MAX_AGE = OPEN_MONTH_TIMEOUT
+
+INDEX_KEY = "events:archive:index"
+
+
+def month_key(date: datetime) -> str:
+    """Get the partition key of a date.
+
+    Args:
+        date: A timezone aware date.
+
+    Returns:
+        The month in ``YYYY-MM`` format.
+    """
+    return timezone.localtime(date).strftime("%Y-%m")
+
+
+def month_bounds(key: str) -> Tuple[datetime, datetime]:
+    """Get the first instant of a month and of the month after it.
+
+    A key that is not a valid month raises ``ValueError`` from ``strptime``.
+
+    Args:
+        key: The month in ``YYYY-MM`` format.
+
+    Returns:
+        The start and the end of the month.
+    """
+    start = datetime.strptime(key, "%Y-%m")
+    end = start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+    return timezone.make_aware(start), timezone.make_aware(end)
+
+
+def is_open(key: str) -> bool:
+    """Check if the month can still receive events that become past.
+
+    Args:
+        key: The month in ``YYYY-MM`` format.
+
+    Returns:
+        True for the current month.
+    """
+    return key >= month_key(timezone.now())
+
+
+def partition_cache_key(key: str) -> str:
+    """Get the cache key of a partition.
+
+    Args:
+        key: The month in ``YYYY-MM`` format.
+
+    Returns:
+        The cache key.
+    """
+    return f"events:archive:{key}"
+
+
+def compress(data: Any) -> bytes:
+    """Render data to compressed json.
+
+    Args:
+        data: Serializer data.
+
+    Returns:
+        The gzip compressed json.
+    """
+    content = json.dumps(data, cls=JSONEncoder, separators=(",", ":"))
+    return gzip.compress(content.encode("utf-8"))
+
+
+def decompress(blob: bytes) -> Any:
+    """Load data rendered by ``compress``.
+
+    Args:
+        blob: The gzip compressed json.
+
+    Returns:
+        The data.
+    """
+    return json.loads(gzip.decompress(blob).decode("utf-8"))
+
+
+def build_partition(key: str) -> bytes:
+    """Serialize all the past events of a month.
+
+    Args:
+        key: The month in ``YYYY-MM`` format.
+
+    Returns:
+        The compressed events, newest first.
+    """
+    start, end = month_bounds(key)
+    events = (
+        Event.objects.select_related("hosted_by")
+        .prefetch_related("tags")
+        .filter(event_date__gte=start, event_date__lt=min(end, timezone.now()))
+        .order_by("-event_date", "-pk")
+    )
+    return compress(EventListSerializer(events, many=True).data)
+
+
+def get_partition(key: str) -> List[Dict[str, Any]]:
+    """Get the serialized events of a month, building it when missing.
+
+    Args:
+        key: The month in ``YYYY-MM`` format.
+
+    Returns:
+        The serialized events, newest first.
+    """
+    cache = caches[ARCHIVE_CACHE]
+    blob = cache.get(partition_cache_key(key))
+
+    if blob is None:
+        blob = build_partition(key)
+        timeout = OPEN_MONTH_TIMEOUT if is_open(key) else CLOSED_MONTH_TIMEOUT
+        cache.set(partition_cache_key(key), blob, timeout)
+
+    return decompress(blob)
+
+
+def get_index() -> List[Dict[str, Any]]:
+    """Get the months that have past events with their number of events.
+
+    Returns:
+        The months, newest first.
+    """
+    cache = caches[ARCHIVE_CACHE]
+    blob = cache.get(INDEX_KEY)
+
+    if blob is None:
+        months = (
+            Event.objects.filter(event_date__lt=timezone.now())
+            .annotate(month=TruncMonth("event_date"))
+            .order_by()
+            .values("month")
+            .annotate(total=Count("pk"))
+            .order_by("-month")
+        )
+        blob = compress(
+            [
+                {"month": month_key(row["month"]), "count": row["total"]}
+                for row in months
+            ]
+        )
+        cache.set(INDEX_KEY, blob, OPEN_MONTH_TIMEOUT)
+
+    return decompress(blob)
+
+
+def invalidate(*dates: Optional[datetime]) -> None:
+    """Drop the partitions of the given dates when they are in the past.
+
+    Args:
+        dates: Event dates, the ``None`` values are ignored.
+    """
+    now = timezone.now()
+    keys = {month_key(date) for date in dates if date is not None and date < now}
+
+    if keys:
+        cache = caches[ARCHIVE_CACHE]
+        cache.delete_many([partition_cache_key(key) for key in keys] + [INDEX_KEY])
+
+
+@receiver(pre_save, sender=Event)
+def archive_snapshot(sender: Event, instance: Event, **kwargs: Any) -> None:
+    """Single for Event to remember the stored event date."""
+    instance._archive_event_date = None
+
+    if instance.pk is not None and not kwargs.get("raw"):
+        instance._archive_event_date = (
+            Event.objects.filter(pk=instance.pk)
+            .values_list("event_date", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Event)
+def archive_updater(sender: Event, instance: Event, **kwargs: Any) -> None:
+    """Single for Event to drop the archived months it belongs to."""
+    invalidate(getattr(instance, "_archive_event_date", None), instance.event_date)
+
+
+@receiver(post_delete, sender=Event)
+def archive_remover(sender: Event, instance: Event, **kwargs: Any) -> None:
+    """Single for Event to drop the archived month it belonged to."""
+    invalidate(instance.event_date)
+
+
+@receiver(m2m_changed, sender=Event.tags.through)
+def archive_tags_updater(
+    sender: Any, instance: Any, action: str, reverse: bool, **kwargs: Any
+) -> None:
+    """Single for Event tags to drop the archived months of the events."""
+    if not action.startswith("post_"):
+        return
+
+    if not reverse:
+        invalidate(instance.event_date)
+
+    elif kwargs.get("pk_set"):
+        invalidate(
+            *Event.objects.filter(pk__in=kwargs["pk_set"]).values_list(
+                "event_date", flat=True
+            )
+        )
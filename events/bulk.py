@@ -0,0 +1,174 @@
+"""Bulk creation of events."""
+from typing import Any, Dict, Iterable, List, Tuple
+
+from django.db import IntegrityError, transaction
+
+from users.models import UserStats
+from . import archive, clusters, tags
+from .models import Event, Tag
+from .search import get_backend
+from .utils import SLUG_ATTEMPTS, allocate_slugs, get_coordinates, get_read_time
+
+# The many to many fields written after the events.
+RELATIONS = ("tags", "organizers")
+
+
+def build_event(*, host: Any, slug: str, item: Dict[str, Any]) -> Event:
+    """Build an unsaved event with the fields ``event_creator`` would set.
+
+    Args:
+        host: The user hosting the event.
+        slug: The allocated slug.
+        item: The validated event.
+
+    Returns:
+        The event.
+    """
+    fields = {name: value for name, value in item.items() if name not in RELATIONS}
+    event = Event(hosted_by=host, slug=slug, **fields)
+
+    if event.description:
+        event.read_time = get_read_time(words=event.description)
+
+    coordinates = get_coordinates(geom=event.geom) or (None, None)
+    event.latitude, event.longitude = coordinates
+
+    return event
+
+
+def through_rows(field_name: str, pairs: Iterable[Tuple[int, int]]) -> List[Any]:
+    """Build the rows of a many to many relation of the events.
+
+    Args:
+        field_name: The many to many field of ``Event``.
+        pairs: The event id and the related id of every row.
+
+    Returns:
+        The unsaved rows of the through model.
+    """
+    field = Event._meta.get_field(field_name)
+    through = field.remote_field.through
+    source = field.m2m_column_name()
+    target = field.m2m_reverse_name()
+
+    return [
+        through(**{source: event_id, target: related_id})
+        for event_id, related_id in pairs
+    ]
+
+
+def insert_events(
+    *, host: Any, items: List[Dict[str, Any]], slugs: List[str],
+) -> List[Event]:
+    """Insert the events, their tags and their relations in one transaction.
+
+    Args:
+        host: The user hosting the events.
+        items: The validated events.
+        slugs: The allocated slug of every event.
+
+    Returns:
+        The created events.
+    """
+    events = [
+        build_event(host=host, slug=slugs[index], item=item)
+        for index, item in enumerate(items)
+    ]
+
+    with transaction.atomic():
+        names = list(
+            dict.fromkeys(name.lower() for item in items for name in item["tags"])
+        )
+        ids = Tag.objects.resolve_ids(names)
+        tag_map = {name: ids[index] for index, name in enumerate(names)}
+
+        Event.objects.bulk_create(events)
+
+        # Only PostgreSQL returns the primary keys of the inserted rows.
+        if any(event.pk is None for event in events):
+            ids = dict(Event.objects.filter(slug__in=slugs).values_list("slug", "pk"))
+            for event in events:
+                event.pk = ids[event.slug]
+
+        Event.tags.through.objects.bulk_create(
+            through_rows(
+                "tags",
+                {
+                    (events[index].pk, tag_map[name.lower()])
+                    for index, item in enumerate(items)
+                    for name in item["tags"]
+                },
+            )
+        )
+        Event.organizers.through.objects.bulk_create(
+            through_rows(
+                "organizers",
+                {
+                    (events[index].pk, user_id)
+                    for index, item in enumerate(items)
+                    for user_id in item["organizers"]
+                },
+            )
+        )
+
+        get_backend().index_queryset(
+            Event.objects.filter(pk__in=[event.pk for event in events])
+        )
+
+        positions = (
+            clusters.get_position(
+                latitude=event.latitude,
+                longitude=event.longitude,
+                event_date=event.event_date,
+            )
+            for event in events
+        )
+        clusters.add_many([position for position in positions if position])
+
+        UserStats.objects.refresh([host.pk], "hosted_events_count")
+        UserStats.objects.refresh(
+            {user_id for item in items for user_id in item["organizers"]},
+            "organized_events_count",
+        )
+
+    return events
+
+
+def create_events(*, host: Any, items: List[Dict[str, Any]]) -> List[Event]:
+    """Create a batch of events without going through their signals.
+
+    The slugs, read times and coordinates are computed for the whole batch
+    up front, the tags are resolved in one pass inside the transaction, so a
+    failed batch leaves no new tags behind, and the events, their tags
+    and their organizers are each written with one insert. The search
+    index, the map cells, the user stats and the cached archive and tag
+    cloud are updated as the signals would.
+
+    Args:
+        host: The user hosting the events.
+        items: The validated events, with the tag names and organizer ids.
+
+    Returns:
+        The created events, in the order of the items.
+
+    Raises:
+        IntegrityError: If the events can't be inserted.
+    """
+    for attempt in range(SLUG_ATTEMPTS):
+        slugs = allocate_slugs(model=Event, titles=[item["title"] for item in items])
+        try:
+            events = insert_events(host=host, items=items, slugs=slugs)
+            break
+
+        except IntegrityError:
+            # Retry when another request took one of the slugs after the check.
+            if (
+                attempt == SLUG_ATTEMPTS - 1
+                or not Event.objects.filter(slug__in=slugs).exists()
+            ):
+                raise
+
+    archive.invalidate(*(event.event_date for event in events))
+    tags.invalidate()
+
+    return events
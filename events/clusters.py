@@ -0,0 +1,252 @@
+"""Precomputed clusters of the upcoming events for the map."""
+from datetime import date, datetime, time, timedelta
+from functools import reduce
+from operator import or_
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import F, Q, Sum
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Event, EventMapCell
+from .utils import MAP_CELL_SHIFT, get_map_cells, get_tile
+
+Position = Tuple[float, float, date]
+
+
+def get_position(
+    *,
+    latitude: Optional[float],
+    longitude: Optional[float],
+    event_date: Optional[datetime],
+) -> Optional[Position]:
+    """Get what places an event in the cells.
+
+    Args:
+        latitude: Latitude of the event.
+        longitude: Longitude of the event.
+        event_date: Date of the event.
+
+    Returns:
+        The latitude, the longitude and the local day, or None when the
+        event can't be placed on the map.
+    """
+    if latitude is None or longitude is None or event_date is None:
+        return None
+
+    return latitude, longitude, timezone.localdate(event_date)
+
+
+def get_lookups(position: Position) -> Q:
+    """Get the lookups of the cells of an event at every zoom level.
+
+    Args:
+        position: The position of the event.
+
+    Returns:
+        The lookups matching the cells.
+    """
+    latitude, longitude, day = position
+    cells = get_map_cells(latitude=latitude, longitude=longitude)
+    return reduce(or_, (Q(zoom=zoom, x=x, y=y, day=day) for zoom, x, y in cells))
+
+
+def move(position: Position, sign: int, using: Optional[str] = None) -> None:
+    """Add or remove an event from its cells at every zoom level.
+
+    Args:
+        position: The position of the event.
+        sign: 1 to add the event, -1 to remove it.
+        using: The database alias.
+    """
+    latitude, longitude, day = position
+    lookups = get_lookups(position)
+    manager = EventMapCell.objects.db_manager(using)
+
+    with transaction.atomic(using=manager.db):
+        if sign > 0:
+            cells = get_map_cells(latitude=latitude, longitude=longitude)
+            manager.bulk_create(
+                [EventMapCell(zoom=zoom, x=x, y=y, day=day) for zoom, x, y in cells],
+                ignore_conflicts=True,
+            )
+
+        manager.filter(lookups).update(
+            count=F("count") + sign,
+            latitude_sum=F("latitude_sum") + sign * latitude,
+            longitude_sum=F("longitude_sum") + sign * longitude,
+        )
+
+        if sign < 0:
+            manager.filter(lookups, count__lte=0).delete()
+
+
+def add_many(positions: List[Position], using: Optional[str] = None) -> None:
+    """Add events written without signals to their cells.
+
+    The missing cells of the whole batch are created with one insert, then
+    every event is added with the same update as ``move``.
+
+    Args:
+        positions: The positions of the events.
+        using: The database alias.
+    """
+    if not positions:
+        return
+
+    manager = EventMapCell.objects.db_manager(using)
+    cells = {
+        (zoom, x, y, day)
+        for latitude, longitude, day in positions
+        for zoom, x, y in get_map_cells(latitude=latitude, longitude=longitude)
+    }
+
+    with transaction.atomic(using=manager.db):
+        manager.bulk_create(
+            [EventMapCell(zoom=zoom, x=x, y=y, day=day) for zoom, x, y, day in cells],
+            ignore_conflicts=True,
+        )
+
+        for position in positions:
+            latitude, longitude, _ = position
+            manager.filter(get_lookups(position)).update(
+                count=F("count") + 1,
+                latitude_sum=F("latitude_sum") + latitude,
+                longitude_sum=F("longitude_sum") + longitude,
+            )
+
+
+def get_clusters(
+    *, west: float, south: float, east: float, north: float, zoom: int
+) -> List[Dict[str, Any]]:
+    """Get the clusters of the upcoming events inside a bounding box.
+
+    The ``(zoom, day, x, y)`` index is walked over the days after today at
+    the zoom level, the position bounds are checked on the index entries.
+    The cells of the past days are dropped by ``rebuild_map_cells --prune``,
+    so the walk stays proportional to the upcoming events.
+
+    The cells of today also count the events that already started, so the
+    events left today are read from the events, with the same cutoff as the
+    events shown above ``MAP_MAX_CLUSTER_ZOOM``, and added to their cells.
+
+    Args:
+        west: Minimum longitude in degrees.
+        south: Minimum latitude in degrees.
+        east: Maximum longitude in degrees.
+        north: Maximum latitude in degrees.
+        zoom: The map zoom level.
+
+    Returns:
+        The centroid and the number of events of every non empty cell.
+    """
+    level = zoom + MAP_CELL_SHIFT
+    min_x, min_y = get_tile(latitude=north, longitude=west, level=level)
+    max_x, max_y = get_tile(latitude=south, longitude=east, level=level)
+
+    if west <= east:
+        columns = Q(x__gte=min_x, x__lte=max_x)
+    else:
+        columns = Q(x__gte=min_x) | Q(x__lte=max_x)
+
+    now = timezone.now()
+    today = timezone.localdate(now)
+    tomorrow = timezone.make_aware(datetime.combine(today + timedelta(days=1), time()))
+
+    cells = (
+        EventMapCell.objects.filter(
+            columns, zoom=zoom, y__gte=min_y, y__lte=max_y, day__gt=today,
+        )
+        .values("x", "y")
+        .annotate(
+            total=Sum("count"),
+            total_latitude=Sum("latitude_sum"),
+            total_longitude=Sum("longitude_sum"),
+        )
+        .order_by()
+    )
+    totals = {
+        (cell["x"], cell["y"]): [
+            cell["total"],
+            cell["total_latitude"],
+            cell["total_longitude"],
+        ]
+        for cell in cells
+    }
+
+    events = (
+        Event.objects.filter(event_date__gt=now, event_date__lt=tomorrow)
+        .within(west=west, south=south, east=east, north=north)
+        .values_list("latitude", "longitude")
+    )
+    for latitude, longitude in events:
+        tile = get_tile(latitude=latitude, longitude=longitude, level=level)
+        total = totals.setdefault(tile, [0, 0.0, 0.0])
+        total[0] += 1
+        total[1] += latitude
+        total[2] += longitude
+
+    return [
+        {
+            "latitude": total_latitude / total,
+            "longitude": total_longitude / total,
+            "count": total,
+        }
+        for _, (total, total_latitude, total_longitude) in sorted(totals.items())
+        if total
+    ]
+
+
+@receiver(pre_save, sender=Event)
+def clusters_snapshot(sender: Event, instance: Event, **kwargs: Any) -> None:
+    """Single for Event to remember the stored position."""
+    instance._clusters_position = None
+
+    if instance.pk is not None and not kwargs.get("raw"):
+        stored = (
+            Event.objects.filter(pk=instance.pk)
+            .values("latitude", "longitude", "event_date")
+            .first()
+        )
+        if stored:
+            instance._clusters_position = get_position(**stored)
+
+
+@receiver(post_save, sender=Event)
+def clusters_updater(sender: Event, instance: Event, **kwargs: Any) -> None:
+    """Single for Event to move it between the map cells."""
+    if kwargs.get("raw"):
+        return
+
+    old = getattr(instance, "_clusters_position", None)
+    instance._clusters_position = None
+
+    new = get_position(
+        latitude=instance.latitude,
+        longitude=instance.longitude,
+        event_date=instance.event_date,
+    )
+
+    if old == new:
+        return
+
+    if old is not None:
+        move(old, -1, kwargs.get("using"))
+
+    if new is not None:
+        move(new, 1, kwargs.get("using"))
+
+
+@receiver(post_delete, sender=Event)
+def clusters_remover(sender: Event, instance: Event, **kwargs: Any) -> None:
+    """Single for Event to remove it from the map cells."""
+    position = get_position(
+        latitude=instance.latitude,
+        longitude=instance.longitude,
+        event_date=instance.event_date,
+    )
+
+    if position is not None:
+        move(position, -1, kwargs.get("using"))
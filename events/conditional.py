@@ -0,0 +1,119 @@
+"""Conditional GET for the event and session endpoints."""
+import hashlib
+from calendar import timegm
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import get_language
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+
+# The responses are rendered for the user of the request.
+VARY_HEADERS = ("Authorization", "Cookie")
+
+Validators = Tuple[Any, Optional[datetime]]
+
+
+def make_etag(request: Request, version: Any) -> str:
+    """Build the ETag of a response for the user of the request.
+
+    Args:
+        request: Request object
+        version: Anything that changes when the rendered data changes.
+
+    Returns:
+        The quoted ETag.
+    """
+    viewer = request.user.pk if request.user.is_authenticated else 0
+    value = f"{version}:{viewer}:{get_language()}"
+    return quote_etag(
+        hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+    )
+
+
+class ConditionalGetMixin:
+    """Answer GET requests with a 304 when the client copy is still fresh.
+
+    The validators are computed with a cheap query before the data is
+    loaded and serialized. Per viewer fields are covered by putting the
+    user in the ETag and varying on the credentials.
+    """
+
+    def get_validators(self: Any) -> Validators:
+        """Get the validators of the resource, none by default.
+
+        Returns:
+            The version used for the ETag and the last modification date.
+        """
+        return None, None
+
+    def get(self: Any, request: Request, *args: Any, **kwargs: Any) -> HttpResponse:
+        """Return a 304 or the response with its validators."""
+        version, last_modified = self.get_validators()
+        if version is None and last_modified is None:
+            return super().get(request, *args, **kwargs)
+
+        etag = make_etag(request, version)
+        timestamp = timegm(last_modified.utctimetuple()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+
+        if response.status_code in (200, 304):
+            response["ETag"] = etag
+            if timestamp is not None:
+                response["Last-Modified"] = http_date(timestamp)
+            patch_vary_headers(response, VARY_HEADERS)
+
+        return response
+
+
+class ConditionalListMixin(ConditionalGetMixin):
+    """Conditional GET for list views.
+
+    The validators are the last ``updated_at`` and the number of rows of
+    the filtered queryset, so deleted rows change them as well.
+    """
+
+    def get_validators(self: Any) -> Validators:
+        """Aggregate the validators without the annotations of the queryset."""
+        queryset = self.filter_queryset(self.get_queryset())
+        stats = (
+            queryset.order_by()
+            .values("pk")
+            .aggregate(last_modified=Max("updated_at"), total=Count("pk"))
+        )
+        return (
+            f"{stats['last_modified']}:{stats['total']}",
+            stats["last_modified"],
+        )
+
+
+class ConditionalRetrieveMixin(ConditionalGetMixin):
+    """Conditional GET for retrieve views based on ``updated_at``."""
+
+    def get_validators(self: Any) -> Validators:
+        """Read the ``updated_at`` of the object.
+
+        Returns:
+            The ``updated_at`` as the version and the last modification date.
+
+        Raises:
+            NotFound: If the object doesn't exists.
+        """
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        updated_at = (
+            self.filter_queryset(self.get_queryset())
+            .filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+        if updated_at is None:
+            raise NotFound()
+
+        return updated_at, updated_at
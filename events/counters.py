@@ -0,0 +1,100 @@
+"""Collection of denormalized counters stored on the event model."""
+from typing import Any, Dict, Mapping, Tuple
+
+# Every counter column on ``Event`` mapped to the reverse relation it counts
+# and the lookups a related row has to match to be counted.
+COUNTERS: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "attendees_count": ("attendees", {}),
+    "attended_count": ("attendees", {"has_attended": True}),
+    "not_attended_count": ("attendees", {"has_attended": False}),
+    "sessions_count": ("sessions", {}),
+    "draft_sessions_count": ("sessions", {"status": "Draft"}),
+    "accepted_sessions_count": ("sessions", {"status": "Accepted"}),
+    "denied_sessions_count": ("sessions", {"status": "Denied"}),
+    "talk_count": ("sessions", {"session_type": "Talk", "status": "Accepted"}),
+    "lighting_talk_count": (
+        "sessions",
+        {"session_type": "Lighting Talk", "status": "Accepted"},
+    ),
+    "workshop_count": ("sessions", {"session_type": "WorkShop", "status": "Accepted"},),
+}
+
+
+def counter_names(*, related_name: str) -> Tuple[str, ...]:
+    """Get the counters maintained by a reverse relation.
+
+    Args:
+        related_name: The reverse relation name, attendees or sessions.
+
+    Returns:
+        The counter column names.
+    """
+    return tuple(
+        name for name, (relation, _) in COUNTERS.items() if relation == related_name
+    )
+
+
+def counter_fields(*, related_name: str) -> Tuple[str, ...]:
+    """Get the related model fields the counters depend on.
+
+    Args:
+        related_name: The reverse relation name, attendees or sessions.
+
+    Returns:
+        The field names to snapshot before a save.
+    """
+    fields = {
+        field
+        for relation, lookups in COUNTERS.values()
+        if relation == related_name
+        for field in lookups
+    }
+    return tuple(sorted(fields))
+
+
+def counters_for(*, related_name: str, values: Mapping[str, Any]) -> Dict[str, int]:
+    """Get the contribution of a single related row to the counters.
+
+    Args:
+        related_name: The reverse relation name, attendees or sessions.
+        values: The row field values.
+
+    Returns:
+        The counters the row is counted in, mapped to one.
+    """
+    return {
+        name: 1
+        for name, (relation, lookups) in COUNTERS.items()
+        if relation == related_name
+        and all(values.get(field) == value for field, value in lookups.items())
+    }
+
+
+def counters_delta(*, old: Mapping[str, int], new: Mapping[str, int]) -> Dict[str, int]:
+    """Get the difference between two contributions.
+
+    Args:
+        old: The contribution before the change.
+        new: The contribution after the change.
+
+    Returns:
+        Non-zero counter changes.
+    """
+    delta = {}
+    for name in set(old) | set(new):
+        change = new.get(name, 0) - old.get(name, 0)
+        if change:
+            delta[name] = change
+    return delta
+
+
+def negate(*, counters: Mapping[str, int]) -> Dict[str, int]:
+    """Negate a contribution.
+
+    Args:
+        counters: The contribution to negate.
+
+    Returns:
+        The negated contribution.
+    """
+    return {name: -value for name, value in counters.items()}
@@ -0,0 +1,123 @@
+"""Shared cache of the viewer independent part of the event details."""
+from datetime import datetime
+from typing import Any, Dict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.translation import get_language
+
+from .models import Event, Session, Tag
+from .serializers import EventRetrieveSerializer
+
+EVENT_DETAIL_CACHE = getattr(settings, "EVENT_DETAIL_CACHE", "default")
+
+# The key changes with updated_at, the timeout only evicts old versions.
+EVENT_DETAIL_TIMEOUT = 60 * 10
+
+# The fields of a user rendered in the events and the sessions.
+PROFILE_FIELDS = ("username", "picture")
+
+
+def detail_cache_key(slug: str, updated_at: datetime, language: str) -> str:
+    """Get the cache key of a version of an event.
+
+    Args:
+        slug: The event slug.
+        updated_at: The last modification of the event.
+        language: The language of the response.
+
+    Returns:
+        The cache key.
+    """
+    return f"events:detail:{slug}:{language}:{updated_at.timestamp()}"
+
+
+def get_detail(
+    *, slug: str, updated_at: datetime, context: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Get the serialized event, building it when missing.
+
+    Args:
+        slug: The event slug.
+        updated_at: The last modification of the event, as read by the caller.
+        context: The serializer context.
+
+    Returns:
+        The serialized event without the viewer fields.
+    """
+    cache = caches[EVENT_DETAIL_CACHE]
+    key = detail_cache_key(slug, updated_at, get_language())
+    data = cache.get(key)
+
+    if data is None:
+        event = (
+            Event.objects.select_related("hosted_by")
+            .prefetch_related("organizers", "tags")
+            .get(slug=slug)
+        )
+        data = dict(EventRetrieveSerializer(event, context=context).data)
+        cache.set(key, data, EVENT_DETAIL_TIMEOUT)
+
+    return data
+
+
+@receiver(post_delete, sender=Event)
+def detail_remover(sender: Event, instance: Event, **kwargs: Any) -> None:
+    """Single for Event to drop its cached details."""
+    caches[EVENT_DETAIL_CACHE].delete_many(
+        [
+            detail_cache_key(instance.slug, instance.updated_at, language)
+            for language, _ in settings.LANGUAGES
+        ]
+    )
+
+
+@receiver(post_save, sender=Tag)
+def detail_tag_updater(sender: Tag, instance: Tag, **kwargs: Any) -> None:
+    """Single for Tag to move the events showing a renamed tag to a new version."""
+    if not kwargs.get("created") and not kwargs.get("raw"):
+        Event.objects.filter(tags=instance).update(updated_at=timezone.now())
+
+
+@receiver(pre_save, sender=settings.AUTH_USER_MODEL)
+def detail_profile_snapshot(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for CustomUser to remember the stored profile."""
+    instance._detail_profile = None
+    update_fields = kwargs.get("update_fields")
+
+    if (
+        instance.pk is None
+        or kwargs.get("raw")
+        or update_fields is not None
+        and not set(PROFILE_FIELDS) & set(update_fields)
+    ):
+        return
+
+    instance._detail_profile = (
+        sender._default_manager.filter(pk=instance.pk)
+        .values_list(*PROFILE_FIELDS)
+        .first()
+    )
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def detail_profile_updater(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for CustomUser to move what shows a changed profile to a new version."""
+    stored = getattr(instance, "_detail_profile", None)
+    instance._detail_profile = None
+
+    profile = tuple(
+        sender._meta.get_field(field).value_to_string(instance)
+        for field in PROFILE_FIELDS
+    )
+    if stored is None or stored == profile:
+        return
+
+    Event.objects.filter(Q(hosted_by=instance) | Q(organizers=instance)).update(
+        updated_at=timezone.now()
+    )
+    Session.objects.filter(proposed_by=instance).touch()
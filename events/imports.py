@@ -0,0 +1,284 @@
+"""Bulk import of attendees from the admin."""
+import csv
+import io
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from import_export.widgets import BooleanWidget
+
+from users.models import UserStats
+from .models import TICKET_CODE_SIZE, Attendee, Event
+from .utils import random_string
+
+IMPORT_CHUNK_SIZE = 2000
+
+# The columns written by ``copy_attendees``.
+COPY_FIELDS = (
+    "user",
+    "events",
+    "has_attended",
+    "ticket_code",
+    "created_at",
+    "updated_at",
+)
+
+
+def chunks(values: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    """Split values in consecutive chunks.
+
+    Args:
+        values: The values to split.
+        size: Maximum number of values per chunk.
+
+    Yields:
+        The chunks.
+    """
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def values_in(
+    queryset: QuerySet, lookup: str, values: Iterable[Any], *fields: str
+) -> List[Tuple]:
+    """Read the rows matching a large set of values, a chunk at a time.
+
+    Args:
+        queryset: The queryset to filter.
+        lookup: The field the values are matched against.
+        values: The matched values.
+        fields: The returned fields.
+
+    Returns:
+        The values of the fields of every matching row.
+    """
+    rows: List[Tuple] = []
+
+    values = sorted({value for value in values if value is not None})
+
+    for chunk in chunks(values, IMPORT_CHUNK_SIZE):
+        rows.extend(queryset.filter(**{f"{lookup}__in": chunk}).values_list(*fields))
+
+    return rows
+
+
+def validate_attendees(
+    rows: Sequence[Dict[str, Any]]
+) -> Tuple[Dict[int, Attendee], Dict[int, ValidationError]]:
+    """Validate the rows of an import with a few set queries.
+
+    The users are matched by ``user__username`` and the events by
+    ``events__slug`` when the column is present, by ``events__title``
+    otherwise. The users, the events and the existing attendees of the
+    whole file are read up front, then the rows are checked in memory
+    with the rules of ``AttendeeAdminForm``. A row of an existing attendee
+    updates its ``has_attended``, a new attendee takes one of the seats
+    left on the event.
+
+    Args:
+        rows: The rows of the file.
+
+    Returns:
+        The attendees and the errors, keyed by row number. The existing
+        attendees have a primary key, the new ones don't.
+    """
+    event_field = "slug" if rows and "events__slug" in rows[0] else "title"
+
+    users = dict(
+        values_in(
+            get_user_model().objects.all(),
+            "username",
+            (row.get("user__username") for row in rows),
+            "username",
+            "pk",
+        )
+    )
+
+    events = values_in(
+        Event.objects.all(),
+        event_field,
+        (row.get(f"events__{event_field}") for row in rows),
+        event_field,
+        "pk",
+        "hosted_by",
+        "total_guest",
+        "attendees_count",
+    )
+    matches = Counter(key for key, pk, host, total, count in events)
+    hosts = {pk: host for key, pk, host, total, count in events}
+    event_ids = {key: pk for key, pk, host, total, count in events}
+    seats = {pk: total - count for key, pk, host, total, count in events}
+
+    existing = {
+        (user, event): pk
+        for user, event, pk in values_in(
+            Attendee.objects.filter(events__in=hosts),
+            "user",
+            users.values(),
+            "user",
+            "events",
+            "pk",
+        )
+    }
+    seen = set()
+
+    boolean = BooleanWidget()
+    attendees: Dict[int, Attendee] = {}
+    errors: Dict[int, ValidationError] = {}
+
+    for number, row in enumerate(rows, 1):
+        user = users.get(row.get("user__username"))
+        key = row.get(f"events__{event_field}")
+        event = event_ids.get(key)
+
+        if user is None:
+            errors[number] = ValidationError({"user__username": _("Unknown user")})
+
+        elif event is None:
+            errors[number] = ValidationError(
+                {f"events__{event_field}": _("Unknown event")}
+            )
+
+        elif matches[key] > 1:
+            errors[number] = ValidationError(
+                {f"events__{event_field}": _("More than one event has this title")}
+            )
+
+        elif hosts[event] == user:
+            errors[number] = ValidationError(_("You are the owner of the Event"))
+
+        elif (user, event) in seen:
+            errors[number] = ValidationError(_("You already attended the Event"))
+
+        elif (user, event) in existing:
+            seen.add((user, event))
+            attendees[number] = Attendee(
+                pk=existing[(user, event)],
+                user_id=user,
+                events_id=event,
+                has_attended=boolean.clean(row.get("has_attended")),
+            )
+
+        elif seats[event] <= 0:
+            errors[number] = ValidationError(_("The event is full"))
+
+        else:
+            seen.add((user, event))
+            seats[event] -= 1
+            attendees[number] = Attendee(
+                user_id=user,
+                events_id=event,
+                has_attended=boolean.clean(row.get("has_attended")),
+                ticket_code=random_string(size=TICKET_CODE_SIZE),
+            )
+
+    return attendees, errors
+
+
+def copy_attendees(attendees: Sequence[Attendee], using: str) -> None:
+    """Write attendees with PostgreSQL ``COPY``.
+
+    Args:
+        attendees: The unsaved attendees.
+        using: The database alias.
+    """
+    connection = connections[using]
+    now = timezone.now()
+    columns = ", ".join(
+        connection.ops.quote_name(Attendee._meta.get_field(name).column)
+        for name in COPY_FIELDS
+    )
+    sql = (
+        f"COPY {connection.ops.quote_name(Attendee._meta.db_table)} ({columns}) "
+        "FROM STDIN WITH (FORMAT csv)"
+    )
+
+    with connection.cursor() as cursor:
+        for chunk in chunks(attendees, IMPORT_CHUNK_SIZE):
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for attendee in chunk:
+                writer.writerow(
+                    [
+                        attendee.user_id,
+                        attendee.events_id,
+                        "" if attendee.has_attended is None else attendee.has_attended,
+                        attendee.ticket_code,
+                        now.isoformat(),
+                        now.isoformat(),
+                    ]
+                )
+            buffer.seek(0)
+            cursor.copy_expert(sql, buffer)
+
+
+def insert_attendees(
+    attendees: Sequence[Attendee], using: Optional[str] = None
+) -> None:
+    """Save the attendees and refresh the counters of their events and users.
+
+    The new attendees are written with ``COPY`` on PostgreSQL and with
+    ``bulk_create`` in chunks elsewhere, the existing ones get their
+    ``has_attended`` updated. Like ``bulk_create`` it skips the signals of
+    the attendees. The events are locked while the seats are checked
+    again, a sign up could have taken one since the file was validated.
+
+    Args:
+        attendees: The attendees, the existing ones with a primary key.
+        using: The database alias.
+
+    Raises:
+        ValidationError: If an event has fewer seats left than new attendees.
+    """
+    using = using or DEFAULT_DB_ALIAS
+    connection = connections[using]
+    new = [attendee for attendee in attendees if attendee.pk is None]
+    existing = [attendee for attendee in attendees if attendee.pk is not None]
+    requested = Counter(attendee.events_id for attendee in new)
+
+    with transaction.atomic(using=using):
+        events = (
+            Event.objects.using(using)
+            .select_for_update()
+            .filter(pk__in=requested)
+            .values_list("title", "total_guest", "attendees_count", "pk")
+        )
+        full = [
+            title for title, total, count, pk in events if count + requested[pk] > total
+        ]
+        if full:
+            raise ValidationError(
+                _("Not enough seats left on %(events)s"),
+                params={"events": ", ".join(sorted(full))},
+            )
+
+        if connection.vendor == "postgresql":
+            copy_attendees(new, using)
+        else:
+            fields = [Attendee._meta.get_field(name) for name in COPY_FIELDS]
+            batch_size = connection.ops.bulk_batch_size(fields, new)
+            Attendee.objects.using(using).bulk_create(
+                new, batch_size=min(IMPORT_CHUNK_SIZE, max(batch_size, 1))
+            )
+
+        now = timezone.now()
+        for attendee in existing:
+            attendee.updated_at = now
+        Attendee.objects.using(using).bulk_update(
+            existing, ["has_attended", "updated_at"], batch_size=IMPORT_CHUNK_SIZE
+        )
+
+        Event.objects.using(using).filter(
+            pk__in={attendee.events_id for attendee in attendees}
+        ).refresh_counters()
+
+        UserStats.objects.using(using).refresh(
+            {attendee.user_id for attendee in new if attendee.has_attended}
+            | {attendee.user_id for attendee in existing},
+            "attended_events_count",
+        )
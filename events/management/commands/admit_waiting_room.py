@@ -0,0 +1,40 @@
+"""Command to admit the users waiting to sign up to events."""
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from events.waiting_room import admit_all
+
+
+class Command(BaseCommand):
+    """Drain the waiting rooms in FIFO batches."""
+
+    help = "Admit the users waiting in the waiting rooms against the free seats."
+
+    def add_arguments(self: "Command", parser: CommandParser) -> None:
+        """Arguments of the command."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Maximum number of users admitted at once per event.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Keep running and admit every given number of seconds.",
+        )
+
+    def handle(self: "Command", *args: Any, **options: Any) -> None:
+        """Admit once, or forever when an interval is given."""
+        while True:
+            admitted = admit_all(batch_size=options["batch_size"])
+
+            if admitted:
+                self.stdout.write(self.style.SUCCESS(f"Admitted {admitted} users."))
+
+            if not options["interval"]:
+                break
+
+            time.sleep(options["interval"])
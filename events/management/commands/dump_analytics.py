@@ -0,0 +1,139 @@
+"""Command to dump the events tables for analytics."""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+import django
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
+from django.utils import timezone
+from events.analytics import TABLES, dump_table, read_watermarks, write_run
+
+
+class Command(BaseCommand):
+    """Write a consistent snapshot of the tables to partitioned files."""
+
+    help = (
+        "Dump events, attendees, sessions, tags and users to compressed json "
+        "lines files partitioned by event month. An incremental run also "
+        "lists the ids of the rows, the deleted rows are the missing ones."
+    )
+
+    def add_arguments(self: "Command", parser: CommandParser) -> None:
+        """Arguments of the command."""
+        parser.add_argument("output", help="The output directory.")
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only dump the rows changed since the last run of each table.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of tables dumped at once in worker processes.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Number of rows read and written at once.",
+        )
+        parser.add_argument(
+            "--table",
+            action="append",
+            choices=sorted(TABLES),
+            help="Only dump the given tables, all by default.",
+        )
+
+    def handle(self: "Command", *args: Any, **options: Any) -> None:
+        """Dump every table inside one snapshot, then move their watermarks.
+
+        On PostgreSQL the snapshot of a repeatable read transaction is
+        exported and imported by the workers. Elsewhere the rows changed
+        after the start of the run are left to the next one. Every table
+        has its own watermark, only the dumped tables move theirs.
+
+        Args:
+            args: The positional arguments.
+            options: The options of the command.
+
+        Raises:
+            CommandError: If the number of workers is not positive.
+        """
+        if options["workers"] < 1:
+            raise CommandError("--workers must be positive.")
+
+        output = options["output"]
+        names = options["table"] or list(TABLES)
+        watermarks = read_watermarks(output) if options["incremental"] else {}
+        since = {name: watermarks.get(name) for name in names}
+
+        with transaction.atomic():
+            snapshot: Optional[str] = None
+            until = timezone.now()
+
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                    cursor.execute("SELECT pg_export_snapshot(), now()")
+                    snapshot, until = cursor.fetchone()
+
+            run_id = f"{until:%Y%m%dT%H%M%S%f}"
+            tasks = {
+                name: dict(
+                    name=name,
+                    output=output,
+                    run_id=run_id,
+                    since=since[name],
+                    until=until,
+                    chunk_size=options["chunk_size"],
+                )
+                for name in names
+            }
+
+            if options["workers"] == 1:
+                # Already inside the snapshot.
+                rows = {
+                    name: dump_table(snapshot=None, **task)
+                    for name, task in tasks.items()
+                }
+            else:
+                rows = self.dump_in_workers(tasks, snapshot, options["workers"])
+
+        write_run(output=output, run_id=run_id, since=since, until=until, rows=rows)
+
+        for name in names:
+            self.stdout.write(f"{name}: {rows[name]} rows")
+
+        self.stdout.write(self.style.SUCCESS(f"Dumped the tables up to {until}."))
+
+    def dump_in_workers(
+        self: "Command",
+        tasks: Dict[str, Dict[str, Any]],
+        snapshot: Optional[str],
+        workers: int,
+    ) -> Dict[str, int]:
+        """Dump the tables in parallel, one worker process per table.
+
+        The workers are spawned so they don't share the connection holding
+        the snapshot open.
+
+        Args:
+            tasks: The arguments of ``dump_table`` per table.
+            snapshot: The id of the exported snapshot.
+            workers: Number of worker processes.
+
+        Returns:
+            The number of dumped rows per table.
+        """
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=django.setup,
+        ) as executor:
+            futures = {
+                name: executor.submit(dump_table, snapshot=snapshot, **task)
+                for name, task in tasks.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
@@ -0,0 +1,92 @@
+"""Command to rebuild the map clusters."""
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.utils import timezone
+from events.models import Event, EventMapCell
+from events.utils import build_map_cells
+
+
+class Command(BaseCommand):
+    """Aggregate again the upcoming events into the map cells."""
+
+    help = "Rebuild the map cells of the upcoming events and drop the past ones."
+
+    def add_arguments(self: "Command", parser: CommandParser) -> None:
+        """Arguments of the command."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of cells inserted at once.",
+        )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Only drop the cells of the past days.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Keep running and prune every given number of seconds.",
+        )
+
+    def handle(self: "Command", *args: Any, **options: Any) -> None:
+        """Rebuild or prune once, or prune forever when an interval is given."""
+        if not options["prune"]:
+            self.rebuild(options["batch_size"])
+            return
+
+        while True:
+            pruned, _ = EventMapCell.objects.filter(
+                day__lt=timezone.localdate()
+            ).delete()
+
+            if pruned:
+                self.stdout.write(self.style.SUCCESS(f"Pruned {pruned} map cells."))
+
+            if not options["interval"]:
+                break
+
+            time.sleep(options["interval"])
+
+    def rebuild(self: "Command", batch_size: int) -> None:
+        """Replace all the cells in one transaction.
+
+        Args:
+            batch_size: Number of cells inserted at once.
+        """
+        events = Event.objects.filter(
+            event_date__date__gte=timezone.localdate(),
+            latitude__isnull=False,
+            longitude__isnull=False,
+        ).values_list("latitude", "longitude", "event_date")
+
+        with transaction.atomic():
+            cells = build_map_cells(events=events.iterator())
+
+            EventMapCell.objects.all().delete()
+            EventMapCell.objects.bulk_create(
+                [
+                    EventMapCell(
+                        zoom=zoom,
+                        x=x,
+                        y=y,
+                        day=day,
+                        count=count,
+                        latitude_sum=latitude_sum,
+                        longitude_sum=longitude_sum,
+                    )
+                    for (zoom, x, y, day), (
+                        count,
+                        latitude_sum,
+                        longitude_sum,
+                    ) in cells.items()
+                ],
+                batch_size=batch_size,
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(cells)} map cells."))
@@ -0,0 +1,48 @@
+"""Command to rebuild the full-text search index."""
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from events.models import Event, Session
+from events.search import get_backend
+
+
+class Command(BaseCommand):
+    """Index again all the events and sessions."""
+
+    help = "Rebuild the full-text search index of events and sessions."
+
+    def add_arguments(self: "Command", parser: CommandParser) -> None:
+        """Arguments of the command."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of rows indexed at once.",
+        )
+
+    def handle(self: "Command", *args: Any, **options: Any) -> None:
+        """Walk the tables by primary key and index them chunk by chunk."""
+        backend = get_backend()
+
+        for model in (Event, Session):
+            last_pk = 0
+            total = 0
+
+            while True:
+                pks = list(
+                    model.objects.filter(pk__gt=last_pk)
+                    .order_by("pk")
+                    .values_list("pk", flat=True)[: options["chunk_size"]]
+                )
+                if not pks:
+                    break
+
+                backend.index_queryset(model.objects.filter(pk__in=pks))
+                last_pk = pks[-1]
+                total += len(pks)
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Indexed {total} {model._meta.verbose_name_plural}."
+                )
+            )
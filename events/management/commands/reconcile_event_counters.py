@@ -0,0 +1,63 @@
+"""Command to repair drift in the event counters."""
+from functools import reduce
+from operator import or_
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models import F, Q
+from events.counters import COUNTERS
+from events.models import Event, counter_subquery
+
+
+class Command(BaseCommand):
+    """Recompute the event counters that drifted from the related rows."""
+
+    help = "Recompute the denormalized attendee and session counters of events."
+
+    def add_arguments(self: "Command", parser: CommandParser) -> None:
+        """Arguments of the command."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of events checked in a single transaction.",
+        )
+
+    def handle(self: "Command", *args: Any, **options: Any) -> None:
+        """Walk the events by primary key and repair them chunk by chunk."""
+        chunk_size = options["chunk_size"]
+
+        live = {f"live_{name}": counter_subquery(name) for name in COUNTERS}
+        drifted = reduce(or_, (~Q(**{name: F(f"live_{name}")}) for name in COUNTERS))
+
+        last_pk = 0
+        checked = 0
+        repaired = 0
+
+        while True:
+            pks = list(
+                Event.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:chunk_size]
+            )
+            if not pks:
+                break
+
+            with transaction.atomic():
+                stale = list(
+                    Event.objects.filter(pk__in=pks)
+                    .annotate(**live)
+                    .filter(drifted)
+                    .values_list("pk", flat=True)
+                )
+                if stale:
+                    Event.objects.filter(pk__in=stale).refresh_counters()
+
+            last_pk = pks[-1]
+            checked += len(pks)
+            repaired += len(stale)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Checked {checked} events, repaired {repaired}.")
+        )
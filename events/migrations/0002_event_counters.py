@@ -0,0 +1,100 @@
+# Generated by Django 3.0.14 on 2026-10-17 04:26
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+COUNTERS = {
+    'attendees_count': ('attendees', {}),
+    'attended_count': ('attendees', {'has_attended': True}),
+    'not_attended_count': ('attendees', {'has_attended': False}),
+    'sessions_count': ('sessions', {}),
+    'draft_sessions_count': ('sessions', {'status': 'Draft'}),
+    'accepted_sessions_count': ('sessions', {'status': 'Accepted'}),
+    'denied_sessions_count': ('sessions', {'status': 'Denied'}),
+    'talk_count': ('sessions', {'session_type': 'Talk', 'status': 'Accepted'}),
+    'lighting_talk_count': ('sessions', {'session_type': 'Lighting Talk', 'status': 'Accepted'}),
+    'workshop_count': ('sessions', {'session_type': 'WorkShop', 'status': 'Accepted'}),
+}
+
+
+def fill_counters(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    related = {
+        'attendees': apps.get_model('events', 'Attendee'),
+        'sessions': apps.get_model('events', 'Session'),
+    }
+
+    counters = {}
+    for name, (related_name, lookups) in COUNTERS.items():
+        rows = (
+            related[related_name].objects.filter(events=OuterRef('pk'), **lookups)
+            .order_by()
+            .values('events')
+            .annotate(total=Count('pk'))
+            .values('total')
+        )
+        counters[name] = Coalesce(Subquery(rows, output_field=models.IntegerField()), 0)
+
+    Event.objects.update(**counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='accepted_sessions_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='accepted sessions count'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='attended_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='attended count'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='attendees_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='attendees count'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='denied_sessions_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='denied sessions count'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='draft_sessions_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='draft sessions count'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='lighting_talk_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='lighting talk count'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='not_attended_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='not attended count'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='sessions_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='sessions count'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='talk_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='talk count'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='workshop_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='workshop count'),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.0.14 on 2026-10-17 04:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_event_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['event_date', 'id'], name='event_date_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['total_guest', 'id'], name='event_total_guest_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['read_time', 'id'], name='event_read_time_id_idx'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 3.0.14 on 2026-10-17 04:32
+
+from django.conf import settings
+import django.contrib.postgres.search
+from django.db import migrations
+
+TABLES = ('events_event', 'events_session')
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    for table in TABLES:
+        if vendor == 'postgresql':
+            schema_editor.execute(
+                f"UPDATE {table} SET search_vector = "
+                f"setweight(to_tsvector(%s::regconfig, coalesce(title, '')), 'A') || "
+                f"setweight(to_tsvector(%s::regconfig, coalesce(description, '')), 'B')",
+                [settings.SEARCH_CONFIG, settings.SEARCH_CONFIG],
+            )
+            schema_editor.execute(
+                f"CREATE INDEX {table}_search_idx ON {table} USING gin (search_vector)"
+            )
+
+        elif vendor == 'sqlite':
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE {table}_fts USING fts5"
+                f"(title, description, tokenize = 'porter unicode61')"
+            )
+            schema_editor.execute(
+                f"INSERT INTO {table}_fts (rowid, title, description) "
+                f"SELECT id, title, description FROM {table}"
+            )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    for table in TABLES:
+        if vendor == 'postgresql':
+            schema_editor.execute(f"DROP INDEX IF EXISTS {table}_search_idx")
+
+        elif vendor == 'sqlite':
+            schema_editor.execute(f"DROP TABLE IF EXISTS {table}_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_event_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='search vector'),
+        ),
+        migrations.AddField(
+            model_name='session',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='search vector'),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
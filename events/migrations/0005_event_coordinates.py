@@ -0,0 +1,41 @@
+# Generated by Django 3.0.14 on 2026-10-17 04:33
+
+from django.db import migrations, models
+
+from events.utils import get_coordinates
+
+
+def fill_coordinates(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+
+    for event in Event.objects.only('pk', 'geom').iterator():
+        coordinates = get_coordinates(geom=event.geom)
+        if coordinates:
+            Event.objects.filter(pk=event.pk).update(
+                latitude=coordinates[0], longitude=coordinates[1]
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='latitude',
+            field=models.FloatField(editable=False, null=True, verbose_name='latitude'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='longitude',
+            field=models.FloatField(editable=False, null=True, verbose_name='longitude'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['latitude', 'longitude'], name='event_lat_lng_idx'),
+        ),
+        migrations.RunPython(fill_coordinates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 3.0.14 on 2026-10-17 04:35
+
+from django.db import migrations, models
+from django.utils import timezone
+
+from events.utils import build_map_cells
+
+
+def fill_map_cells(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    EventMapCell = apps.get_model('events', 'EventMapCell')
+
+    events = Event.objects.filter(
+        event_date__date__gte=timezone.localdate(),
+        latitude__isnull=False,
+        longitude__isnull=False,
+    ).values_list('latitude', 'longitude', 'event_date')
+
+    cells = build_map_cells(events=events.iterator())
+    EventMapCell.objects.bulk_create(
+        [
+            EventMapCell(
+                zoom=zoom,
+                x=x,
+                y=y,
+                day=day,
+                count=count,
+                latitude_sum=latitude_sum,
+                longitude_sum=longitude_sum,
+            )
+            for (zoom, x, y, day), (count, latitude_sum, longitude_sum) in cells.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_event_coordinates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventMapCell',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('zoom', models.PositiveSmallIntegerField(verbose_name='zoom')),
+                ('x', models.IntegerField(verbose_name='x')),
+                ('y', models.IntegerField(verbose_name='y')),
+                ('day', models.DateField(verbose_name='day')),
+                ('count', models.IntegerField(default=0, verbose_name='count')),
+                ('latitude_sum', models.FloatField(default=0, verbose_name='latitude sum')),
+                ('longitude_sum', models.FloatField(default=0, verbose_name='longitude sum')),
+            ],
+            options={
+                'verbose_name': 'event map cell',
+                'verbose_name_plural': 'event map cells',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='eventmapcell',
+            constraint=models.UniqueConstraint(fields=('zoom', 'x', 'y', 'day'), name='event_map_cell_unique'),
+        ),
+        migrations.RunPython(fill_map_cells, migrations.RunPython.noop),
+    ]
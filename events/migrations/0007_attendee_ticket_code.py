@@ -0,0 +1,42 @@
+# Generated by Django 3.0.14 on 2026-10-17 04:41
+
+from django.db import migrations, models
+
+from events.utils import random_string
+
+
+def fill_ticket_codes(apps, schema_editor):
+    Attendee = apps.get_model('events', 'Attendee')
+
+    codes = set()
+    attendees = []
+    for attendee in Attendee.objects.only('pk').iterator():
+        code = random_string(size=12)
+        while code in codes:
+            code = random_string(size=12)
+        codes.add(code)
+        attendee.ticket_code = code
+        attendees.append(attendee)
+
+    Attendee.objects.bulk_update(attendees, ['ticket_code'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_event_map_cells'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendee',
+            name='ticket_code',
+            field=models.CharField(editable=False, max_length=16, null=True, verbose_name='ticket code'),
+        ),
+        migrations.RunPython(fill_ticket_codes, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='attendee',
+            name='ticket_code',
+            field=models.CharField(editable=False, max_length=16, unique=True, verbose_name='ticket code'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 3.0.14 on 2026-10-17 04:41
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicates(apps, schema_editor):
+    Attendee = apps.get_model('events', 'Attendee')
+    Event = apps.get_model('events', 'Event')
+
+    duplicates = (
+        Attendee.objects.values('user', 'events')
+        .annotate(first=Min('pk'), total=Count('pk'))
+        .filter(total__gt=1)
+    )
+
+    events = set()
+    for duplicate in duplicates:
+        rows = Attendee.objects.filter(
+            user=duplicate['user'], events=duplicate['events']
+        )
+        if rows.filter(has_attended=True).exists():
+            rows.filter(pk=duplicate['first']).update(has_attended=True)
+        rows.exclude(pk=duplicate['first']).delete()
+        events.add(duplicate['events'])
+
+    for event in events:
+        attendees = Attendee.objects.filter(events=event)
+        Event.objects.filter(pk=event).update(
+            attendees_count=attendees.count(),
+            attended_count=attendees.filter(has_attended=True).count(),
+            not_attended_count=attendees.filter(has_attended=False).count(),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_attendee_ticket_code'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='attendee',
+            constraint=models.UniqueConstraint(fields=('user', 'events'), name='attendee_user_event_unique'),
+        ),
+    ]
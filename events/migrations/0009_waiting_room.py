@@ -0,0 +1,45 @@
+# Generated by Django 3.0.14 on 2026-10-17 04:42
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('events', '0008_attendee_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='waiting_room',
+            field=models.BooleanField(default=False, verbose_name='waiting room'),
+        ),
+        migrations.CreateModel(
+            name='QueueEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(editable=False, max_length=32, unique=True, verbose_name='token')),
+                ('status', models.CharField(choices=[('Waiting', 'Waiting'), ('Admitted', 'Admitted'), ('Rejected', 'Rejected')], default='Waiting', max_length=10, verbose_name='status')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('events', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='queue_entries', to='events.Event', verbose_name='events')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='queue_entries', to=settings.AUTH_USER_MODEL, verbose_name='user')),
+            ],
+            options={
+                'verbose_name': 'queue entry',
+                'verbose_name_plural': 'queue entries',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='queueentry',
+            index=models.Index(fields=['events', 'status', 'id'], name='queue_entry_event_status_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='queueentry',
+            constraint=models.UniqueConstraint(fields=('user', 'events'), name='queue_entry_user_event_unique'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.0.14 on 2026-10-17 04:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0009_waiting_room'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['events', 'status', 'title'], name='session_event_status_title_idx'),
+        ),
+    ]
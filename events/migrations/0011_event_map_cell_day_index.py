@@ -0,0 +1,21 @@
+# Generated by Django 3.0.14 on 2026-10-17 05:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_session_status_index'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='eventmapcell',
+            name='event_map_cell_unique',
+        ),
+        migrations.AddConstraint(
+            model_name='eventmapcell',
+            constraint=models.UniqueConstraint(fields=('zoom', 'day', 'x', 'y'), name='event_map_cell_unique'),
+        ),
+    ]
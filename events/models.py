@@ -1,14 +1,73 @@
 """Collection of model."""
-from typing import Any
+import math
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List
 
 from django.conf import settings
-from django.db import models
-from django.db.models.signals import pre_save
+from django.contrib.postgres.search import SearchVectorField
+from django.db import IntegrityError, models, transaction
+from django.db.models import (
+    BooleanField,
+    Case,
+    Count,
+    Exists,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import ASin, Coalesce, Cos, Power, Radians, Sin, Sqrt
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_save,
+)
 from django.dispatch import receiver
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from djgeojson.fields import PointField
 
-from .utils import get_read_time, unique_slug
+from users.counters import user_counters
+from users.models import UserStats
+from .counters import (
+    COUNTERS,
+    counter_fields,
+    counters_delta,
+    counters_for,
+    negate,
+)
+from .search import get_backend
+from .utils import (
+    SLUG_ATTEMPTS,
+    LRUCache,
+    allocate_slugs,
+    get_coordinates,
+    get_read_time,
+    random_string,
+)
+
+EARTH_RADIUS = 6371.0088
+
+KM_PER_DEGREE = math.pi * EARTH_RADIUS / 180
+
+TICKET_CODE_SIZE = 12
+
+QUEUE_TOKEN_SIZE = 32
+
+# Ids of the tags by name, shared by the requests served by this process.
+# Their version is kept in a cache shared by the processes, so a deleted or
+# renamed tag is dropped by all of them.
+tag_ids = LRUCache(
+    max_size=getattr(settings, "TAG_ID_CACHE_SIZE", 1000),
+    timeout=getattr(settings, "TAG_ID_CACHE_TIMEOUT", 60 * 5),
+    version_key="events:tag-ids:version",
+    cache_alias=getattr(settings, "TAG_ID_VERSION_CACHE", "default"),
+)
 
 
 def event_upload_to(instance: "Event", filename: str) -> str:
@@ -24,11 +83,302 @@ def event_upload_to(instance: "Event", filename: str) -> str:
     return f"images/events/cover/{instance.title}/{filename}"
 
 
+def counter_subquery(name: str) -> Coalesce:
+    """Build a correlated subquery counting the rows behind a counter.
+
+    Args:
+        name: The counter column name.
+
+    Returns:
+        An expression that can be used inside annotate or update.
+    """
+    related_name, lookups = COUNTERS[name]
+    model = Event._meta.get_field(related_name).related_model
+    rows = (
+        model.objects.filter(events=OuterRef("pk"), **lookups)
+        .order_by()
+        .values("events")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(rows, output_field=models.IntegerField()), 0)
+
+
+def save_allocating_slug(instance: models.Model, save: Callable[[], None]) -> None:
+    """Save an instance, allocating a new slug if another insert took it.
+
+    The slug allocated in ``pre_save`` is only checked against the rows
+    committed so far, a concurrent insert can still take it first. The
+    save then runs again with a fresh slug.
+
+    Args:
+        instance: The event or session to save.
+        save: Saves the instance.
+
+    Raises:
+        IntegrityError: If the save fails for another reason.
+    """
+    manager = type(instance)._default_manager
+
+    for attempt in range(SLUG_ATTEMPTS):
+        instance._slug_allocated = False
+        try:
+            with transaction.atomic(using=manager.db):
+                save()
+            return
+
+        except IntegrityError:
+            if (
+                not instance._slug_allocated
+                or attempt == SLUG_ATTEMPTS - 1
+                or not manager.filter(slug=instance.slug).exists()
+            ):
+                raise
+
+            instance.slug = ""
+
+
+class EventQuerySet(models.QuerySet):
+    """Custom queryset for event model."""
+
+    def apply_counters(self: "EventQuerySet", delta: Dict[str, int]) -> int:
+        """Atomically add a delta to the counters of the events.
+
+        ``updated_at`` is bumped as well since the counters are part of the
+        rendered event.
+
+        Args:
+            delta: The counter changes.
+
+        Returns:
+            The number of updated rows.
+        """
+        if not delta:
+            return 0
+
+        return self.update(
+            updated_at=timezone.now(),
+            **{name: F(name) + value for name, value in delta.items()},
+        )
+
+    def refresh_counters(self: "EventQuerySet") -> int:
+        """Recompute the counters of the events from the related rows.
+
+        ``updated_at`` is bumped as well.
+
+        Returns:
+            The number of updated rows.
+        """
+        return self.update(
+            updated_at=timezone.now(),
+            **{name: counter_subquery(name) for name in COUNTERS},
+        )
+
+    def with_viewer(self: "EventQuerySet", user: Any) -> "EventQuerySet":
+        """Annotate the relationship of a user with every event.
+
+        ``has_sign_up`` is True when the user is an attendee and ``is_stuff``
+        when the user is the host or an organizer. Both are ``EXISTS``
+        subqueries evaluated in the same SELECT.
+
+        Args:
+            user: The user of the request, can be anonymous.
+
+        Returns:
+            The annotated queryset.
+        """
+        if not user.is_authenticated:
+            return self.annotate(
+                has_sign_up=Value(False, output_field=BooleanField()),
+                is_stuff=Value(False, output_field=BooleanField()),
+            )
+
+        organizers = Event.organizers.through.objects.filter(
+            event=OuterRef("pk"),
+            **{Event.organizers.field.m2m_reverse_field_name(): user},
+        )
+
+        return self.annotate(
+            has_sign_up=Exists(
+                Attendee.objects.filter(events=OuterRef("pk"), user=user)
+            ),
+            is_stuff=Case(
+                When(hosted_by=user, then=Value(True)),
+                default=Exists(organizers),
+                output_field=BooleanField(),
+            ),
+        )
+
+    def nearby(
+        self: "EventQuerySet", *, latitude: float, longitude: float, radius: float
+    ) -> "EventQuerySet":
+        """Filter the events in a radius and annotate their distance.
+
+        The indexed bounding box of the circle is used as a prefilter, the
+        haversine distance is then only computed for the rows inside it.
+
+        Args:
+            latitude: Latitude of the center in degrees.
+            longitude: Longitude of the center in degrees.
+            radius: Radius in kilometers.
+
+        Returns:
+            The events ordered by ``distance`` in kilometers.
+        """
+        delta_latitude = radius / KM_PER_DEGREE
+        min_latitude = max(latitude - delta_latitude, -90.0)
+        max_latitude = min(latitude + delta_latitude, 90.0)
+        box = Q(latitude__gte=min_latitude, latitude__lte=max_latitude)
+
+        cos_latitude = math.cos(math.radians(latitude))
+        if min_latitude > -90 and max_latitude < 90 and cos_latitude > 0:
+            delta_longitude = min(delta_latitude / cos_latitude, 180.0)
+            west, east = longitude - delta_longitude, longitude + delta_longitude
+
+            if west < -180:
+                box &= Q(longitude__gte=west + 360) | Q(longitude__lte=east)
+            elif east > 180:
+                box &= Q(longitude__gte=west) | Q(longitude__lte=east - 360)
+            else:
+                box &= Q(longitude__gte=west, longitude__lte=east)
+
+        latitude_sin = Power(Sin(Radians(F("latitude") - Value(latitude)) / 2), 2)
+        longitude_sin = Power(Sin(Radians(F("longitude") - Value(longitude)) / 2), 2)
+        half_chord = (
+            latitude_sin
+            + Value(cos_latitude) * Cos(Radians(F("latitude"))) * longitude_sin
+        )
+        distance = Value(2 * EARTH_RADIUS) * ASin(Sqrt(half_chord))
+
+        return (
+            self.filter(box)
+            .annotate(distance=ExpressionWrapper(distance, output_field=FloatField()))
+            .filter(distance__lte=radius)
+            .order_by("distance", "pk")
+        )
+
+    def within(
+        self: "EventQuerySet", *, west: float, south: float, east: float, north: float,
+    ) -> "EventQuerySet":
+        """Filter the events inside a bounding box.
+
+        When ``west`` is greater than ``east`` the box crosses the antimeridian.
+
+        Args:
+            west: Minimum longitude in degrees.
+            south: Minimum latitude in degrees.
+            east: Maximum longitude in degrees.
+            north: Maximum latitude in degrees.
+
+        Returns:
+            The filtered queryset.
+        """
+        box = Q(latitude__gte=south, latitude__lte=north)
+
+        if west <= east:
+            box &= Q(longitude__gte=west, longitude__lte=east)
+        else:
+            box &= Q(longitude__gte=west) | Q(longitude__lte=east)
+
+        return self.filter(box)
+
+
+class EventRelatedQuerySet(models.QuerySet):
+    """Queryset for models that feed the event counters."""
+
+    def update(self: "EventRelatedQuerySet", **kwargs: Any) -> int:
+        """Update the rows and refresh the counters of the affected events.
+
+        The stats of the affected users are refreshed as well. Like
+        ``save``, the update bumps ``updated_at``.
+
+        Args:
+            kwargs: The fields to update.
+
+        Returns:
+            The number of updated rows.
+        """
+        kwargs.setdefault("updated_at", timezone.now())
+        stats = user_counters(label=self.model._meta.label)
+
+        with transaction.atomic(using=self.db):
+            event_ids = set(self.values_list("events", flat=True).distinct())
+            user_ids = {
+                field: set(self.values_list(field, flat=True).distinct())
+                for field in stats
+            }
+            rows = super().update(**kwargs)
+
+            new_event = kwargs.get("events", kwargs.get("events_id"))
+            if new_event is not None:
+                event_ids.add(getattr(new_event, "pk", new_event))
+
+            if event_ids:
+                Event.objects.filter(pk__in=event_ids).refresh_counters()
+
+            for field, names in stats.items():
+                new_user = kwargs.get(field, kwargs.get(f"{field}_id"))
+                if new_user is not None:
+                    user_ids[field].add(getattr(new_user, "pk", new_user))
+
+                UserStats.objects.using(self.db).refresh(user_ids[field], *names)
+
+        return rows
+
+    def touch(self: "EventRelatedQuerySet") -> int:
+        """Bump ``updated_at`` of the rows, the counters are left as they are.
+
+        Returns:
+            The number of updated rows.
+        """
+        return super().update(updated_at=timezone.now())
+
+
+class TagQuerySet(models.QuerySet):
+    """Custom queryset for tag model."""
+
+    def resolve_ids(self: "TagQuerySet", names: Iterable[str]) -> List[int]:
+        """Get the ids of tags by name, creating the missing ones.
+
+        The names are lower cased. The ids are looked up in ``tag_ids``
+        first, the others are read with one query and the missing tags
+        are inserted with one more, ignoring the ones a concurrent request
+        created in the meantime, before reading them back. The ids read
+        from the database are only cached once the transaction commits.
+
+        Args:
+            names: The tag names.
+
+        Returns:
+            The ids in the same order as the names, without duplicates.
+        """
+        names = list(dict.fromkeys(name.lower() for name in names))
+        ids = tag_ids.get_many(names)
+        missing = [name for name in names if name not in ids]
+
+        if missing:
+            found = dict(self.filter(name__in=missing).values_list("name", "pk"))
+            new = [name for name in missing if name not in found]
+
+            if new:
+                self.bulk_create(
+                    [Tag(name=name) for name in new], ignore_conflicts=True
+                )
+                found.update(self.filter(name__in=new).values_list("name", "pk"))
+
+            transaction.on_commit(partial(tag_ids.set_many, found), using=self.db)
+            ids.update(found)
+
+        return [ids[name] for name in names]
+
+
 class Tag(models.Model):
     """Reference tag model."""
 
     name = models.CharField(verbose_name=_("name"), max_length=200, unique=True)
 
+    objects = TagQuerySet.as_manager()
+
     class Meta:
         """Meta data."""
 
@@ -93,6 +443,60 @@ class Event(models.Model):
 
     geom = PointField(verbose_name=_("geo location"))
 
+    waiting_room = models.BooleanField(verbose_name=_("waiting room"), default=False)
+
+    attendees_count = models.IntegerField(
+        verbose_name=_("attendees count"), default=0, editable=False
+    )
+
+    attended_count = models.IntegerField(
+        verbose_name=_("attended count"), default=0, editable=False
+    )
+
+    not_attended_count = models.IntegerField(
+        verbose_name=_("not attended count"), default=0, editable=False
+    )
+
+    sessions_count = models.IntegerField(
+        verbose_name=_("sessions count"), default=0, editable=False
+    )
+
+    draft_sessions_count = models.IntegerField(
+        verbose_name=_("draft sessions count"), default=0, editable=False
+    )
+
+    accepted_sessions_count = models.IntegerField(
+        verbose_name=_("accepted sessions count"), default=0, editable=False
+    )
+
+    denied_sessions_count = models.IntegerField(
+        verbose_name=_("denied sessions count"), default=0, editable=False
+    )
+
+    talk_count = models.IntegerField(
+        verbose_name=_("talk count"), default=0, editable=False
+    )
+
+    lighting_talk_count = models.IntegerField(
+        verbose_name=_("lighting talk count"), default=0, editable=False
+    )
+
+    workshop_count = models.IntegerField(
+        verbose_name=_("workshop count"), default=0, editable=False
+    )
+
+    search_vector = SearchVectorField(
+        verbose_name=_("search vector"), null=True, editable=False
+    )
+
+    latitude = models.FloatField(verbose_name=_("latitude"), null=True, editable=False)
+
+    longitude = models.FloatField(
+        verbose_name=_("longitude"), null=True, editable=False
+    )
+
+    objects = EventQuerySet.as_manager()
+
     class Meta:
         """Meta data."""
 
@@ -100,55 +504,80 @@ class Event(models.Model):
 
         verbose_name_plural = _("events")
 
+        indexes = [
+            models.Index(fields=["event_date", "id"], name="event_date_id_idx"),
+            models.Index(fields=["total_guest", "id"], name="event_total_guest_id_idx"),
+            models.Index(fields=["read_time", "id"], name="event_read_time_id_idx"),
+            models.Index(fields=["latitude", "longitude"], name="event_lat_lng_idx"),
+        ]
+
     def __str__(self: "Event") -> str:
         """It return readable name for the model."""
         return f"{self.title}"
 
+    def save(self: "Event", *args: Any, **kwargs: Any) -> None:
+        """Save the event without overwriting the counters.
+
+        The counters are only changed through ``EventQuerySet.apply_counters``
+        and ``EventQuerySet.refresh_counters``, so a plain save of an existing
+        event must not write back the values it loaded earlier.
+
+        Args:
+            args: Positional arguments for ``Model.save``.
+            kwargs: Keyword arguments for ``Model.save``.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in COUNTERS
+            ]
+
+        save_allocating_slug(self, partial(super().save, *args, **kwargs))
+
     def total_attendees(self: "Event") -> int:
         """Getting total of attendees for the event."""
-        return self.attendees.count()
+        return self.attendees_count
 
     def available_place(self: "Event") -> int:
         """Getting total of available place for the event."""
-        return self.total_guest - self.attendees.count()
+        return self.total_guest - self.attendees_count
 
     def total_attended(self: "Event") -> int:
         """Getting total of people who actual attended for the event."""
-        return self.attendees.filter(has_attended=True).count()
+        return self.attended_count
 
     def total_not_attended(self: "Event") -> int:
         """Getting total of people who didn't attended for the event."""
-        return self.attendees.filter(has_attended=False).count()
+        return self.not_attended_count
 
     def total_sessions(self: "Event") -> int:
         """Getting total of sessions in event."""
-        return self.sessions.count()
+        return self.sessions_count
 
     def total_draft_sessions(self: "Event") -> int:
         """Getting total of draft sessions in event."""
-        return self.sessions.filter(status="Draft").count()
+        return self.draft_sessions_count
 
     def total_accepted_sessions(self: "Event") -> int:
         """Getting total of accepted sessions in event."""
-        return self.sessions.filter(status="Accepted").count()
+        return self.accepted_sessions_count
 
     def total_denied_sessions(self: "Event") -> int:
         """Getting total of denied sessions in event."""
-        return self.sessions.filter(status="Denied").count()
+        return self.denied_sessions_count
 
     def total_talk(self: "Event") -> int:
         """Getting total of talk in event."""
-        return self.sessions.filter(session_type="Talk", status="Accepted").count()
+        return self.talk_count
 
     def total_lighting_talk(self: "Event") -> int:
         """Getting total of lighting talk in event."""
-        return self.sessions.filter(
-            session_type="Lighting Talk", status="Accepted"
-        ).count()
+        return self.lighting_talk_count
 
     def total_workshop(self: "Event") -> int:
         """Getting total of workshop in event."""
-        return self.sessions.filter(session_type="WorkShop", status="Accepted").count()
+        return self.workshop_count
 
     total_sessions.short_description = _("Sessions")
     total_draft_sessions.short_description = _("Draft Sessions")
@@ -162,6 +591,18 @@ class Event(models.Model):
     total_not_attended.short_description = _("Has Not Attended")
     available_place.short_description = _("Available Place")
 
+    total_sessions.admin_order_field = "sessions_count"
+    total_draft_sessions.admin_order_field = "draft_sessions_count"
+    total_accepted_sessions.admin_order_field = "accepted_sessions_count"
+    total_denied_sessions.admin_order_field = "denied_sessions_count"
+    total_talk.admin_order_field = "talk_count"
+    total_lighting_talk.admin_order_field = "lighting_talk_count"
+    total_workshop.admin_order_field = "workshop_count"
+    total_attendees.admin_order_field = "attendees_count"
+    total_attended.admin_order_field = "attended_count"
+    total_not_attended.admin_order_field = "not_attended_count"
+    available_place.admin_order_field = F("total_guest") - F("attendees_count")
+
 
 class Attendee(models.Model):
     """Reference attendee model."""
@@ -186,10 +627,16 @@ class Attendee(models.Model):
         verbose_name=_("has attended"), blank=True, null=True
     )
 
+    ticket_code = models.CharField(
+        verbose_name=_("ticket code"), max_length=16, unique=True, editable=False
+    )
+
     created_at = models.DateTimeField(verbose_name=_("created at"), auto_now_add=True)
 
     updated_at = models.DateTimeField(verbose_name=_("updated at"), auto_now=True)
 
+    objects = EventRelatedQuerySet.as_manager()
+
     class Meta:
         """Meta data."""
 
@@ -197,10 +644,97 @@ class Attendee(models.Model):
 
         verbose_name_plural = _("attendees")
 
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "events"], name="attendee_user_event_unique"
+            )
+        ]
+
     def __str__(self: "Attendee") -> str:
         """It return readable name for the model."""
         return f"{self.user}"
 
+    def save(self: "Attendee", *args: Any, **kwargs: Any) -> None:
+        """Save the attendee and the event counters in one transaction."""
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class QueueEntry(models.Model):
+    """Reference queue entry model.
+
+    A place in the waiting room of an event, admitted in FIFO order.
+    """
+
+    choose_status = (
+        ("Waiting", _("Waiting")),
+        ("Admitted", _("Admitted")),
+        ("Rejected", _("Rejected")),
+    )
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("user"),
+        on_delete=models.CASCADE,
+        related_name="queue_entries",
+        db_index=True,
+    )
+
+    events = models.ForeignKey(
+        Event,
+        verbose_name=_("events"),
+        on_delete=models.CASCADE,
+        related_name="queue_entries",
+        db_index=True,
+    )
+
+    token = models.CharField(
+        verbose_name=_("token"), max_length=32, unique=True, editable=False
+    )
+
+    status = models.CharField(
+        verbose_name=_("status"),
+        max_length=10,
+        choices=choose_status,
+        default="Waiting",
+    )
+
+    created_at = models.DateTimeField(verbose_name=_("created at"), auto_now_add=True)
+
+    updated_at = models.DateTimeField(verbose_name=_("updated at"), auto_now=True)
+
+    class Meta:
+        """Meta data."""
+
+        verbose_name = _("queue entry")
+
+        verbose_name_plural = _("queue entries")
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "events"], name="queue_entry_user_event_unique"
+            )
+        ]
+
+        indexes = [
+            models.Index(
+                fields=["events", "status", "id"], name="queue_entry_event_status_idx"
+            )
+        ]
+
+    def __str__(self: "QueueEntry") -> str:
+        """It return readable name for the model."""
+        return f"{self.user}"
+
+    def position(self: "QueueEntry") -> int:
+        """Getting the place in the queue, starting at one."""
+        if self.status != "Waiting":
+            return 0
+
+        return QueueEntry.objects.filter(
+            events_id=self.events_id, status="Waiting", pk__lte=self.pk
+        ).count()
+
 
 class Session(models.Model):
     """Reference session model."""
@@ -247,10 +781,16 @@ class Session(models.Model):
         db_index=True,
     )
 
+    search_vector = SearchVectorField(
+        verbose_name=_("search vector"), null=True, editable=False
+    )
+
     created_at = models.DateTimeField(verbose_name=_("created at"), auto_now_add=True)
 
     updated_at = models.DateTimeField(verbose_name=_("updated at"), auto_now=True)
 
+    objects = EventRelatedQuerySet.as_manager()
+
     class Meta:
         """Meta data."""
 
@@ -258,23 +798,227 @@ class Session(models.Model):
 
         verbose_name_plural = _("sessions")
 
+        indexes = [
+            models.Index(
+                fields=["events", "status", "title"],
+                name="session_event_status_title_idx",
+            )
+        ]
+
     def __str__(self: "Session") -> str:
         """It return readable name for the model."""
         return f"{self.title}"
 
+    def save(self: "Session", *args: Any, **kwargs: Any) -> None:
+        """Save the session and the event counters in one transaction."""
+        with transaction.atomic():
+            save_allocating_slug(self, partial(super().save, *args, **kwargs))
+
+
+class EventMapCell(models.Model):
+    """Reference event map cell model.
+
+    Precomputed cluster of the events of a day that fall in a cell of the
+    map grid at a zoom level.
+    """
+
+    zoom = models.PositiveSmallIntegerField(verbose_name=_("zoom"))
+
+    x = models.IntegerField(verbose_name=_("x"))
+
+    y = models.IntegerField(verbose_name=_("y"))
+
+    day = models.DateField(verbose_name=_("day"))
+
+    count = models.IntegerField(verbose_name=_("count"), default=0)
+
+    latitude_sum = models.FloatField(verbose_name=_("latitude sum"), default=0)
+
+    longitude_sum = models.FloatField(verbose_name=_("longitude sum"), default=0)
+
+    class Meta:
+        """Meta data."""
+
+        verbose_name = _("event map cell")
+
+        verbose_name_plural = _("event map cells")
+
+        constraints = [
+            # The day comes before the position so the lookups of the map
+            # only walk the index entries of the upcoming days.
+            models.UniqueConstraint(
+                fields=["zoom", "day", "x", "y"], name="event_map_cell_unique"
+            )
+        ]
+
+    def __str__(self: "EventMapCell") -> str:
+        """It return readable name for the model."""
+        return f"{self.zoom}/{self.x}/{self.y} {self.day}"
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def tag_ids_remover(sender: Tag, **kwargs: Any) -> None:
+    """Single for Tag to forget the cached ids after a rename or a delete."""
+    # Dropped in every process once committed, so none caches the old id again.
+    if not kwargs.get("created"):
+        transaction.on_commit(tag_ids.clear, using=kwargs.get("using"))
+
 
 @receiver(pre_save, sender=Session)
 def session_slug_creator(sender: Session, instance: Session, **kwargs: Any) -> None:
     """Single for Session."""
     if not instance.slug:
-        instance.slug = unique_slug(title=instance.title)
+        instance.slug = allocate_slugs(
+            model=sender, titles=[instance.title], using=kwargs.get("using")
+        )[0]
+        instance._slug_allocated = True
+
+    get_backend(kwargs.get("using")).prepare(instance)
+
+
+@receiver(pre_save, sender=Attendee)
+def attendee_ticket_creator(
+    sender: Attendee, instance: Attendee, **kwargs: Any
+) -> None:
+    """Single for Attendee."""
+    if not instance.ticket_code:
+        instance.ticket_code = random_string(size=TICKET_CODE_SIZE)
+
+
+@receiver(pre_save, sender=QueueEntry)
+def queue_token_creator(
+    sender: QueueEntry, instance: QueueEntry, **kwargs: Any
+) -> None:
+    """Single for QueueEntry."""
+    if not instance.token:
+        instance.token = random_string(size=QUEUE_TOKEN_SIZE)
 
 
 @receiver(pre_save, sender=Event)
 def event_creator(sender: Event, instance: Event, **kwargs: Any) -> None:
     """Single for Event."""
     if not instance.slug:
-        instance.slug = unique_slug(title=instance.title)
+        instance.slug = allocate_slugs(
+            model=sender, titles=[instance.title], using=kwargs.get("using")
+        )[0]
+        instance._slug_allocated = True
 
     if instance.description:
         instance.read_time = get_read_time(words=instance.description)
+
+    coordinates = get_coordinates(geom=instance.geom) or (None, None)
+    instance.latitude, instance.longitude = coordinates
+
+    get_backend(kwargs.get("using")).prepare(instance)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_save, sender=Session)
+def search_indexer(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for Event and Session to update the search index."""
+    get_backend(kwargs.get("using")).index(instance)
+
+
+@receiver(post_delete, sender=Event)
+@receiver(post_delete, sender=Session)
+def search_remover(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for Event and Session to remove them from the search index."""
+    get_backend(kwargs.get("using")).remove(instance)
+
+
+@receiver(m2m_changed, sender=Event.organizers.through)
+@receiver(m2m_changed, sender=Event.tags.through)
+def event_touch(
+    sender: Any, instance: Any, action: str, reverse: bool, **kwargs: Any
+) -> None:
+    """Single for Event organizers and tags to bump the event updated_at."""
+    if reverse and action == "pre_clear":
+        field = "organizers" if sender is Event.organizers.through else "tags"
+        Event.objects.filter(**{field: instance}).update(updated_at=timezone.now())
+
+    if not action.startswith("post_"):
+        return
+
+    if not reverse:
+        Event.objects.filter(pk=instance.pk).update(updated_at=timezone.now())
+
+    elif kwargs.get("pk_set"):
+        Event.objects.filter(pk__in=kwargs["pk_set"]).update(updated_at=timezone.now())
+
+
+def _counter_values(instance: Any, fields: Iterable[str]) -> Dict[str, Any]:
+    """Get the values the counters depend on from a model instance."""
+    return {field: getattr(instance, field) for field in fields}
+
+
+@receiver(pre_save, sender=Attendee)
+@receiver(pre_save, sender=Session)
+def counters_snapshot(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for Attendee and Session to remember the stored row."""
+    instance._counters_snapshot = None
+
+    if kwargs.get("raw") or instance.pk is None:
+        return
+
+    related_name = instance._meta.get_field("events").remote_field.related_name
+    fields = counter_fields(related_name=related_name)
+
+    instance._counters_snapshot = (
+        sender.objects.select_for_update()
+        .filter(pk=instance.pk)
+        .values("events_id", *fields)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Attendee)
+@receiver(post_save, sender=Session)
+def counters_updater(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for Attendee and Session to keep the event counters."""
+    if kwargs.get("raw"):
+        return
+
+    related_name = instance._meta.get_field("events").remote_field.related_name
+    fields = counter_fields(related_name=related_name)
+
+    new = counters_for(
+        related_name=related_name, values=_counter_values(instance, fields)
+    )
+
+    snapshot = getattr(instance, "_counters_snapshot", None)
+    instance._counters_snapshot = None
+
+    if snapshot is None:
+        # Counters the caller already incremented, e.g. a claimed seat.
+        claimed = getattr(instance, "_counters_claimed", {})
+        instance._counters_claimed = {}
+
+        delta = counters_delta(old=claimed, new=new)
+        Event.objects.filter(pk=instance.events_id).apply_counters(delta)
+        return
+
+    old = counters_for(related_name=related_name, values=snapshot)
+
+    if snapshot["events_id"] == instance.events_id:
+        delta = counters_delta(old=old, new=new)
+        Event.objects.filter(pk=instance.events_id).apply_counters(delta)
+
+    else:
+        Event.objects.filter(pk=snapshot["events_id"]).apply_counters(
+            negate(counters=old)
+        )
+        Event.objects.filter(pk=instance.events_id).apply_counters(new)
+
+
+@receiver(post_delete, sender=Attendee)
+@receiver(post_delete, sender=Session)
+def counters_remover(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for Attendee and Session to release the event counters."""
+    related_name = instance._meta.get_field("events").remote_field.related_name
+    fields = counter_fields(related_name=related_name)
+
+    old = counters_for(
+        related_name=related_name, values=_counter_values(instance, fields)
+    )
+    Event.objects.filter(pk=instance.events_id).apply_counters(negate(counters=old))
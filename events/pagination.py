@@ -0,0 +1,293 @@
+"""Collection of paginations."""
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections
+from django.db.models import FloatField, Func, Q, QuerySet, Value
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import CursorPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetCursorPagination(CursorPagination):
+    """Cursor pagination keyed on ``(ordering field, id)``.
+
+    DRF's cursor pagination only keeps the position of the ordering field
+    and falls back to an offset for equal values. Here the primary key is
+    always the tiebreak, so every page is a single indexed range scan no
+    matter how deep the client scrolls.
+
+    The ordering comes from the ``OrderingFilter`` of the view, only the
+    first term is used. Sending ``count=approx`` adds an ``approximate_count``
+    to the response.
+    """
+
+    count_query_param = "count"
+
+    approximate_count_cap = 1000
+
+    def paginate_queryset(
+        self: "KeysetCursorPagination",
+        queryset: QuerySet,
+        request: Request,
+        view: Any = None,
+    ) -> Optional[List[Any]]:
+        """Paginate the queryset with a keyset filter.
+
+        Args:
+            queryset: The filtered queryset.
+            request: Request object
+            view: The view that is paginated.
+
+        Returns:
+            The page items.
+        """
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.model = queryset.model
+        self.field, self.descending = self.get_key(request, queryset, view)
+
+        self.approximate_count = None
+        if request.query_params.get(self.count_query_param) == "approx":
+            self.approximate_count = self.get_approximate_count(queryset)
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor["r"])
+
+        descending = self.descending != reverse
+        prefix = "-" if descending else ""
+        queryset = queryset.order_by(f"{prefix}{self.field}", f"{prefix}pk")
+
+        if cursor:
+            queryset = queryset.filter(self.get_keyset_filter(cursor, descending))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = cursor is not None
+            self.has_previous = has_more
+
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = results
+        return results
+
+    def get_key(
+        self: "KeysetCursorPagination", request: Request, queryset: QuerySet, view: Any
+    ) -> Tuple[str, bool]:
+        """Get the field the pages are keyed on.
+
+        Search results are keyed on their rank unless an ordering is asked.
+
+        Args:
+            request: Request object
+            queryset: The filtered queryset.
+            view: The view that is paginated.
+
+        Returns:
+            The field name and if it is ordered descending.
+        """
+        if (
+            "search_rank" in queryset.query.annotations
+            and not request.query_params.get(OrderingFilter.ordering_param)
+        ):
+            return "search_rank", True
+
+        ordering = self.get_ordering(request, queryset, view)[0]
+        return ordering.lstrip("-"), ordering.startswith("-")
+
+    def get_keyset_filter(
+        self: "KeysetCursorPagination", cursor: Dict[str, Any], descending: bool
+    ) -> Q:
+        """Build the filter selecting the rows after the cursor.
+
+        Args:
+            cursor: The decoded cursor.
+            descending: If the rows are walked in descending order.
+
+        Returns:
+            The keyset filter.
+        """
+        lookup = "lt" if descending else "gt"
+        value = self.get_key_value(cursor["v"])
+        return Q(**{f"{self.field}__{lookup}": value}) | Q(
+            **{self.field: value, f"pk__{lookup}": cursor["p"]}
+        )
+
+    def get_key_value(self: "KeysetCursorPagination", value: Any) -> Any:
+        """Get the expression the key field is compared with.
+
+        ``ts_rank`` returns a ``real``, which is read back as a double. The
+        double written to the cursor is not the stored value, so comparing
+        the two could skip or repeat the rows of the boundary. The rank is
+        sent as its text and cast back to ``real`` by the database instead,
+        which gives back the exact stored value.
+
+        Args:
+            value: The key value of the cursor.
+
+        Returns:
+            The value, or the expression casting it back for the rank.
+        """
+        if self.field != "search_rank":
+            return value
+
+        return Func(
+            Value(repr(value)),
+            template="CAST(%(expressions)s AS real)",
+            output_field=FloatField(),
+        )
+
+    def get_approximate_count(
+        self: "KeysetCursorPagination", queryset: QuerySet
+    ) -> int:
+        """Get a cheap estimation of the number of rows.
+
+        On PostgreSQL the planner estimation is used, elsewhere the rows are
+        counted up to ``approximate_count_cap``.
+
+        Args:
+            queryset: The filtered queryset.
+
+        Returns:
+            The estimated number of rows.
+        """
+        queryset = queryset.order_by()
+        connection = connections[queryset.db]
+
+        if connection.vendor == "postgresql":
+            sql, params = queryset.values("pk").query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+
+            return int(plan[0]["Plan"]["Plan Rows"])
+
+        return queryset[: self.approximate_count_cap].count()
+
+    def decode_cursor(
+        self: "KeysetCursorPagination", request: Request
+    ) -> Optional[Dict[str, Any]]:
+        """Given a request with a cursor, return the decoded cursor.
+
+        Args:
+            request: Request object
+
+        Returns:
+            The cursor with the key value, the primary key and the direction.
+
+        Raises:
+            NotFound: If the cursor is not valid.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            cursor["v"] = self.to_python(cursor["v"])
+            cursor["p"] = int(cursor["p"])
+            cursor["r"] = bool(cursor.get("r"))
+
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return cursor
+
+    def encode_cursor(self: "KeysetCursorPagination", cursor: Dict[str, Any]) -> str:
+        """Given a cursor, return an url with encoded cursor.
+
+        Args:
+            cursor: The cursor with the key value, the primary key and the direction.
+
+        Returns:
+            The url of the page.
+        """
+        data = json.dumps(cursor, default=str, separators=(",", ":"))
+        encoded = urlsafe_b64encode(data.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def to_python(self: "KeysetCursorPagination", value: Any) -> Any:
+        """Convert a cursor value back to the type of the key field.
+
+        Args:
+            value: The value read from the cursor.
+
+        Returns:
+            The converted value.
+        """
+        if self.field == "search_rank":
+            return float(value)
+
+        try:
+            field = self.model._meta.get_field(self.field)
+        except FieldDoesNotExist:
+            return value
+
+        return field.to_python(value)
+
+    def get_position(self: "KeysetCursorPagination", instance: Any) -> Dict[str, Any]:
+        """Get the key of an item.
+
+        Args:
+            instance: An item of the page.
+
+        Returns:
+            The key value and the primary key.
+        """
+        return {"v": getattr(instance, self.field), "p": instance.pk}
+
+    def get_next_link(self: "KeysetCursorPagination") -> Optional[str]:
+        """Get the link of the next page."""
+        if not self.has_next or not self.page:
+            return None
+
+        return self.encode_cursor(self.get_position(self.page[-1]))
+
+    def get_previous_link(self: "KeysetCursorPagination") -> Optional[str]:
+        """Get the link of the previous page."""
+        if not self.has_previous or not self.page:
+            return None
+
+        return self.encode_cursor({**self.get_position(self.page[0]), "r": 1})
+
+    def get_paginated_response(self: "KeysetCursorPagination", data: Any) -> Response:
+        """Return the page with the links of the next and previous pages."""
+        response = OrderedDict(
+            [("next", self.get_next_link()), ("previous", self.get_previous_link())]
+        )
+
+        if self.approximate_count is not None:
+            response["approximate_count"] = self.approximate_count
+
+        response["results"] = data
+        return Response(response)
+
+    def get_paginated_response_schema(
+        self: "KeysetCursorPagination", schema: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Add the optional approximate count to the response schema."""
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["approximate_count"] = {
+            "type": "integer",
+            "nullable": True,
+        }
+        return response_schema
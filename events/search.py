@@ -0,0 +1,313 @@
+"""Full-text search backends for events and sessions."""
+from abc import ABC, abstractmethod
+from functools import reduce
+from operator import or_
+from typing import Any, Dict, Optional, Type
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import F, FloatField, Func, Model, Q, QuerySet, TextField, Value
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.request import Request
+
+SEARCH_CONFIG = settings.SEARCH_CONFIG
+
+HIGHLIGHT_START = "<mark>"
+
+HIGHLIGHT_STOP = "</mark>"
+
+
+class SearchBackend(ABC):
+    """Base search backend.
+
+    A backend filters a queryset down to the rows matching the search
+    terms and annotates them with ``search_rank``, where higher is better,
+    and ``search_snippet``, the best matching part of the description
+    with the matched words highlighted.
+    """
+
+    # Indexed fields with their weight, the most important first.
+    fields: Dict[str, str] = {"title": "A", "description": "B"}
+
+    def prepare(self: "SearchBackend", instance: Model) -> None:
+        """Hook called from ``pre_save`` before the row is written.
+
+        Args:
+            instance: The instance about to be saved.
+        """
+
+    def index(self: "SearchBackend", instance: Model) -> None:
+        """Hook called from ``post_save`` once the row is written.
+
+        Args:
+            instance: The saved instance.
+        """
+
+    def remove(self: "SearchBackend", instance: Model) -> None:
+        """Hook called from ``post_delete``.
+
+        Args:
+            instance: The deleted instance.
+        """
+
+    def index_queryset(self: "SearchBackend", queryset: QuerySet) -> None:
+        """Index rows written without signals, e.g. by ``bulk_create``.
+
+        Args:
+            queryset: The rows to index.
+        """
+
+    @abstractmethod
+    def search(self: "SearchBackend", queryset: QuerySet, text: str) -> QuerySet:
+        """Filter the queryset down to the matching rows.
+
+        The rows are returned annotated with the rank and the snippet.
+
+        Args:
+            queryset: The queryset to search.
+            text: The search terms.
+        """
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Search backend using a ``tsvector`` column with a GIN index."""
+
+    def vector(self: "PostgresSearchBackend", **values: Any) -> SearchVector:
+        """Build the weighted vector of the indexed fields.
+
+        Args:
+            values: The expression or value of every indexed field.
+
+        Returns:
+            The search vector.
+        """
+        vectors = [
+            SearchVector(value, weight=weight, config=SEARCH_CONFIG)
+            for value, weight in (
+                (values[field], weight) for field, weight in self.fields.items()
+            )
+        ]
+        vector = vectors[0]
+        for other in vectors[1:]:
+            vector = vector + other
+        return vector
+
+    def prepare(self: "PostgresSearchBackend", instance: Model) -> None:
+        """Set the vector computed from the values about to be saved."""
+        instance.search_vector = self.vector(
+            **{
+                field: Value(getattr(instance, field) or "", output_field=TextField())
+                for field in self.fields
+            }
+        )
+
+    def index_queryset(self: "PostgresSearchBackend", queryset: QuerySet) -> None:
+        """Recompute the vector from the stored columns."""
+        queryset.update(
+            search_vector=self.vector(**{field: F(field) for field in self.fields})
+        )
+
+    def search(
+        self: "PostgresSearchBackend", queryset: QuerySet, text: str
+    ) -> QuerySet:
+        """Match the GIN indexed vector and rank it with ``ts_rank``."""
+        query = SearchQuery(text, config=SEARCH_CONFIG)
+        snippet = Func(
+            Value(SEARCH_CONFIG),
+            F("description"),
+            query,
+            Value(
+                f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+                "MaxFragments=1, MaxWords=30, MinWords=10"
+            ),
+            function="ts_headline",
+            output_field=TextField(),
+        )
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(search_rank=SearchRank(F("search_vector"), query))
+            .annotate(search_snippet=snippet)
+        )
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """Search backend using an FTS5 shadow table.
+
+    The shadow table is named after the table of the model with a ``_fts``
+    suffix, shares the primary key as ``rowid`` and uses the porter
+    stemmer.
+    """
+
+    def table(self: "SQLiteSearchBackend", model: Type[Model]) -> str:
+        """Get the name of the shadow table of a model.
+
+        Args:
+            model: The indexed model.
+
+        Returns:
+            The table name.
+        """
+        return f"{model._meta.db_table}_fts"
+
+    def index(self: "SQLiteSearchBackend", instance: Model) -> None:
+        """Replace the indexed row of the instance."""
+        model = type(instance)
+        columns = ", ".join(self.fields)
+        placeholders = ", ".join(["%s"] * len(self.fields))
+
+        with connections[instance._state.db].cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {self.table(model)} WHERE rowid = %s", [instance.pk]
+            )
+            cursor.execute(
+                f"INSERT INTO {self.table(model)} (rowid, {columns}) "
+                f"VALUES (%s, {placeholders})",
+                [instance.pk] + [getattr(instance, field) for field in self.fields],
+            )
+
+    def remove(self: "SQLiteSearchBackend", instance: Model) -> None:
+        """Delete the indexed row of the instance."""
+        with connections[instance._state.db].cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {self.table(type(instance))} WHERE rowid = %s",
+                [instance.pk],
+            )
+
+    def index_queryset(self: "SQLiteSearchBackend", queryset: QuerySet) -> None:
+        """Replace the indexed rows of the queryset."""
+        table = self.table(queryset.model)
+        columns = ", ".join(self.fields)
+        rows = queryset.order_by().values_list("pk", *self.fields)
+        sql, params = rows.query.sql_with_params()
+        pks = list(queryset.values_list("pk", flat=True))
+
+        with connections[queryset.db].cursor() as cursor:
+            for start in range(0, len(pks), 500):
+                chunk = pks[start : start + 500]
+                cursor.execute(
+                    f"DELETE FROM {table} WHERE rowid IN "
+                    f"({', '.join(['%s'] * len(chunk))})",
+                    chunk,
+                )
+            cursor.execute(f"INSERT INTO {table} (rowid, {columns}) {sql}", params)
+
+    def match(self: "SQLiteSearchBackend", text: str) -> str:
+        """Quote every term so user input can't use the FTS5 query syntax.
+
+        Args:
+            text: The search terms.
+
+        Returns:
+            The FTS5 query matching all the terms.
+        """
+        return " ".join('"{}"'.format(term.replace('"', '""')) for term in text.split())
+
+    def search(self: "SQLiteSearchBackend", queryset: QuerySet, text: str) -> QuerySet:
+        """Match the shadow table and rank it with ``bm25``."""
+        model = queryset.model
+        table = self.table(model)
+        outer = f"{model._meta.db_table}.{model._meta.pk.column}"
+        match = self.match(text)
+        weights = ", ".join(
+            "10.0" if weight == "A" else "1.0" for weight in self.fields.values()
+        )
+        column = list(self.fields).index("description")
+
+        # The table and column names come from the model meta, the user input
+        # is only passed as parameters.
+        return (
+            queryset.filter(
+                pk__in=RawSQL(  # noqa: S611
+                    f"SELECT rowid FROM {table} WHERE {table} MATCH %s", [match]
+                )
+            )
+            .annotate(
+                search_rank=RawSQL(  # noqa: S611
+                    f"SELECT -bm25({table}, {weights}) FROM {table} "
+                    f"WHERE {table} MATCH %s AND rowid = {outer}",
+                    [match],
+                )
+            )
+            .annotate(
+                search_snippet=RawSQL(  # noqa: S611
+                    f"SELECT snippet({table}, {column}, %s, %s, '…', 30) "
+                    f"FROM {table} WHERE {table} MATCH %s AND rowid = {outer}",
+                    [HIGHLIGHT_START, HIGHLIGHT_STOP, match],
+                )
+            )
+        )
+
+
+class BasicSearchBackend(SearchBackend):
+    """Unranked ``icontains`` search for the other databases."""
+
+    def search(self: "BasicSearchBackend", queryset: QuerySet, text: str) -> QuerySet:
+        """Match every term against any of the indexed fields."""
+        for term in text.split():
+            queryset = queryset.filter(
+                reduce(
+                    or_, (Q(**{f"{field}__icontains": term}) for field in self.fields)
+                )
+            )
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+BACKENDS = {
+    "postgresql": PostgresSearchBackend,
+    "sqlite": SQLiteSearchBackend,
+}
+
+
+def get_backend(using: Optional[str] = None) -> SearchBackend:
+    """Get the search backend of a database.
+
+    The ``SEARCH_BACKEND`` setting can point to another backend class,
+    otherwise the backend is picked from the database vendor.
+
+    Args:
+        using: The database alias.
+
+    Returns:
+        The search backend.
+    """
+    path = getattr(settings, "SEARCH_BACKEND", None)
+    if path:
+        return import_string(path)()
+
+    vendor = connections[using or DEFAULT_DB_ALIAS].vendor
+    return BACKENDS.get(vendor, BasicSearchBackend)()
+
+
+class FullTextSearchFilter(SearchFilter):
+    """Drop-in replacement of ``SearchFilter`` using the search backend.
+
+    When the client doesn't ask for an ordering the results are ordered by
+    relevance.
+    """
+
+    def filter_queryset(
+        self: "FullTextSearchFilter", request: Request, queryset: QuerySet, view: Any
+    ) -> QuerySet:
+        """Return a filtered queryset.
+
+        Args:
+            request: Request object
+            queryset: The queryset to filter.
+            view: Any type of view
+
+        Returns:
+            The matching rows.
+        """
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        queryset = get_backend(queryset.db).search(queryset, " ".join(terms))
+
+        if not request.query_params.get(OrderingFilter.ordering_param):
+            queryset = queryset.order_by("-search_rank", "pk")
+
+        return queryset
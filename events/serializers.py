@@ -1,10 +1,13 @@
 """Collection of serializers."""
-from typing import Dict
+from typing import Any, Dict, List
 
+from django.contrib.auth import get_user_model
 from pydantic import BaseModel
 from rest_framework import exceptions, serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
 
-from .models import Event, Session, Tag
+from .models import Event, QueueEntry, Session, Tag
+from .utils import EVENT_BULK_MAX_SIZE
 
 
 class GeoLocation(BaseModel):
@@ -37,12 +40,78 @@ class TagSerializer(serializers.Serializer):
     """Tag serializer."""
 
     name = serializers.CharField(read_only=True)
-    total_events = serializers.IntegerField(read_only=True)
+    total_events = serializers.IntegerField(read_only=True, source="num_events")
+
+
+def validate_tag_name(data: Any) -> str:
+    """Validate a tag name like a ``CharField`` that only accepts strings.
+
+    Args:
+        data: The submitted name.
+
+    Returns:
+        The stripped name.
+
+    Raises:
+        ValidationError: If the name is not a string, is blank or too long.
+    """
+    if not isinstance(data, str):
+        raise exceptions.ValidationError(
+            serializers.CharField.default_error_messages["invalid"]
+        )
+
+    return serializers.CharField(
+        max_length=Tag._meta.get_field("name").max_length
+    ).run_validation(data)
+
+
+class TagListSerializer(serializers.ManyRelatedField):
+    """A list of tag strings resolved into object ids at once."""
+
+    def to_internal_value(self: "TagListSerializer", data: Any) -> List[int]:
+        """Getting the list of string values changed into object ids.
+
+        Args:
+            data: the list of texts to convert.
+
+        Returns:
+            the object ids.
+
+        Raises:
+            ValidationError: If any of the names is not valid.
+        """
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        names = []
+        errors = {}
+        for index, item in enumerate(data):
+            try:
+                names.append(validate_tag_name(item))
+            except exceptions.ValidationError as error:
+                errors[index] = error.detail
+
+        if errors:
+            raise exceptions.ValidationError(errors)
+
+        return Tag.objects.resolve_ids(names)
 
 
 class TagStringSerializer(serializers.StringRelatedField):
     """A string serializer that convert string to object id."""
 
+    @classmethod
+    def many_init(cls: Any, *args: Any, **kwargs: Any) -> TagListSerializer:
+        """Resolve the whole list of tags instead of one tag at a time."""
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return TagListSerializer(**list_kwargs)
+
     def to_internal_value(self: "TagStringSerializer", data: str) -> int:
         """Getting the string value changed into object id.
 
@@ -52,9 +121,7 @@ class TagStringSerializer(serializers.StringRelatedField):
         Returns:
             the object id.
         """
-        tag, created = Tag.objects.get_or_create(name=data.lower())
-
-        return tag.id
+        return Tag.objects.resolve_ids([validate_tag_name(data)])[0]
 
 
 class EventListSerializer(serializers.Serializer):
@@ -78,6 +145,77 @@ class EventListSerializer(serializers.Serializer):
 
     tags = serializers.StringRelatedField(read_only=True, many=True)
 
+    search_snippet = serializers.CharField(read_only=True)
+
+    has_sign_up = serializers.BooleanField(read_only=True)
+
+    is_stuff = serializers.BooleanField(read_only=True)
+
+
+class EventNearbySerializer(EventListSerializer):
+    """Event Nearby Serializer."""
+
+    distance = serializers.FloatField(read_only=True)
+
+
+class NearbySerializer(serializers.Serializer):
+    """Nearby Serializer for the query parameters."""
+
+    lat = serializers.FloatField(min_value=-90, max_value=90)
+
+    lng = serializers.FloatField(min_value=-180, max_value=180)
+
+    radius = serializers.FloatField(min_value=0, max_value=500, default=10)
+
+
+class MapSerializer(serializers.Serializer):
+    """Map Serializer for the query parameters."""
+
+    bbox = serializers.CharField()
+
+    zoom = serializers.IntegerField(min_value=0, max_value=22)
+
+    def validate_bbox(self: "MapSerializer", value: str) -> Dict[str, float]:
+        """Parse the ``west,south,east,north`` bounding box.
+
+        Args:
+            value: The bounding box in degrees.
+
+        Returns:
+            The bounding box.
+
+        Raises:
+            ValidationError: If the bounding box is not valid.
+        """
+        try:
+            west, south, east, north = (float(item) for item in value.split(","))
+        except ValueError:
+            raise exceptions.ValidationError(
+                "Expected the bounding box as west,south,east,north."
+            )
+
+        if not (-90 <= south <= north <= 90):
+            raise exceptions.ValidationError("Invalid latitudes.")
+
+        if not (-180 <= west <= 180 and -180 <= east <= 180):
+            raise exceptions.ValidationError("Invalid longitudes.")
+
+        return {"west": west, "south": south, "east": east, "north": north}
+
+
+class EventMapSerializer(serializers.Serializer):
+    """Event Map Serializer."""
+
+    title = serializers.CharField(read_only=True)
+
+    slug = serializers.SlugField(read_only=True)
+
+    event_date = serializers.DateTimeField(read_only=True)
+
+    latitude = serializers.FloatField(read_only=True)
+
+    longitude = serializers.FloatField(read_only=True)
+
 
 class EventRetrieveSerializer(serializers.Serializer):
     """Event Retrieve Serializer."""
@@ -124,6 +262,8 @@ class EventRetrieveSerializer(serializers.Serializer):
 
     geom = serializers.JSONField(read_only=True)
 
+    waiting_room = serializers.BooleanField(read_only=True)
+
 
 class EventCreateUpdateSerializer(serializers.ModelSerializer):
     """Event Create Update Serializer."""
@@ -136,6 +276,9 @@ class EventCreateUpdateSerializer(serializers.ModelSerializer):
 
     def validate(self: "EventCreateUpdateSerializer", data: Dict) -> Dict:
         """Extra validation."""
+        if "geom" not in data and self.partial:
+            return data
+
         try:
             GeoLocation(geom=data["geom"])
         except Exception:
@@ -155,9 +298,83 @@ class EventCreateUpdateSerializer(serializers.ModelSerializer):
             "event_date",
             "tags",
             "geom",
+            "waiting_room",
         )
 
 
+class EventBulkItemSerializer(EventCreateUpdateSerializer):
+    """Event Bulk Item Serializer.
+
+    The tags are kept as names and the organizers as usernames, both are
+    resolved once for the whole batch.
+    """
+
+    tags = serializers.ListField(
+        child=serializers.CharField(max_length=200), required=False, default=list
+    )
+
+    organizers = serializers.ListField(
+        child=serializers.CharField(), required=False, default=list
+    )
+
+    cover = None
+
+    class Meta:
+        """Meta data."""
+
+        model = Event
+        fields = (
+            "title",
+            "description",
+            "total_guest",
+            "event_date",
+            "tags",
+            "organizers",
+            "geom",
+            "waiting_room",
+        )
+
+
+class EventBulkCreateSerializer(serializers.Serializer):
+    """Event Bulk Create Serializer."""
+
+    events = EventBulkItemSerializer(many=True, allow_empty=False)
+
+    def validate_events(
+        self: "EventBulkCreateSerializer", value: List[Dict]
+    ) -> List[Dict]:
+        """Check the size of the batch and resolve the organizers.
+
+        Args:
+            value: The validated events.
+
+        Returns:
+            The events with the organizers replaced by user ids.
+
+        Raises:
+            ValidationError: If the batch is too large or a username is unknown.
+        """
+        if len(value) > EVENT_BULK_MAX_SIZE:
+            raise exceptions.ValidationError(
+                f"Expected at most {EVENT_BULK_MAX_SIZE} events."
+            )
+
+        usernames = {name for item in value for name in item["organizers"]}
+        users = dict(
+            get_user_model()
+            .objects.filter(username__in=usernames)
+            .values_list("username", "pk")
+        )
+        unknown = sorted(usernames - set(users))
+        if unknown:
+            raise exceptions.ValidationError({"unknown": unknown})
+
+        for item in value:
+            item["organizers"] = [users[name] for name in item["organizers"]]
+
+        return value
+
+
 class SessionRetrieveCreateUpdateSerializer(serializers.ModelSerializer):
     """Session Retrieve Create Update Serializer."""
 
@@ -182,6 +399,20 @@ class SessionListSerializer(serializers.Serializer):
 
     proposed_by = ProfilesSerializer(read_only=True)
 
+    search_snippet = serializers.CharField(read_only=True)
+
+
+class QueueEntrySerializer(serializers.ModelSerializer):
+    """Queue Entry Serializer."""
+
+    position = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        """Meta data."""
+
+        model = QueueEntry
+        fields = ("token", "status", "position")
+
 
 class SessionSettingSerializer(serializers.Serializer):
     """Session Setting Serializer."""
@@ -192,12 +423,31 @@ class SessionSettingSerializer(serializers.Serializer):
 class AttendeeSettingSerializer(serializers.Serializer):
     """Attendee Setting Serializer."""
 
-    list_of_username = serializers.ListField()
+    list_of_username = serializers.ListField(
+        child=serializers.CharField(), required=False, default=list
+    )
+
+    attendee_ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, default=list
+    )
+
+    ticket_codes = serializers.ListField(
+        child=serializers.CharField(), required=False, default=list
+    )
+
+    def validate(self: "AttendeeSettingSerializer", data: Dict) -> Dict:
+        """Extra validation."""
+        if not any(data.values()):
+            raise exceptions.ValidationError(
+                "Expected list_of_username, attendee_ids or ticket_codes."
+            )
+
+        return data
 
 
 class OrganizersSettingSerializer(serializers.Serializer):
     """Organizers Setting Serializer."""
 
-    list_of_username = serializers.ListField()
+    list_of_username = serializers.ListField(child=serializers.CharField())
 
     action = serializers.ChoiceField(("Add", "Remove"))
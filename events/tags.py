@@ -0,0 +1,60 @@
+"""Cached tag cloud ordered by popularity."""
+from typing import Any, Dict, List
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Count
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .archive import compress, decompress
+from .models import Event, Tag
+from .serializers import TagSerializer
+
+TAG_CLOUD_CACHE = getattr(settings, "TAG_CLOUD_CACHE", "default")
+
+# Every change of the tags of an event drops the cloud, the timeout only
+# bounds the changes made without signals, e.g. raw SQL.
+TAG_CLOUD_TIMEOUT = 60 * 60
+
+TAG_CLOUD_KEY = "events:tags:cloud"
+
+
+def get_tag_cloud() -> List[Dict[str, Any]]:
+    """Get all the tags with their number of events, building it when missing.
+
+    Returns:
+        The serialized tags, the most used first.
+    """
+    cache = caches[TAG_CLOUD_CACHE]
+    blob = cache.get(TAG_CLOUD_KEY)
+
+    if blob is None:
+        tags = Tag.objects.annotate(num_events=Count("events")).order_by(
+            "-num_events", "name"
+        )
+        blob = compress(TagSerializer(tags, many=True).data)
+        cache.set(TAG_CLOUD_KEY, blob, TAG_CLOUD_TIMEOUT)
+
+    return decompress(blob)
+
+
+def invalidate() -> None:
+    """Drop the cached tag cloud."""
+    caches[TAG_CLOUD_CACHE].delete(TAG_CLOUD_KEY)
+
+
+@receiver(m2m_changed, sender=Event.tags.through)
+def tag_cloud_updater(sender: Any, action: str, **kwargs: Any) -> None:
+    """Single for Event tags to drop the tag cloud."""
+    if action.startswith("post_"):
+        invalidate()
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=Event)
+def tag_cloud_remover(sender: Any, **kwargs: Any) -> None:
+    """Single for Tag and Event to drop the tag cloud."""
+    # Deleting an event removes its tags without sending ``m2m_changed``.
+    invalidate()
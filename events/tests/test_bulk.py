@@ -0,0 +1,124 @@
+"""Tests of the bulk creation of events."""
+from datetime import timedelta
+from unittest import mock
+
+from django.db import IntegrityError
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import CustomUser, UserStats
+from .. import bulk
+from ..models import Event, EventMapCell, Tag
+
+
+def event_item(title: str, **fields: object) -> dict:
+    """Build an event of a bulk request.
+
+    Args:
+        title: The event title.
+        fields: The fields overriding the defaults.
+
+    Returns:
+        The event.
+    """
+    item = {
+        "title": title,
+        "description": "<p>An event in the batch.</p>",
+        "total_guest": 10,
+        "event_date": (timezone.now() + timedelta(days=7)).isoformat(),
+        "geom": {"type": "Point", "coordinates": [38.75, 9.01]},
+    }
+    item.update(fields)
+    return item
+
+
+class EventBulkCreateTest(TestCase):
+    """Batches of events created in one request."""
+
+    def setUp(self: "EventBulkCreateTest") -> None:
+        """Create the host and an organizer."""
+        self.host = CustomUser.objects.create(username="host", email="host@example.com")
+        self.organizer = CustomUser.objects.create(
+            username="organizer", email="organizer@example.com"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.host)
+
+    def post(self: "EventBulkCreateTest", *items: dict) -> object:
+        """Send a batch of events.
+
+        Args:
+            items: The events.
+
+        Returns:
+            The response.
+        """
+        return self.client.post(
+            "/api/events/bulk/", {"events": list(items)}, format="json"
+        )
+
+    def test_events_are_created(self: "EventBulkCreateTest") -> None:
+        """The events, their relations and their derived fields are written."""
+        response = self.post(
+            event_item("Meetup", tags=["Python", "python", "Django"]),
+            event_item("Meetup", organizers=["organizer"]),
+        )
+
+        self.assertEqual(response.status_code, 201)
+        slugs = response.data["slugs"]
+        self.assertEqual(len(set(slugs)), 2)
+
+        first, second = (Event.objects.get(slug=slug) for slug in slugs)
+        self.assertEqual(
+            sorted(first.tags.values_list("name", flat=True)), ["django", "python"]
+        )
+        self.assertEqual(list(second.organizers.all()), [self.organizer])
+        self.assertEqual((first.latitude, first.longitude), (9.01, 38.75))
+        self.assertGreater(first.read_time, 0)
+
+        self.assertEqual(UserStats.objects.get(user=self.host).hosted_events_count, 2)
+        self.assertEqual(
+            UserStats.objects.get(user=self.organizer).organized_events_count, 1
+        )
+        self.assertEqual(
+            sum(EventMapCell.objects.filter(zoom=0).values_list("count", flat=True)), 2,
+        )
+
+    def test_tags_are_optional(self: "EventBulkCreateTest") -> None:
+        """An event without tags is created without tags."""
+        response = self.post(event_item("Meetup"))
+
+        self.assertEqual(response.status_code, 201)
+        event = Event.objects.get(slug=response.data["slugs"][0])
+        self.assertFalse(event.tags.exists())
+
+    def test_unknown_organizer(self: "EventBulkCreateTest") -> None:
+        """An unknown organizer rejects the whole batch."""
+        response = self.post(
+            event_item("Meetup"), event_item("Meetup", organizers=["nobody"])
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["events"]["unknown"], ["nobody"])
+        self.assertFalse(Event.objects.exists())
+
+    def test_failed_batch_leaves_no_tags(self: "EventBulkCreateTest") -> None:
+        """The tags created for a batch are rolled back with it."""
+        items = [
+            {
+                **event_item("Meetup"),
+                "event_date": timezone.now() + timedelta(days=7),
+                "tags": ["new"],
+                "organizers": [],
+            }
+        ]
+
+        with mock.patch.object(
+            bulk, "through_rows", side_effect=IntegrityError("failed")
+        ):
+            with self.assertRaises(IntegrityError):
+                bulk.create_events(host=self.host, items=items)
+
+        self.assertFalse(Event.objects.exists())
+        self.assertFalse(Tag.objects.filter(name="new").exists())
@@ -0,0 +1,113 @@
+"""Tests of the bulk import of attendees."""
+from datetime import timedelta
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.utils import timezone
+from tablib import Dataset
+
+from users.models import CustomUser, UserStats
+from .. import imports
+from ..admin import AttendeeResource
+from ..models import Attendee, Event
+
+HEADERS = ["user__username", "events__slug", "has_attended"]
+
+
+class AttendeeImportTest(TestCase):
+    """Files of attendees imported from the admin."""
+
+    def setUp(self: "AttendeeImportTest") -> None:
+        """Create an event with two seats, one of them taken."""
+        self.host = CustomUser.objects.create(username="host", email="host@example.com")
+        self.users = [
+            CustomUser.objects.create(
+                username=f"user{index}", email=f"user{index}@example.com"
+            )
+            for index in range(4)
+        ]
+        self.event = Event.objects.create(
+            title="Meetup",
+            description="A meetup.",
+            total_guest=2,
+            hosted_by=self.host,
+            event_date=timezone.now() + timedelta(days=7),
+            geom={"type": "Point", "coordinates": [38.75, 9.01]},
+        )
+        self.attendee = Attendee.objects.create(user=self.users[0], events=self.event)
+
+    def import_rows(self: "AttendeeImportTest", *rows: tuple) -> object:
+        """Import rows of attendees of the event.
+
+        Args:
+            rows: The username and the has attended value of every row.
+
+        Returns:
+            The result of the import.
+        """
+        dataset = Dataset(headers=HEADERS)
+        for username, has_attended in rows:
+            dataset.append([username, self.event.slug, has_attended])
+
+        return AttendeeResource().import_data(dataset, dry_run=False)
+
+    def test_new_attendees_are_inserted(self: "AttendeeImportTest") -> None:
+        """A new attendee takes a seat and counts for the event."""
+        result = self.import_rows(("user1", "1"))
+
+        self.assertFalse(result.has_validation_errors())
+        self.assertEqual(result.totals["new"], 1)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.attendees_count, 2)
+        self.assertEqual(
+            UserStats.objects.get(user=self.users[1]).attended_events_count, 1
+        )
+
+    def test_rows_beyond_the_seats_are_rejected(self: "AttendeeImportTest") -> None:
+        """Only the seats left can be taken, the file is then not imported."""
+        result = self.import_rows(("user1", ""), ("user2", ""), ("user3", ""))
+
+        self.assertEqual([row.number for row in result.invalid_rows], [2, 3])
+        self.assertEqual(result.invalid_rows[0].error.messages, ["The event is full"])
+        self.assertEqual(Attendee.objects.filter(events=self.event).count(), 1)
+
+    def test_existing_attendees_are_updated(self: "AttendeeImportTest") -> None:
+        """A row of an existing attendee updates it without taking a seat."""
+        result = self.import_rows(("user0", "1"), ("user1", ""))
+
+        self.assertFalse(result.has_validation_errors())
+        self.assertEqual((result.totals["update"], result.totals["new"]), (1, 1))
+
+        self.attendee.refresh_from_db()
+        self.event.refresh_from_db()
+        self.assertTrue(self.attendee.has_attended)
+        self.assertEqual(self.event.attendees_count, 2)
+        self.assertEqual(self.event.attended_count, 1)
+        self.assertEqual(
+            UserStats.objects.get(user=self.users[0]).attended_events_count, 1
+        )
+
+    def test_repeated_and_invalid_rows(self: "AttendeeImportTest") -> None:
+        """The host, unknown users and repeated rows are rejected."""
+        result = self.import_rows(
+            ("host", ""), ("nobody", ""), ("user1", ""), ("user1", "")
+        )
+
+        self.assertEqual([row.number for row in result.invalid_rows], [1, 2, 4])
+        self.assertEqual(Attendee.objects.filter(events=self.event).count(), 1)
+
+    def test_seats_are_checked_again(self: "AttendeeImportTest") -> None:
+        """A seat taken after the validation fails the insert."""
+        attendees, errors = imports.validate_attendees(
+            [{"user__username": "user1", "events__slug": self.event.slug}]
+        )
+        self.assertEqual(errors, {})
+
+        Attendee.objects.create(user=self.users[2], events=self.event)
+
+        with self.assertRaises(ValidationError):
+            imports.insert_attendees(list(attendees.values()))
+
+        self.assertFalse(
+            Attendee.objects.filter(user=self.users[1], events=self.event).exists()
+        )
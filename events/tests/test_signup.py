@@ -0,0 +1,85 @@
+"""Tests of the signup to events."""
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TransactionTestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ..models import Attendee, Event
+
+SEATS = 100
+
+SIGNUPS = 300
+
+WORKERS = 32
+
+
+@skipUnless(connection.vendor == "postgresql", "Concurrent writes need PostgreSQL.")
+class ConcurrentSignUpTest(TransactionTestCase):
+    """Parallel signups against the last seats of an event."""
+
+    def setUp(self: "ConcurrentSignUpTest") -> None:
+        """Create an event and the users signing up to it."""
+        user_model = get_user_model()
+        host = user_model.objects.create(username="host", email="host@example.com")
+        self.event = Event.objects.create(
+            title="Crowded",
+            description="An event with more users than seats.",
+            total_guest=SEATS,
+            hosted_by=host,
+            event_date=timezone.now() + timedelta(days=7),
+        )
+        user_model.objects.bulk_create(
+            [
+                user_model(username=f"user{index}", email=f"user{index}@example.com")
+                for index in range(SIGNUPS)
+            ]
+        )
+        self.users = list(user_model.objects.exclude(pk=host.pk))
+
+    def sign_up(self: "ConcurrentSignUpTest", user: object) -> int:
+        """Sign up a user from a worker thread with its own connection.
+
+        Args:
+            user: The user signing up.
+
+        Returns:
+            The status code of the response.
+        """
+        try:
+            client = APIClient()
+            client.force_authenticate(user=user)
+            response = client.post(f"/api/events/{self.event.slug}/signup/")
+            return response.status_code
+
+        finally:
+            connection.close()
+
+    def test_seats_are_not_oversold(self: "ConcurrentSignUpTest") -> None:
+        """Exactly as many users as seats are signed up."""
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            statuses = Counter(executor.map(self.sign_up, self.users))
+
+        self.event.refresh_from_db()
+
+        self.assertEqual(statuses, Counter({201: SEATS, 400: SIGNUPS - SEATS}))
+        self.assertEqual(Attendee.objects.filter(events=self.event).count(), SEATS)
+        self.assertEqual(self.event.attendees_count, SEATS)
+
+    def test_user_is_signed_up_once(self: "ConcurrentSignUpTest") -> None:
+        """Parallel signups of the same user take a single seat."""
+        user = self.users[0]
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            statuses = Counter(executor.map(self.sign_up, [user] * WORKERS))
+
+        self.event.refresh_from_db()
+
+        self.assertEqual(statuses, Counter({201: 1, 400: WORKERS - 1}))
+        self.assertEqual(Attendee.objects.filter(user=user).count(), 1)
+        self.assertEqual(self.event.attendees_count, 1)
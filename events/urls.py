@@ -5,6 +5,7 @@ from .views import (
     DeniedSessionListAPIView,
     DeniedSessionRetrieveAPIView,
     EventListCreateAPIView,
+    EventNearbyListAPIView,
     EventRetrieveUpdateDestroyAPIView,
     ProposerListCreateAPIView,
     ProposerRetrieveUpdateDestroyAPIView,
@@ -12,10 +13,15 @@ from .views import (
     SessionRetrieveAPIView,
     attendee_list,
     attendee_settings,
+    event_bulk_create,
+    event_map,
     event_organizers_settings,
     list_of_tag,
     old_event_list,
+    old_event_month_index,
+    old_event_month_list,
     session_settings,
+    sign_up_status,
     sign_up_to_event,
     speakers_list,
 )
@@ -25,8 +31,14 @@ app_name = "events"
 urlpatterns = [
     path("tags/", list_of_tag),
     path("", EventListCreateAPIView.as_view()),
+    path("bulk/", event_bulk_create),
     path("old/", old_event_list),
+    path("old/months/", old_event_month_index),
+    path("old/months/<month>/", old_event_month_list),
+    path("nearby/", EventNearbyListAPIView.as_view()),
+    path("map/", event_map),
     path("<slug>/signup/", sign_up_to_event),
+    path("<slug>/signup/<token>/", sign_up_status),
     path("<event_slug>/attendees/", attendee_list),
     path("<event_slug>/speakers/", speakers_list),
     path("<event_slug>/denied/", DeniedSessionListAPIView.as_view()),
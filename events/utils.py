@@ -1,15 +1,38 @@
 """Collection of utils functions."""
+import json
 import math
 import re
 import secrets
 import string
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
 from django.utils.html import strip_tags
 from django.utils.text import slugify
 
 chars_string = string.ascii_lowercase + string.digits + string.ascii_uppercase
 
+# Rounds of candidates tried before giving up on a slug.
+SLUG_ATTEMPTS = 5
+
+# Number of candidate slugs checked per query.
+SLUG_BATCH_SIZE = 500
+
 
 def random_string(
     *,
@@ -48,6 +71,61 @@ def unique_slug(*, title: str, new_slug: str = None) -> str:
     return new_slug
 
 
+def allocate_slugs(
+    *, model: Any, titles: Sequence[str], using: Optional[str] = None
+) -> List[str]:
+    """Create slugs that are not used yet by the rows of a model.
+
+    Every round builds a candidate per title and checks all of them at
+    once against the unique index, the taken ones get a fresh suffix in
+    the next round.
+
+    Args:
+        model: The model with a unique ``slug`` field.
+        titles: The texts where the slugs will be generate.
+        using: The database alias.
+
+    Returns:
+        A slug per title.
+
+    Raises:
+        RuntimeError: If no free slug is found after ``SLUG_ATTEMPTS`` rounds.
+    """
+    max_length = model._meta.get_field("slug").max_length
+    size = getattr(settings, "SLUG_ADDITIONAL_SIZE", 6)
+    bases = [slugify(title)[: max_length - size - 1].strip("-") for title in titles]
+
+    slugs: List[Optional[str]] = [None] * len(titles)
+    pending = list(range(len(titles)))
+
+    for _ in range(SLUG_ATTEMPTS):
+        candidates: Dict[str, int] = {}
+        for index in pending:
+            candidate = unique_slug(title=bases[index])
+            while candidate in candidates:
+                candidate = unique_slug(title=bases[index])
+            candidates[candidate] = index
+
+        names = list(candidates)
+        taken = set()
+        for start in range(0, len(names), SLUG_BATCH_SIZE):
+            taken.update(
+                model._default_manager.db_manager(using)
+                .filter(slug__in=names[start : start + SLUG_BATCH_SIZE])
+                .values_list("slug", flat=True)
+            )
+
+        for candidate, index in candidates.items():
+            if candidate not in taken:
+                slugs[index] = candidate
+
+        pending = [index for index in pending if slugs[index] is None]
+        if not pending:
+            return slugs
+
+    raise RuntimeError("Could not allocate unique slugs.")
+
+
 def get_read_time(*, words: str) -> int:
     """Get the read time of word in minutes.
 
@@ -62,3 +140,210 @@ def get_read_time(*, words: str) -> int:
     count = len(re.findall(r"\w+", word))
 
     return math.ceil(count / 200)
+
+
+def get_coordinates(*, geom: Any) -> Optional[Tuple[float, float]]:
+    """Get the latitude and longitude of a GeoJSON point.
+
+    Args:
+        geom: GeoJSON point as a dict or a json string.
+
+    Returns:
+        latitude and longitude, or None if the point is not valid.
+    """
+    if isinstance(geom, str):
+        try:
+            geom = json.loads(geom)
+        except ValueError:
+            return None
+
+    try:
+        longitude, latitude = geom["coordinates"][:2]
+        latitude, longitude = float(latitude), float(longitude)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        return None
+
+    return latitude, longitude
+
+
+# Web Mercator can't represent the poles, the tiles stop at this latitude.
+MAX_MERCATOR_LATITUDE = 85.0511287798
+
+# Above this zoom level the map shows the events instead of clusters.
+MAP_MAX_CLUSTER_ZOOM = getattr(settings, "MAP_MAX_CLUSTER_ZOOM", 15)
+
+# A cluster cell at zoom ``z`` is a tile of level ``z + MAP_CELL_SHIFT``,
+# e.g. 64px wide cells on the 256px tiles of the map with a shift of 2.
+MAP_CELL_SHIFT = getattr(settings, "MAP_CELL_SHIFT", 2)
+
+# Maximum number of events returned above the cluster zoom levels.
+MAP_MAX_EVENTS = getattr(settings, "MAP_MAX_EVENTS", 500)
+
+# Maximum number of events created by one bulk request.
+EVENT_BULK_MAX_SIZE = getattr(settings, "EVENT_BULK_MAX_SIZE", 500)
+
+
+def get_tile(*, latitude: float, longitude: float, level: int) -> Tuple[int, int]:
+    """Get the Web Mercator tile containing a point.
+
+    Args:
+        latitude: Latitude in degrees.
+        longitude: Longitude in degrees.
+        level: Tile level, the world is split in ``2 ** level`` columns and rows.
+
+    Returns:
+        x and y of the tile.
+    """
+    size = 2 ** level
+    latitude = max(min(latitude, MAX_MERCATOR_LATITUDE), -MAX_MERCATOR_LATITUDE)
+    radians = math.radians(latitude)
+
+    x = int((longitude + 180) / 360 * size)
+    y = int((1 - math.asinh(math.tan(radians)) / math.pi) / 2 * size)
+
+    return min(max(x, 0), size - 1), min(max(y, 0), size - 1)
+
+
+def get_map_cells(*, latitude: float, longitude: float) -> List[Tuple[int, int, int]]:
+    """Get the cluster cell of a point at every clustered zoom level.
+
+    Args:
+        latitude: Latitude in degrees.
+        longitude: Longitude in degrees.
+
+    Returns:
+        zoom, x and y of the cells.
+    """
+    return [
+        (
+            zoom,
+            *get_tile(
+                latitude=latitude, longitude=longitude, level=zoom + MAP_CELL_SHIFT
+            ),
+        )
+        for zoom in range(MAP_MAX_CLUSTER_ZOOM + 1)
+    ]
+
+
+def build_map_cells(
+    *, events: Iterable[Tuple[float, float, datetime]]
+) -> Dict[Tuple[int, int, int, date], List[float]]:
+    """Aggregate events into their map cells from scratch.
+
+    Args:
+        events: The latitude, longitude and date of every event.
+
+    Returns:
+        The count, latitude sum and longitude sum of every cell, keyed by
+        zoom, x, y and local day.
+    """
+    cells: Dict[Tuple[int, int, int, date], List[float]] = {}
+
+    for latitude, longitude, event_date in events:
+        day = timezone.localdate(event_date)
+        for zoom, x, y in get_map_cells(latitude=latitude, longitude=longitude):
+            cell = cells.setdefault((zoom, x, y, day), [0, 0.0, 0.0])
+            cell[0] += 1
+            cell[1] += latitude
+            cell[2] += longitude
+
+    return cells
+
+
+class LRUCache:
+    """Small thread safe in-process LRU cache with a timeout.
+
+    The entries are only seen by the current process, the timeout bounds
+    how long an entry changed by another process can be served. With a
+    ``version_key`` the processes share a version in the Django cache,
+    ``clear`` changes it and every process drops its entries on its next
+    lookup.
+    """
+
+    def __init__(
+        self: "LRUCache",
+        *,
+        max_size: int,
+        timeout: float,
+        version_key: Optional[str] = None,
+        cache_alias: str = "default",
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_size: Maximum number of entries.
+            timeout: Number of seconds an entry is kept.
+            version_key: Key of the version shared by the processes.
+            cache_alias: Alias of the Django cache keeping the version.
+        """
+        self.max_size = max_size
+        self.timeout = timeout
+        self.version_key = version_key
+        self.cache_alias = cache_alias
+        self._version: Optional[str] = None
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self: "LRUCache", keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """Get the entries that are cached and not expired.
+
+        Args:
+            keys: The keys to look up.
+
+        Returns:
+            The values of the cached keys.
+        """
+        now = time.monotonic()
+        found = {}
+        version = (
+            caches[self.cache_alias].get(self.version_key) if self.version_key else None
+        )
+
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+
+                if entry[0] < now:
+                    del self._entries[key]
+                    continue
+
+                self._entries.move_to_end(key)
+                found[key] = entry[1]
+
+        return found
+
+    def set_many(self: "LRUCache", values: Dict[Hashable, Any]) -> None:
+        """Cache entries, evicting the least recently used ones.
+
+        Args:
+            values: The values by key.
+        """
+        expires = time.monotonic() + self.timeout
+
+        with self._lock:
+            for key, value in values.items():
+                self._entries[key] = (expires, value)
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self: "LRUCache") -> None:
+        """Drop all the entries, in every process when the version is shared."""
+        version = None
+        if self.version_key:
+            version = secrets.token_hex(8)
+            caches[self.cache_alias].set(self.version_key, version, None)
+
+        with self._lock:
+            self._entries.clear()
+            self._version = version
@@ -1,77 +1,299 @@
 """Collection views."""
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q, QuerySet
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import exceptions, generics, permissions, status
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.decorators import (
+    api_view,
+    authentication_classes,
+    permission_classes,
+)
+from rest_framework.filters import OrderingFilter
 from rest_framework.generics import get_object_or_404
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from . import filter
+from . import archive, bulk, clusters, details, exports, filter, pagination, tags
 from . import permissions as custom_permissions
 from . import serializers
-from .models import Attendee, Event, Session, Tag
+from .conditional import (
+    ConditionalGetMixin,
+    ConditionalListMixin,
+    ConditionalRetrieveMixin,
+    Validators,
+)
+from .models import Attendee, Event, QueueEntry, Session
+from .search import FullTextSearchFilter
+from .utils import MAP_MAX_CLUSTER_ZOOM, MAP_MAX_EVENTS
 
 
 @api_view(["GET"])
 def list_of_tag(request: Request) -> Response:
-    """List API Point for tag model."""
-    tags = Tag.objects.all()
-    serializer = serializers.TagSerializer(tags, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    """List API Point for tag model.
+
+    Args:
+        request: Request object
+
+    Returns:
+        Response: Json response.
+        200: a page of tags with their number of events, the most used first.
+    """
+    paginator = PageNumberPagination()
+    page = paginator.paginate_queryset(tags.get_tag_cloud(), request)
+    return paginator.get_paginated_response(page)
 
 
 @api_view(["POST"])
 @permission_classes([permissions.IsAuthenticated])
 def sign_up_to_event(request: Request, slug: str) -> Response:
-    """Let users to signup to an event."""
+    """Let users to signup to an event.
+
+    The seat is claimed with a conditional update of the attendees counter
+    and the attendee is inserted in the same transaction, so concurrent
+    signups can't oversell the event nor sign up the same user twice.
+
+    Args:
+        request: Request object
+        slug: The event slug.
+
+    Returns:
+        Response: Json response.
+        201: if the user is signed up.
+        202: if the event has a waiting room, with the token and the
+        position of the user in the queue.
+        400: if the user is the owner, already signed up, or the event is
+        finished or full.
+        404: if the event doesn't exists.
+
+    Raises:
+        ValidationError: If the user can't sign up to the event.
+    """
     event = get_object_or_404(Event, slug=slug)
     if event.hosted_by == request.user:
-        raise exceptions.APIException(
-            f"You are the owner of the {event.title}.", code=status.HTTP_400_BAD_REQUEST
-        )
-    if event.attendees.filter(user=request.user).first():
-        raise exceptions.APIException(
-            f"You already attended the {event.title}.", code=status.HTTP_400_BAD_REQUEST
-        )
+        raise exceptions.ValidationError(f"You are the owner of the {event.title}.")
     if event.event_date < timezone.now():
-        raise exceptions.APIException(
-            "The registrations time is finished.", code=status.HTTP_400_BAD_REQUEST
-        )
+        raise exceptions.ValidationError("The registrations time is finished.")
+
+    if event.waiting_room:
+        return join_waiting_room(request, event)
+
+    attendee = Attendee(user=request.user, events=event)
+    attendee._counters_claimed = {"attendees_count": 1}
+
+    try:
+        with transaction.atomic():
+            claimed = Event.objects.filter(
+                pk=event.pk, attendees_count__lt=F("total_guest")
+            ).update(
+                attendees_count=F("attendees_count") + 1, updated_at=timezone.now()
+            )
+
+            if not claimed:
+                raise exceptions.ValidationError(f"The {event.title} is full.")
+
+            attendee.save()
+
+    except IntegrityError:
+        raise exceptions.ValidationError(f"You already attended the {event.title}.")
 
-    Attendee(user=request.user, events=event).save()
     return Response(status=status.HTTP_201_CREATED)
 
 
+def join_waiting_room(request: Request, event: Event) -> Response:
+    """Put the user in the waiting room of the event.
+
+    Args:
+        request: Request object
+        event: The event with a waiting room.
+
+    Returns:
+        Response: Json response.
+        202: the token, the status and the position in the queue.
+
+    Raises:
+        ValidationError: If the user already attends the event.
+    """
+    if event.attendees.filter(user=request.user).exists():
+        raise exceptions.ValidationError(f"You already attended the {event.title}.")
+
+    try:
+        with transaction.atomic():
+            entry = QueueEntry.objects.create(user=request.user, events=event)
+    except IntegrityError:
+        entry = QueueEntry.objects.get(user=request.user, events=event)
+
+    serializer = serializers.QueueEntrySerializer(entry)
+    return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
 @api_view(["GET"])
-def old_event_list(request: Request) -> Response:
-    """Get list of old events."""
-    events = (
-        Event.objects.select_related("hosted_by")
-        .prefetch_related("tags")
-        .filter(event_date__lt=timezone.now())
+@authentication_classes([])
+def sign_up_status(request: Request, slug: str, token: str) -> Response:
+    """Get the place in the waiting room of an event.
+
+    The token is enough to identify the entry, so the request is not
+    authenticated and never reads the attendees.
+
+    Args:
+        request: Request object
+        slug: The event slug.
+        token: The token given when joining the waiting room.
+
+    Returns:
+        Response: Json response.
+        200: the status and the position in the queue.
+        404: if the token doesn't exists.
+    """
+    entry = get_object_or_404(
+        QueueEntry.objects.only("pk", "events", "token", "status"),
+        token=token,
+        events__slug=slug,
     )
 
-    serializer = serializers.EventListSerializer(events, many=True)
+    serializer = serializers.QueueEntrySerializer(entry)
     return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class EventListCreateAPIView(generics.ListCreateAPIView):
-    """Event API view for create and list."""
+@api_view(["GET"])
+def old_event_list(request: Request) -> Response:
+    """Get a page of old events, one month per page.
 
-    queryset = (
-        Event.objects.select_related("hosted_by")
-        .prefetch_related("tags")
-        .filter(event_date__gt=timezone.now())
+    The pages follow the months of the archive, newest first, and every
+    page holds all the old events of its month, ``count`` is the number of
+    months. ``old/months/<month>/`` serves the same events in smaller pages.
+
+    Args:
+        request: Request object
+
+    Returns:
+        Response: Json response.
+        200: the old events of the month of the page, newest first.
+        404: if the page doesn't exists.
+    """
+    paginator = PageNumberPagination()
+    paginator.page_size = 1
+    page = paginator.paginate_queryset(archive.get_index(), request)
+    month = page[0]["month"] if page else None
+
+    response = paginator.get_paginated_response(
+        archive.get_partition(month) if month else []
+    )
+    response.data["month"] = month
+    patch_cache_control(response, public=True, max_age=archive.RESPONSE_MAX_AGE)
+    return response
+
+
+@api_view(["GET"])
+def old_event_month_index(request: Request) -> Response:
+    """Get the months of the archive of old events.
+
+    Args:
+        request: Request object
+
+    Returns:
+        Response: Json response.
+        200: list of months, newest first, with the number of events
+        and the url of their first page.
+    """
+    months = [
+        {
+            **month,
+            "url": request.build_absolute_uri(f"{request.path}{month['month']}/"),
+        }
+        for month in archive.get_index()
+    ]
+
+    response = Response(months, status=status.HTTP_200_OK)
+    patch_cache_control(response, public=True, max_age=archive.RESPONSE_MAX_AGE)
+    return response
+
+
+@api_view(["GET"])
+def old_event_month_list(request: Request, month: str) -> Response:
+    """Get a page of the old events of a month.
+
+    Args:
+        request: Request object
+        month: The month in YYYY-MM format.
+
+    Returns:
+        Response: Json response.
+        200: if everything is correct.
+        404: if the month or the page doesn't exists.
+
+    Raises:
+        NotFound: If the month is not valid.
+    """
+    try:
+        start, end = archive.month_bounds(month)
+    except ValueError:
+        raise exceptions.NotFound()
+
+    if start.strftime("%Y-%m") != month:
+        raise exceptions.NotFound()
+
+    paginator = PageNumberPagination()
+    page = paginator.paginate_queryset(archive.get_partition(month), request)
+    response = paginator.get_paginated_response(page)
+
+    patch_cache_control(response, public=True, max_age=archive.RESPONSE_MAX_AGE)
+    return response
+
+
+@api_view(["GET"])
+def event_map(request: Request) -> Response:
+    """Upcoming events inside the map view.
+
+    Examples:
+        /api/events/map/?bbox=38.6,8.9,38.9,9.1&zoom=12
+
+    The bounding box is ``west,south,east,north`` in degrees. Up to
+    ``MAP_MAX_CLUSTER_ZOOM`` the events are grouped in clusters, above it
+    the events themselves are returned.
+
+    Args:
+        request: Request object
+
+    Returns:
+        Response: Json response.
+        200: the clusters or the events inside the bounding box.
+        400: if the bounding box or the zoom is not valid.
+    """
+    params = serializers.MapSerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+
+    bbox = params.validated_data["bbox"]
+    zoom = params.validated_data["zoom"]
+
+    if zoom <= MAP_MAX_CLUSTER_ZOOM:
+        return Response(
+            {"clusters": clusters.get_clusters(zoom=zoom, **bbox), "events": []}
+        )
+
+    events = (
+        Event.objects.filter(event_date__gt=timezone.now())
+        .within(**bbox)
+        .only("title", "slug", "event_date", "latitude", "longitude")
+        .order_by("event_date", "pk")[:MAP_MAX_EVENTS]
     )
+    serializer = serializers.EventMapSerializer(events, many=True)
+    return Response({"clusters": [], "events": serializer.data})
+
+
+class EventListCreateAPIView(ConditionalListMixin, generics.ListCreateAPIView):
+    """Event API view for create and list."""
 
     permission_classes = (permissions.IsAuthenticatedOrReadOnly,)
 
-    filter_backends = (DjangoFilterBackend, OrderingFilter, SearchFilter)
+    pagination_class = pagination.KeysetCursorPagination
+
+    filter_backends = (DjangoFilterBackend, OrderingFilter, FullTextSearchFilter)
 
     filterset_class = filter.EventFilter
 
@@ -81,6 +303,15 @@ class EventListCreateAPIView(generics.ListCreateAPIView):
 
     ordering_fields = ("total_guest", "event_date", "read_time")
 
+    def get_queryset(self: "EventListCreateAPIView") -> QuerySet:
+        """Override get_queryset."""
+        return (
+            Event.objects.select_related("hosted_by")
+            .prefetch_related("tags")
+            .filter(event_date__gt=timezone.now())
+            .with_viewer(self.request.user)
+        )
+
     def get_serializer_class(
         self: "EventListCreateAPIView", *args: Tuple, **kwargs: Any
     ) -> Any:
@@ -97,7 +328,73 @@ class EventListCreateAPIView(generics.ListCreateAPIView):
         serializer.save(hosted_by=self.request.user)
 
 
-class EventRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
+@api_view(["POST"])
+@permission_classes([permissions.IsAuthenticated])
+def event_bulk_create(request: Request) -> Response:
+    """Create a batch of events hosted by the user.
+
+    Args:
+        request: Request object
+
+    Examples:
+        {"events": [{"title": "Meetup", "description": "...",
+        "total_guest": 50, "event_date": "2030-01-01T18:00:00Z",
+        "tags": ["python"], "organizers": ["novizi"],
+        "geom": {"type": "Point", "coordinates": [38.74, 9.03]}}]}
+
+    Returns:
+        Response: Json response.
+        201: the slugs of the created events, in the order of the request.
+        400: if an event is not valid or an organizer doesn't exists.
+    """
+    serializer = serializers.EventBulkCreateSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+
+    events = bulk.create_events(
+        host=request.user, items=serializer.validated_data["events"]
+    )
+
+    return Response(
+        {"slugs": [event.slug for event in events]}, status=status.HTTP_201_CREATED
+    )
+
+
+class EventNearbyListAPIView(ConditionalListMixin, generics.ListAPIView):
+    """Event API view for upcoming events around a location.
+
+    Examples:
+        /api/events/nearby/?lat=9.03&lng=38.74&radius=5
+
+    The radius is in kilometers, the events are ordered by their distance.
+    """
+
+    serializer_class = serializers.EventNearbySerializer
+
+    filter_backends = (DjangoFilterBackend,)
+
+    filterset_class = filter.EventFilter
+
+    def get_queryset(self: "EventNearbyListAPIView") -> QuerySet:
+        """Override get_queryset."""
+        location = serializers.NearbySerializer(data=self.request.query_params)
+        location.is_valid(raise_exception=True)
+
+        return (
+            Event.objects.select_related("hosted_by")
+            .prefetch_related("tags")
+            .filter(event_date__gt=timezone.now())
+            .with_viewer(self.request.user)
+            .nearby(
+                latitude=location.validated_data["lat"],
+                longitude=location.validated_data["lng"],
+                radius=location.validated_data["radius"],
+            )
+        )
+
+
+class EventRetrieveUpdateDestroyAPIView(
+    ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView
+):
     """Event API view for retrieve, update, and delete."""
 
     queryset = (
@@ -112,6 +409,41 @@ class EventRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
 
     lookup_field = "slug"
 
+    def get_stored(self: "EventRetrieveUpdateDestroyAPIView") -> Tuple:
+        """Read the id, ``updated_at`` and date of the event once.
+
+        Returns:
+            The id, the last modification and the date of the event.
+
+        Raises:
+            NotFound: If the event doesn't exists.
+        """
+        if not hasattr(self, "_stored"):
+            self._stored = (
+                Event.objects.filter(slug=self.kwargs.get("slug"))
+                .values_list("pk", "updated_at", "event_date")
+                .first()
+            )
+
+        if self._stored is None:
+            raise exceptions.NotFound()
+
+        return self._stored
+
+    def get_validators(self: "EventRetrieveUpdateDestroyAPIView") -> Validators:
+        """Read the ``updated_at`` of the event.
+
+        ``event_is_open`` changes when the event starts, so the event date is
+        the last modification of a past event updated before it.
+
+        Returns:
+            The ETag value and the last modification of the event.
+        """
+        _, updated_at, event_date = self.get_stored()
+        is_open = event_date > timezone.now()
+        last_modified = updated_at if is_open else max(updated_at, event_date)
+        return f"{updated_at}:{is_open}", last_modified
+
     def get_serializer_class(
         self: "EventListCreateAPIView", *args: Tuple, **kwargs: Any
     ) -> Any:
@@ -129,52 +461,92 @@ class EventRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
         *args: Tuple,
         **kwargs: Dict,
     ) -> Response:
-        """Event retrieve endpoint."""
-        try:
-            event = self.get_queryset().get(slug=kwargs.get("slug"))
-
-        except Exception:
-            raise exceptions.NotFound()
-
-        serializer = self.get_serializer(event)
-
-        data = serializer.data
-
-        if request.user.is_authenticated and event.attendees.filter(user=request.user):
-            data.update({"has_sign_up": True})
+        """Event retrieve endpoint.
+
+        The event is served from the shared cache of its current version,
+        only the fields of the viewer are computed for the request.
+
+        Args:
+            request: Request object
+            args: The positional arguments.
+            kwargs: The url arguments, with the event slug.
+
+        Returns:
+            Response: Json response.
+            200: the event with the fields of the viewer.
+            404: if the event doesn't exists.
+        """
+        pk, updated_at, event_date = self.get_stored()
+
+        data = details.get_detail(
+            slug=kwargs.get("slug"),
+            updated_at=updated_at,
+            context=self.get_serializer_context(),
+        )
 
-        else:
-            data.update({"has_sign_up": False})
+        user = request.user
+        staff = {data["hosted_by"]["username"]}
+        staff.update(organizer["username"] for organizer in data["organizers"])
 
         data.update(
             {
-                "event_is_open": event.event_date > timezone.now(),
-                "is_authenticated": request.user.is_authenticated,
-                "is_stuff": event.hosted_by == request.user
-                or event.organizers.filter(username=request.user).first() is not None,
+                "has_sign_up": user.is_authenticated
+                and Attendee.objects.filter(events_id=pk, user=user).exists(),
+                "event_is_open": event_date > timezone.now(),
+                "is_authenticated": user.is_authenticated,
+                "is_stuff": user.is_authenticated and user.username in staff,
             }
         )
         return Response(data, status=status.HTTP_200_OK)
 
 
-class ProposerListCreateAPIView(generics.ListCreateAPIView):
+class SessionStatusMixin:
+    """Mixin for the views of the sessions of an event with a given status.
+
+    The event id is resolved once from the slug, so the sessions are
+    filtered on ``(events_id, status)`` without joining the events.
+    """
+
+    session_status = "Accepted"
+
+    def get_event_id(self: Any) -> Optional[int]:
+        """Get the id of the event of the url.
+
+        Returns:
+            The event id, or None if the event doesn't exists.
+        """
+        if not hasattr(self, "_event_id"):
+            self._event_id = (
+                Event.objects.filter(slug=self.kwargs.get("event_slug"))
+                .values_list("pk", flat=True)
+                .first()
+            )
+
+        return self._event_id
+
+    def get_queryset(self: Any) -> List[Session]:
+        """Override get_queryset."""
+        return Session.objects.filter(
+            events_id=self.get_event_id(), status=self.session_status
+        ).select_related("proposed_by")
+
+
+class ProposerListCreateAPIView(
+    SessionStatusMixin, ConditionalListMixin, generics.ListCreateAPIView
+):
     """Proposer API view for create and list."""
 
+    session_status = "Draft"
+
     permission_classes = (permissions.IsAuthenticatedOrReadOnly,)
 
-    filter_backends = (OrderingFilter, SearchFilter)
+    filter_backends = (OrderingFilter, FullTextSearchFilter)
 
     search_fields = ("title", "description")
     ordering = ("title",)
 
     ordering_fields = ("title", "session_type")
 
-    def get_queryset(self: "ProposerListCreateAPIView") -> List[Session]:
-        """Override get_queryset."""
-        return Session.objects.filter(status="Draft").filter(
-            events__slug=self.kwargs.get("event_slug")
-        )
-
     def get_serializer_class(
         self: "ProposerListCreateAPIView", *args: Tuple, **kwargs: Any
     ) -> Any:
@@ -188,13 +560,20 @@ class ProposerListCreateAPIView(generics.ListCreateAPIView):
 
     def perform_create(self: "ProposerListCreateAPIView", serializer: Any) -> None:
         """Method called when the create method called."""
-        event = get_object_or_404(Event, slug=self.kwargs.get("event_slug"))
-        serializer.save(proposed_by=self.request.user, events=event)
+        event_id = self.get_event_id()
+        if event_id is None:
+            raise exceptions.NotFound()
+
+        serializer.save(proposed_by=self.request.user, events_id=event_id)
 
 
-class ProposerRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
+class ProposerRetrieveUpdateDestroyAPIView(
+    SessionStatusMixin, ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView,
+):
     """Proposer API view for retrieve, update, and delete."""
 
+    session_status = "Draft"
+
     serializer_class = serializers.SessionRetrieveCreateUpdateSerializer
     permission_classes = (
         permissions.IsAuthenticatedOrReadOnly,
@@ -203,19 +582,17 @@ class ProposerRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView
 
     lookup_field = "slug"
 
-    def get_queryset(self: "ProposerRetrieveUpdateDestroyAPIView") -> List[Session]:
-        """Override get_queryset."""
-        return Session.objects.filter(status="Draft").filter(
-            events__slug=self.kwargs.get("event_slug")
-        )
-
 
-class SessionListAPIView(generics.ListAPIView):
+class SessionListAPIView(
+    SessionStatusMixin, ConditionalListMixin, generics.ListAPIView
+):
     """Session API view for accepted session list."""
 
+    session_status = "Accepted"
+
     serializer_class = serializers.SessionListSerializer
 
-    filter_backends = (OrderingFilter, SearchFilter)
+    filter_backends = (OrderingFilter, FullTextSearchFilter)
 
     search_fields = ("title", "description")
 
@@ -223,33 +600,29 @@ class SessionListAPIView(generics.ListAPIView):
 
     ordering_fields = ("title", "session_type")
 
-    def get_queryset(self: "SessionListAPIView") -> List[Session]:
-        """Override get_queryset."""
-        return Session.objects.filter(status="Accepted").filter(
-            events__slug=self.kwargs.get("event_slug")
-        )
-
 
-class SessionRetrieveAPIView(generics.RetrieveAPIView):
+class SessionRetrieveAPIView(
+    SessionStatusMixin, ConditionalRetrieveMixin, generics.RetrieveAPIView
+):
     """Session API view for accepted session retrieve."""
 
+    session_status = "Accepted"
+
     serializer_class = serializers.SessionRetrieveCreateUpdateSerializer
 
     lookup_field = "slug"
 
-    def get_queryset(self: "SessionRetrieveAPIView") -> List[Session]:
-        """Override get_queryset."""
-        return Session.objects.filter(status="Accepted").filter(
-            events__slug=self.kwargs.get("event_slug")
-        )
-
 
-class DeniedSessionListAPIView(generics.ListAPIView):
+class DeniedSessionListAPIView(
+    SessionStatusMixin, ConditionalListMixin, generics.ListAPIView
+):
     """Session API view for denied session list."""
 
+    session_status = "Denied"
+
     serializer_class = serializers.SessionListSerializer
 
-    filter_backends = (OrderingFilter, SearchFilter)
+    filter_backends = (OrderingFilter, FullTextSearchFilter)
 
     search_fields = ("title", "description")
 
@@ -257,43 +630,166 @@ class DeniedSessionListAPIView(generics.ListAPIView):
 
     ordering_fields = ("title", "session_type")
 
-    def get_queryset(self: "DeniedSessionListAPIView") -> List[Session]:
-        """Override get_queryset."""
-        return Session.objects.filter(status="Denied").filter(
-            events__slug=self.kwargs.get("event_slug")
-        )
-
 
-class DeniedSessionRetrieveAPIView(generics.RetrieveAPIView):
+class DeniedSessionRetrieveAPIView(
+    SessionStatusMixin, ConditionalRetrieveMixin, generics.RetrieveAPIView
+):
     """Session API view for denied session retrieve."""
 
+    session_status = "Denied"
+
     serializer_class = serializers.SessionRetrieveCreateUpdateSerializer
 
     lookup_field = "slug"
 
-    def get_queryset(self: "DeniedSessionRetrieveAPIView") -> List[Session]:
-        """Override get_queryset."""
-        return Session.objects.filter(status="Denied").filter(
-            events__slug=self.kwargs.get("event_slug")
+
+def can_manage(event: Event, user: Any) -> bool:
+    """Check if a user is the host or an organizer of an event.
+
+    Args:
+        event: The event.
+        user: The user of the request.
+
+    Returns:
+        True for the host and the organizers.
+    """
+    if not user.is_authenticated:
+        return False
+
+    return event.hosted_by_id == user.pk or event.organizers.filter(pk=user.pk).exists()
+
+
+def get_export_type(request: Request) -> Optional[str]:
+    """Get the export asked with the ``type`` query parameter.
+
+    Args:
+        request: Request object
+
+    Returns:
+        csv, jsonl or None for the paginated json.
+
+    Raises:
+        ParseError: If the type is not supported.
+    """
+    export_type = request.query_params.get("type")
+
+    if export_type is not None and export_type not in exports.EXPORT_TYPES:
+        raise exceptions.ParseError(
+            f"type should be one of {', '.join(exports.EXPORT_TYPES)}."
         )
 
+    return export_type
+
 
 @api_view(["GET"])
 def attendee_list(request: Request, event_slug: str) -> Response:
-    """Get list of attendee in the event."""
-    event = get_object_or_404(Event, slug=event_slug)
-    attendees = event.attendees.all()
-    serializer = serializers.AttendeeSerializer(attendees, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    """Get list of attendee in the event.
+
+    Args:
+        request: Request object
+        event_slug: The event slug.
+
+    Examples:
+        /api/events/<event_slug>/attendees/?type=csv
+
+    Returns:
+        Response: Json response.
+        200: a page of attendees, or the whole list as a csv or jsonl file
+        for the host and the organizers when ``type`` is given.
+        404: if the event doesn't exists
+        and if user don't have permission for the export.
+
+    Raises:
+        NotFound: If the user can't export the list.
+    """
+    event = get_object_or_404(Event.objects.only("pk", "hosted_by"), slug=event_slug)
+    export_type = get_export_type(request)
+
+    if export_type:
+        if not can_manage(event, request.user):
+            raise exceptions.NotFound()
+
+        return exports.export_response(
+            queryset=Attendee.objects.filter(events=event).order_by("pk"),
+            columns={
+                "username": "user__username",
+                "full_name": "user__full_name",
+                "email": "user__email",
+                "ticket_code": "ticket_code",
+                "has_attended": "has_attended",
+                "created_at": "created_at",
+            },
+            filename=f"{event_slug}-attendees",
+            export_type=export_type,
+        )
+
+    attendees = (
+        Attendee.objects.filter(events=event)
+        .select_related("user")
+        .only("user__username", "user__picture")
+        .order_by("pk")
+    )
+
+    paginator = PageNumberPagination()
+    page = paginator.paginate_queryset(attendees, request)
+    serializer = serializers.AttendeeSerializer(page, many=True)
+    return paginator.get_paginated_response(serializer.data)
 
 
 @api_view(["GET"])
 def speakers_list(request: Request, event_slug: str) -> Response:
-    """Get list of speaker in the event."""
-    event = get_object_or_404(Event, slug=event_slug)
-    sessions = event.sessions.filter(status="Accepted")
-    serializer = serializers.SpeakerSerializer(sessions, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    """Get list of speaker in the event.
+
+    Args:
+        request: Request object
+        event_slug: The event slug.
+
+    Examples:
+        /api/events/<event_slug>/speakers/?type=jsonl
+
+    Returns:
+        Response: Json response.
+        200: a page of speakers, or the whole list as a csv or jsonl file
+        for the host and the organizers when ``type`` is given.
+        404: if the event doesn't exists
+        and if user don't have permission for the export.
+
+    Raises:
+        NotFound: If the user can't export the list.
+    """
+    event = get_object_or_404(Event.objects.only("pk", "hosted_by"), slug=event_slug)
+    export_type = get_export_type(request)
+
+    if export_type:
+        if not can_manage(event, request.user):
+            raise exceptions.NotFound()
+
+        return exports.export_response(
+            queryset=Session.objects.filter(events=event, status="Accepted").order_by(
+                "pk"
+            ),
+            columns={
+                "username": "proposed_by__username",
+                "full_name": "proposed_by__full_name",
+                "email": "proposed_by__email",
+                "title": "title",
+                "session_type": "session_type",
+            },
+            filename=f"{event_slug}-speakers",
+            export_type=export_type,
+        )
+
+    sessions = (
+        Session.objects.filter(events=event, status="Accepted")
+        .select_related("proposed_by")
+        .only("proposed_by__username", "proposed_by__picture")
+        .order_by("pk")
+    )
+
+    paginator = PageNumberPagination()
+    page = paginator.paginate_queryset(sessions, request)
+    serializer = serializers.SpeakerSerializer(page, many=True)
+    return paginator.get_paginated_response(serializer.data)
 
 
 @api_view(["POST"])
@@ -337,17 +833,23 @@ def session_settings(request: Request, event_slug: str, slug: str) -> Response:
 def attendee_settings(request: Request, event_slug: str) -> Response:
     """Settings for a attendee to check if they attended the event or not.
 
+    The attendees can be given by username, id or ticket code, they are
+    checked in at once and the unknown ones don't stop the others.
+
     Args:
         request: Request object
         event_slug: The event slug.
 
     Examples:
         {"list_of_username": ["novizi", "novizi2"]}
+        {"ticket_codes": ["q3XkPz0aLm9B"], "attendee_ids": [42]}
 
     Returns:
         Response: Json response.
-        200: if everything is correct.
-        404: if the event or user doesn't exists
+        200: the checked in, not registered and unknown attendees, each
+        keyed like the request by ``list_of_username``, ``attendee_ids``
+        and ``ticket_codes``.
+        404: if the event doesn't exists
         and if user don't have permission.
     """
     event = get_object_or_404(Event, slug=event_slug)
@@ -361,16 +863,69 @@ def attendee_settings(request: Request, event_slug: str) -> Response:
         serializer = serializers.AttendeeSettingSerializer(data=request.data)
 
         if serializer.is_valid(raise_exception=True):
+            usernames = serializer.validated_data["list_of_username"]
+            attendee_ids = serializer.validated_data["attendee_ids"]
+            ticket_codes = serializer.validated_data["ticket_codes"]
+
+            with transaction.atomic():
+                users = dict(
+                    get_user_model()
+                    .objects.filter(username__in=usernames)
+                    .values_list("username", "pk")
+                )
+
+                attendees = list(
+                    event.attendees.filter(
+                        Q(user__in=users.values())
+                        | Q(pk__in=attendee_ids)
+                        | Q(ticket_code__in=ticket_codes)
+                    ).values_list("pk", "user", "ticket_code")
+                )
+
+                event.attendees.filter(pk__in=[pk for pk, _, _ in attendees]).exclude(
+                    has_attended=True
+                ).update(has_attended=True)
+
+            checked_users = {user for _, user, _ in attendees}
+            checked_ids = {pk for pk, _, _ in attendees}
+            checked_codes = {code for _, _, code in attendees}
 
-            for username in serializer.data.get("list_of_username"):
-                user = get_object_or_404(get_user_model(), username=username)
-                attendee = event.attendees.filter(user=user).first()
-
-                if attendee:
-                    attendee.has_attended = True
-                    attendee.save()
-
-            return Response(status=status.HTTP_200_OK)
+            return Response(
+                {
+                    "checked_in": {
+                        "list_of_username": [
+                            name
+                            for name in usernames
+                            if users.get(name) in checked_users
+                        ],
+                        "attendee_ids": [
+                            pk for pk in attendee_ids if pk in checked_ids
+                        ],
+                        "ticket_codes": [
+                            code for code in ticket_codes if code in checked_codes
+                        ],
+                    },
+                    "not_registered": {
+                        "list_of_username": [
+                            name
+                            for name in usernames
+                            if name in users and users[name] not in checked_users
+                        ],
+                    },
+                    "unknown": {
+                        "list_of_username": [
+                            name for name in usernames if name not in users
+                        ],
+                        "attendee_ids": [
+                            pk for pk in attendee_ids if pk not in checked_ids
+                        ],
+                        "ticket_codes": [
+                            code for code in ticket_codes if code not in checked_codes
+                        ],
+                    },
+                },
+                status=status.HTTP_200_OK,
+            )
 
     return Response(status=status.HTTP_404_NOT_FOUND)
 
@@ -389,8 +944,8 @@ def event_organizers_settings(request: Request, event_slug: str) -> Response:
 
     Returns:
         Response: Json response.
-        200: if everything is correct.
-        404: if the event or user doesn't exists
+        200: the usernames that don't exist, the others are added or removed.
+        404: if the event doesn't exists
         and if user don't have permission.
     """
     event = get_object_or_404(Event, slug=event_slug)
@@ -400,16 +955,22 @@ def event_organizers_settings(request: Request, event_slug: str) -> Response:
         serializer = serializers.OrganizersSettingSerializer(data=request.data)
 
         if serializer.is_valid(raise_exception=True):
+            usernames = serializer.validated_data["list_of_username"]
 
-            for username in serializer.data.get("list_of_username"):
-                user = get_object_or_404(get_user_model(), username=username)
+            with transaction.atomic():
+                users = list(get_user_model().objects.filter(username__in=usernames))
 
-                if serializer.data.get("action") == "Add":
-                    event.organizers.add(user)
+                if users and serializer.validated_data["action"] == "Add":
+                    event.organizers.add(*users)
 
-                if serializer.data.get("action") == "Remove":
-                    event.organizers.remove(user)
+                if users and serializer.validated_data["action"] == "Remove":
+                    event.organizers.remove(*users)
 
-            return Response(status=status.HTTP_200_OK)
+            known = {user.username for user in users}
+
+            return Response(
+                {"unknown": [name for name in usernames if name not in known]},
+                status=status.HTTP_200_OK,
+            )
 
     return Response(status=status.HTTP_404_NOT_FOUND)
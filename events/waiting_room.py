@@ -0,0 +1,91 @@
+"""Admission of the waiting rooms of events."""
+from django.db import transaction
+from django.utils import timezone
+
+from .models import TICKET_CODE_SIZE, Attendee, Event, QueueEntry
+from .utils import random_string
+
+
+def admit(*, event_id: int, batch_size: int) -> int:
+    """Admit the next users of the waiting room of an event.
+
+    The event row is locked while the free seats are handed to the oldest
+    waiting entries. Once the event is full or finished the entries still
+    waiting are rejected, as are the entries of users who already attend.
+
+    Args:
+        event_id: The event id.
+        batch_size: Maximum number of users admitted at once.
+
+    Returns:
+        The number of admitted users.
+    """
+    with transaction.atomic():
+        event = (
+            Event.objects.select_for_update()
+            .only("pk", "total_guest", "attendees_count", "event_date")
+            .get(pk=event_id)
+        )
+        waiting = QueueEntry.objects.filter(events=event, status="Waiting")
+
+        free = event.total_guest - event.attendees_count
+        if free <= 0 or event.event_date < timezone.now():
+            waiting.update(status="Rejected", updated_at=timezone.now())
+            return 0
+
+        entries = list(
+            waiting.order_by("pk").values_list("pk", "user")[: min(free, batch_size)]
+        )
+        if not entries:
+            return 0
+
+        attendees = [
+            Attendee(
+                user_id=user,
+                events=event,
+                ticket_code=random_string(size=TICKET_CODE_SIZE),
+            )
+            for _, user in entries
+        ]
+        Attendee.objects.bulk_create(attendees, ignore_conflicts=True)
+        Event.objects.filter(pk=event.pk).refresh_counters()
+
+        # The users who already attend are skipped by the insert, only the
+        # rows carrying one of the new ticket codes were written.
+        inserted = set(
+            Attendee.objects.filter(
+                events=event,
+                ticket_code__in=[attendee.ticket_code for attendee in attendees],
+            ).values_list("user", flat=True)
+        )
+        admitted = [pk for pk, user in entries if user in inserted]
+
+        QueueEntry.objects.filter(pk__in=admitted).update(
+            status="Admitted", updated_at=timezone.now()
+        )
+        QueueEntry.objects.filter(
+            pk__in=[pk for pk, user in entries if user not in inserted]
+        ).update(status="Rejected", updated_at=timezone.now())
+
+    return len(admitted)
+
+
+def admit_all(*, batch_size: int) -> int:
+    """Admit a batch of users in every event that has people waiting.
+
+    Args:
+        batch_size: Maximum number of users admitted at once per event.
+
+    Returns:
+        The number of admitted users.
+    """
+    event_ids = (
+        QueueEntry.objects.filter(status="Waiting")
+        .order_by()
+        .values_list("events", flat=True)
+        .distinct()
+    )
+
+    return sum(
+        admit(event_id=event_id, batch_size=batch_size) for event_id in event_ids
+    )
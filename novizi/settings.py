@@ -249,13 +249,31 @@ DATABASES = {
     "default": config("DATABASE_URL", cast=db_url, default="sqlite:///db.sqlite3")
 }
 
+# CACHES
+# ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/settings/#caches
+# "default" is private to each worker process, "shared" is seen by all of them
+# and keeps the entries that are invalidated on writes. The database cache
+# table is created by ``createcachetable`` in the release phase.
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "shared": {
+        "BACKEND": config(
+            "SHARED_CACHE_BACKEND",
+            cast=str,
+            default="django.core.cache.backends.db.DatabaseCache",
+        ),
+        "LOCATION": config("SHARED_CACHE_LOCATION", cast=str, default="novizi_cache"),
+    },
+}
+
 # Third-Party Settings
 # djangorestframework
 # ------------------------------------------------------------------------------
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework.authentication.SessionAuthentication",
-        "dj_rest_auth.utils.JWTCookieAuthentication",
+        "users.authentication.StatsJWTCookieAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.AllowAny",),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
@@ -364,3 +382,22 @@ else:
     ENVIRONMENT_COLOR = "green"
 
 CUSTOM_RESERVED_NAMES: List[str] = []
+
+# Text search configuration of the PostgreSQL search index, e.g. "arabic".
+# Run rebuild_search_index after changing it.
+SEARCH_CONFIG = config("SEARCH_CONFIG", cast=str, default="english")
+
+# Cache alias that keeps the pre-rendered archive of past events, it has to be
+# shared by the workers for an edited month to be dropped everywhere.
+EVENT_ARCHIVE_CACHE = "shared"
+
+# Cache alias that keeps the tag cloud, shared so a tag change drops it for
+# every worker.
+TAG_CLOUD_CACHE = "shared"
+
+# Cache alias that keeps the version of the tag ids cached by every worker, it
+# has to be shared for a deleted tag to be dropped by all of them.
+TAG_ID_VERSION_CACHE = "shared"
+
+# Cache alias that keeps the event details shared by all the viewers.
+EVENT_DETAIL_CACHE = "default"
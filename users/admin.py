@@ -78,6 +78,8 @@ class CustomUserAdmin(ExportActionModelAdmin, UserAdmin):
         "total_accepted_sessions",
     )
 
+    list_select_related = ("stats",)
+
     list_filter = ("last_login",)
 
     date_hierarchy = "date_joined"
@@ -0,0 +1,46 @@
+"""Collection of authentication classes."""
+from typing import Any
+
+from dj_rest_auth.utils import JWTCookieAuthentication
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from .models import CustomUser
+
+
+class StatsJWTCookieAuthentication(JWTCookieAuthentication):
+    """JWT authentication loading the user with its stats in one query."""
+
+    def get_user(self: "StatsJWTCookieAuthentication", validated_token: Token) -> Any:
+        """Find the user of the token and join its stats.
+
+        Args:
+            validated_token: The validated token.
+
+        Returns:
+            The user.
+
+        Raises:
+            InvalidToken: If the token has no user id.
+            AuthenticationFailed: If the user doesn't exists or is inactive.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = (
+            CustomUser.objects.select_related("stats")
+            .filter(**{api_settings.USER_ID_FIELD: user_id})
+            .first()
+        )
+
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
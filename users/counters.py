@@ -0,0 +1,34 @@
+"""Collection of denormalized counters stored on the user stats model."""
+from typing import Any, Dict, Tuple
+
+# Every counter column on ``UserStats`` mapped to the model it counts, the
+# field of that model pointing to the user and the lookups a row has to
+# match to be counted.
+USER_COUNTERS: Dict[str, Tuple[str, str, Dict[str, Any]]] = {
+    "attended_events_count": ("events.Attendee", "user", {"has_attended": True}),
+    "hosted_events_count": ("events.Event", "hosted_by", {}),
+    "organized_events_count": ("events.Event", "organizers", {}),
+    "accepted_sessions_count": (
+        "events.Session",
+        "proposed_by",
+        {"status": "Accepted"},
+    ),
+}
+
+
+def user_counters(*, label: str) -> Dict[str, Tuple[str, ...]]:
+    """Get the counters a model feeds, by the field pointing to the user.
+
+    Args:
+        label: The model label, e.g. ``events.Attendee``.
+
+    Returns:
+        The counter names mapped by user field.
+    """
+    counters: Dict[str, Tuple[str, ...]] = {}
+
+    for name, (model, field, _) in USER_COUNTERS.items():
+        if model == label:
+            counters[field] = counters.get(field, ()) + (name,)
+
+    return counters
@@ -0,0 +1 @@
+"""Management of the users app."""
@@ -0,0 +1,71 @@
+"""Command to repair drift in the user stats."""
+from functools import reduce
+from operator import or_
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models import F, Q
+
+from users.counters import USER_COUNTERS
+from users.models import UserStats, stats_subquery
+
+
+class Command(BaseCommand):
+    """Create the missing user stats and recompute the drifted ones."""
+
+    help = "Recompute the denormalized event and session counters of users."
+
+    def add_arguments(self: "Command", parser: CommandParser) -> None:
+        """Arguments of the command."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of users checked in a single transaction.",
+        )
+
+    def handle(self: "Command", *args: Any, **options: Any) -> None:
+        """Walk the users by primary key and repair them chunk by chunk."""
+        chunk_size = options["chunk_size"]
+
+        live = {f"live_{name}": stats_subquery(name) for name in USER_COUNTERS}
+        drifted = reduce(
+            or_, (~Q(**{name: F(f"live_{name}")}) for name in USER_COUNTERS)
+        )
+
+        last_pk = 0
+        checked = 0
+        repaired = 0
+
+        while True:
+            pks = list(
+                get_user_model()
+                .objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:chunk_size]
+            )
+            if not pks:
+                break
+
+            with transaction.atomic():
+                # Rows created with zero counters are repaired just below.
+                UserStats.objects.bulk_create(
+                    [UserStats(user_id=pk) for pk in pks], ignore_conflicts=True
+                )
+                stale = list(
+                    UserStats.objects.filter(user__in=pks)
+                    .annotate(**live)
+                    .filter(drifted)
+                    .values_list("user", flat=True)
+                )
+                UserStats.objects.refresh(stale)
+
+            last_pk = pks[-1]
+            checked += len(pks)
+            repaired += len(stale)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Checked {checked} users, repaired {repaired}.")
+        )
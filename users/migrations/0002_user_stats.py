@@ -0,0 +1,64 @@
+# Generated by Django 3.0.14 on 2026-10-17 05:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+USER_COUNTERS = {
+    'attended_events_count': ('events', 'Attendee', 'user', {'has_attended': True}),
+    'hosted_events_count': ('events', 'Event', 'hosted_by', {}),
+    'organized_events_count': ('events', 'Event', 'organizers', {}),
+    'accepted_sessions_count': ('events', 'Session', 'proposed_by', {'status': 'Accepted'}),
+}
+
+
+def fill_user_stats(apps, schema_editor):
+    CustomUser = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    UserStats = apps.get_model('users', 'UserStats')
+
+    stats = [UserStats(user_id=pk) for pk in CustomUser.objects.values_list('pk', flat=True)]
+    batch_size = schema_editor.connection.ops.bulk_batch_size(['user'], stats)
+    UserStats.objects.bulk_create(stats, batch_size=min(1000, max(batch_size, 1)))
+
+    counters = {}
+    for name, (app_label, model_name, field, lookups) in USER_COUNTERS.items():
+        rows = (
+            apps.get_model(app_label, model_name)
+            .objects.filter(**{field: OuterRef('user')}, **lookups)
+            .order_by()
+            .values(field)
+            .annotate(total=Count('pk'))
+            .values('total')
+        )
+        counters[name] = Coalesce(Subquery(rows, output_field=models.IntegerField()), 0)
+
+    UserStats.objects.update(**counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        ('events', '0010_session_status_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='user')),
+                ('attended_events_count', models.PositiveIntegerField(default=0, verbose_name='attended events count')),
+                ('hosted_events_count', models.PositiveIntegerField(default=0, verbose_name='hosted events count')),
+                ('organized_events_count', models.PositiveIntegerField(default=0, verbose_name='organized events count')),
+                ('accepted_sessions_count', models.PositiveIntegerField(default=0, verbose_name='accepted sessions count')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+            ],
+            options={
+                'verbose_name': 'user stats',
+                'verbose_name_plural': 'user stats',
+            },
+        ),
+        migrations.RunPython(fill_user_stats, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,26 @@
 """Collection of model."""
 import uuid
+from typing import Any, Iterable
 
+from django.apps import apps
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from .counters import USER_COUNTERS
+
 
 def user_upload_to(instance: "CustomUser", filename: str) -> str:
     """A help Function to change the image upload path.
@@ -48,23 +64,252 @@ class CustomUser(AbstractUser):
         """It return readable name for the model."""
         return f"{self.username}"
 
+    def get_stats(self: "CustomUser") -> "UserStats":
+        """Getting the stats of the user, empty when they are missing."""
+        try:
+            return self.stats
+        except UserStats.DoesNotExist:
+            return UserStats(user=self)
+
     def total_attended_events(self: "CustomUser") -> int:
         """Getting total of attended events for a user."""
-        return self.attendees.filter(has_attended=True).count()
+        return self.get_stats().attended_events_count
 
     def total_hosted_events(self: "CustomUser") -> int:
         """Getting total of hosted events for a user."""
-        return self.events.all().count()
+        return self.get_stats().hosted_events_count
 
     def total_organized_events(self: "CustomUser") -> int:
         """Getting total of organized events for a user."""
-        return self.events_organizers.all().count()
+        return self.get_stats().organized_events_count
 
     def total_accepted_sessions(self: "CustomUser") -> int:
         """Getting total of accepted sessions for a user."""
-        return self.sessions.filter(status="Accepted").count()
+        return self.get_stats().accepted_sessions_count
 
     total_attended_events.short_description = _("Attended Events")
     total_hosted_events.short_description = _("Hosted Events")
     total_organized_events.short_description = _("Organized Events")
     total_accepted_sessions.short_description = _("Accepted Sessions")
+
+    total_attended_events.admin_order_field = "stats__attended_events_count"
+    total_hosted_events.admin_order_field = "stats__hosted_events_count"
+    total_organized_events.admin_order_field = "stats__organized_events_count"
+    total_accepted_sessions.admin_order_field = "stats__accepted_sessions_count"
+
+
+def stats_subquery(name: str) -> Coalesce:
+    """Build a correlated subquery counting the rows behind a user counter.
+
+    Args:
+        name: The counter column name.
+
+    Returns:
+        An expression that can be used inside annotate or update on
+        ``UserStats``.
+    """
+    label, field, lookups = USER_COUNTERS[name]
+    rows = (
+        apps.get_model(label)
+        ._default_manager.filter(**{field: OuterRef("user")}, **lookups)
+        .order_by()
+        .values(field)
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(rows, output_field=models.IntegerField()), 0)
+
+
+class UserStatsQuerySet(models.QuerySet):
+    """Custom queryset for user stats model."""
+
+    def refresh(self: "UserStatsQuerySet", user_ids: Iterable[Any], *names: str) -> int:
+        """Recompute the counters of users from the related rows.
+
+        Missing stats rows are left to ``reconcile_user_stats``.
+
+        Args:
+            user_ids: The user ids, ``None`` values are ignored.
+            names: Counter names to recompute, all of them by default.
+
+        Returns:
+            The number of updated rows.
+        """
+        user_ids = {pk for pk in user_ids if pk is not None}
+        if not user_ids:
+            return 0
+
+        return self.filter(user__in=user_ids).update(
+            updated_at=timezone.now(),
+            **{name: stats_subquery(name) for name in names or USER_COUNTERS},
+        )
+
+
+class UserStats(models.Model):
+    """Reference user stats model."""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("user"),
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats",
+    )
+
+    attended_events_count = models.PositiveIntegerField(
+        verbose_name=_("attended events count"), default=0
+    )
+
+    hosted_events_count = models.PositiveIntegerField(
+        verbose_name=_("hosted events count"), default=0
+    )
+
+    organized_events_count = models.PositiveIntegerField(
+        verbose_name=_("organized events count"), default=0
+    )
+
+    accepted_sessions_count = models.PositiveIntegerField(
+        verbose_name=_("accepted sessions count"), default=0
+    )
+
+    updated_at = models.DateTimeField(verbose_name=_("updated at"), auto_now=True)
+
+    objects = UserStatsQuerySet.as_manager()
+
+    class Meta:
+        """Meta data."""
+
+        verbose_name = _("user stats")
+
+        verbose_name_plural = _("user stats")
+
+    def __str__(self: "UserStats") -> str:
+        """It return readable name for the model."""
+        return f"{self.user_id}"
+
+
+@receiver(post_save, sender=CustomUser)
+def stats_creator(sender: CustomUser, instance: CustomUser, **kwargs: Any) -> None:
+    """Single for CustomUser."""
+    if kwargs.get("created") and not kwargs.get("raw"):
+        UserStats.objects.get_or_create(user=instance)
+
+
+def stored_user(sender: Any, instance: Any, field: str, **kwargs: Any) -> Any:
+    """Read the user a row points to before it is saved.
+
+    Args:
+        sender: The model of the row.
+        instance: The saved row.
+        field: The field pointing to the user.
+        kwargs: The arguments of the ``pre_save`` signal.
+
+    Returns:
+        The stored user id, None for a new row or when the field is not saved.
+    """
+    update_fields = kwargs.get("update_fields")
+
+    if kwargs.get("raw") or instance.pk is None:
+        return None
+
+    if update_fields is not None and field not in update_fields:
+        return None
+
+    return sender.objects.filter(pk=instance.pk).values_list(field, flat=True).first()
+
+
+@receiver(pre_save, sender="events.Attendee")
+def stats_attendee_snapshot(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for Attendee to remember the stored user."""
+    instance._stats_user = stored_user(sender, instance, "user", **kwargs)
+
+
+@receiver(post_save, sender="events.Attendee")
+@receiver(post_delete, sender="events.Attendee")
+def stats_attendee_updater(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for Attendee to refresh the attended events of the users."""
+    user = getattr(instance, "_stats_user", None)
+    instance._stats_user = None
+
+    if kwargs.get("raw") or (kwargs.get("created") and not instance.has_attended):
+        return
+
+    UserStats.objects.refresh(
+        {instance.user_id, user} - {None}, "attended_events_count"
+    )
+
+
+@receiver(pre_save, sender="events.Session")
+def stats_session_snapshot(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for Session to remember the stored proposer."""
+    instance._stats_user = stored_user(sender, instance, "proposed_by", **kwargs)
+
+
+@receiver(post_save, sender="events.Session")
+@receiver(post_delete, sender="events.Session")
+def stats_session_updater(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for Session to refresh the accepted sessions of the proposers."""
+    user = getattr(instance, "_stats_user", None)
+    instance._stats_user = None
+
+    if not kwargs.get("raw"):
+        UserStats.objects.refresh(
+            {instance.proposed_by_id, user} - {None}, "accepted_sessions_count"
+        )
+
+
+@receiver(pre_save, sender="events.Event")
+def stats_host_snapshot(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for Event to remember the stored host."""
+    instance._stats_host = stored_user(sender, instance, "hosted_by", **kwargs)
+
+
+@receiver(post_save, sender="events.Event")
+def stats_event_updater(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for Event to count the event for its new and old host."""
+    host = getattr(instance, "_stats_host", None)
+    instance._stats_host = None
+
+    if kwargs.get("raw"):
+        return
+
+    if kwargs.get("created") or host not in (None, instance.hosted_by_id):
+        UserStats.objects.refresh(
+            {instance.hosted_by_id, host} - {None}, "hosted_events_count"
+        )
+
+
+@receiver(pre_delete, sender="events.Event")
+def stats_event_snapshot(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for Event to remember the organizers before they are deleted."""
+    instance._stats_organizers = list(instance.organizers.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender="events.Event")
+def stats_event_remover(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Single for Event to refresh the host and the organizers."""
+    UserStats.objects.refresh([instance.hosted_by_id], "hosted_events_count")
+    UserStats.objects.refresh(
+        getattr(instance, "_stats_organizers", []), "organized_events_count"
+    )
+
+
+@receiver(m2m_changed, sender="events.Event_organizers")
+def stats_organizers_updater(
+    sender: Any, instance: Any, action: str, reverse: bool, **kwargs: Any
+) -> None:
+    """Single for Event organizers to refresh the organized events."""
+    if reverse:
+        user_ids = [instance.pk]
+    elif action == "pre_clear":
+        instance._stats_organizers = list(
+            instance.organizers.values_list("pk", flat=True)
+        )
+        return
+    elif action == "post_clear":
+        user_ids = getattr(instance, "_stats_organizers", [])
+    else:
+        user_ids = kwargs.get("pk_set") or []
+
+    if action.startswith("post_"):
+        UserStats.objects.refresh(user_ids, "organized_events_count")
@@ -0,0 +1,90 @@
+"""Tests of the user stats kept by the signals."""
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from events.models import Attendee, Event, Session
+
+from ..models import CustomUser, UserStats
+
+
+class UserStatsTest(TestCase):
+    """Counters of the users following the rows they count."""
+
+    def setUp(self: "UserStatsTest") -> None:
+        """Create an event and the users it is moved between."""
+        self.host, self.first, self.second = (
+            CustomUser.objects.create(username=name, email=f"{name}@example.com")
+            for name in ("host", "first", "second")
+        )
+        self.event = Event.objects.create(
+            title="Meetup",
+            description="A meetup.",
+            total_guest=10,
+            hosted_by=self.host,
+            event_date=timezone.now() + timedelta(days=7),
+            geom={"type": "Point", "coordinates": [38.75, 9.01]},
+        )
+
+    def stats(self: "UserStatsTest", user: CustomUser, name: str) -> int:
+        """Read a counter of a user.
+
+        Args:
+            user: The user.
+            name: The counter name.
+
+        Returns:
+            The stored value.
+        """
+        return UserStats.objects.values_list(name, flat=True).get(user=user)
+
+    def test_event_moved_to_another_host(self: "UserStatsTest") -> None:
+        """The event is counted for its new host only."""
+        self.assertEqual(self.stats(self.host, "hosted_events_count"), 1)
+
+        self.event.hosted_by = self.first
+        self.event.save()
+
+        self.assertEqual(self.stats(self.host, "hosted_events_count"), 0)
+        self.assertEqual(self.stats(self.first, "hosted_events_count"), 1)
+
+    def test_session_moved_to_another_proposer(self: "UserStatsTest") -> None:
+        """The accepted session is counted for its new proposer only."""
+        session = Session.objects.create(
+            title="Talk",
+            description="A talk.",
+            session_type="Talk",
+            status="Accepted",
+            events=self.event,
+            proposed_by=self.first,
+        )
+        self.assertEqual(self.stats(self.first, "accepted_sessions_count"), 1)
+
+        session.proposed_by = self.second
+        session.save()
+
+        self.assertEqual(self.stats(self.first, "accepted_sessions_count"), 0)
+        self.assertEqual(self.stats(self.second, "accepted_sessions_count"), 1)
+
+    def test_attendee_moved_to_another_user(self: "UserStatsTest") -> None:
+        """The attended event is counted for its new user only."""
+        attendee = Attendee.objects.create(
+            user=self.first, events=self.event, has_attended=True
+        )
+        self.assertEqual(self.stats(self.first, "attended_events_count"), 1)
+
+        attendee.user = self.second
+        attendee.save()
+
+        self.assertEqual(self.stats(self.first, "attended_events_count"), 0)
+        self.assertEqual(self.stats(self.second, "attended_events_count"), 1)
+
+    def test_attendee_deleted(self: "UserStatsTest") -> None:
+        """A deleted attendee is no longer counted."""
+        attendee = Attendee.objects.create(
+            user=self.first, events=self.event, has_attended=True
+        )
+
+        attendee.delete()
+
+        self.assertEqual(self.stats(self.first, "attended_events_count"), 0)